@@ -1,7 +1,8 @@
 from users.models import *
 from backend.models import *
-from django.db.models import Q
+from django.db.models import Q, Prefetch
 from rest_framework import serializers
+from backend.renditions import rendition_urls, placeholder
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -90,10 +91,29 @@ class AmenitySerializer(serializers.ModelSerializer):
 class PropertyImageSerializer(serializers.ModelSerializer):
     """
     Serializer for Property Image data.
+    `renditions` maps each responsive width ("360w", ...) to its WebP and
+    JPEG URLs, or is null while the image has none yet. `placeholder` is a
+    tiny blurred JPEG data: URI to show until the image loads.
     """
+    renditions = serializers.SerializerMethodField()
+    placeholder = serializers.SerializerMethodField()
+
     class Meta:
         model = PropertyImage
-        fields = ['id', 'image', 'created_at']
+        fields = ['id', 'image', 'renditions', 'placeholder', 'created_at']
+
+    def get_placeholder(self, obj):
+        return placeholder(obj.image)
+
+    def get_renditions(self, obj):
+        urls = rendition_urls(obj.image)
+        request = self.context.get('request')
+        if urls is None or request is None:
+            return urls
+        return {
+            width: {key: request.build_absolute_uri(url) for key, url in formats.items()}
+            for width, formats in urls.items()
+        }
 
 
 class PropertyReviewSerializer(serializers.ModelSerializer):
@@ -129,6 +149,7 @@ class CategorySerializer(serializers.ModelSerializer):
 class PropertySerializer(serializers.ModelSerializer):
     """
     Serializer for detailed property information.
+    `image_placeholder` is the blurred data: URI of the main image.
     """
     city = serializers.CharField(source='get_city_display')
     type = serializers.CharField(source='get_type_display')
@@ -138,51 +159,45 @@ class PropertySerializer(serializers.ModelSerializer):
     images = PropertyImageSerializer(many=True)
     reviews = PropertyReviewSerializer(source='propertyreview', many=True)  # Corrected to use the reverse relation
     review_data = serializers.SerializerMethodField()
+    image_placeholder = serializers.SerializerMethodField()
 
     class Meta:
         model = Property
         fields = [
             'id', 'name', 'slug', 'description', 
             'price_usd', 'price_rwf', 'city', 'type', 'category',
-            'bathroom', 'capacity', 'size', 'image', 'address',
+            'bathroom', 'capacity', 'size', 'image', 'image_placeholder', 'address',
+            'latitude', 'longitude',
             'created_by', 'created_at', 'updated_at', 
             'amenities', 'images', 'reviews', 'review_data'
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load everything this serializer touches up front: the FK rows and
+        the rating summary are joined and the nested collections are
+        prefetched, so the query count does not grow with the number of
+        properties.
+        """
+        return queryset.select_related('category', 'created_by').prefetch_related(
+            Prefetch('amenities', queryset=Amenity.objects.all()),
+            Prefetch('images', queryset=PropertyImage.objects.all()),
+            Prefetch('propertyreview', queryset=PropertyReview.objects.all()),
+        ).with_rating_summary()
+
+    def get_image_placeholder(self, obj):
+        return placeholder(obj.image)
+
     def get_review_data(self, obj):
         """
         Only returns review data if there are reviews.
         Otherwise, returns None.
         """
-        reviews = obj.propertyreview.filter(status=True)  # Filter for active reviews
-        if reviews.exists():
-            avg_ratings = reviews.aggregate(
-                avg_location=Avg('location'),
-                avg_staff=Avg('staff'),
-                avg_cleanliness=Avg('cleanliness'),
-                avg_value_for_money=Avg('value_for_money'),
-                avg_comfort=Avg('comfort'),
-                avg_facilities=Avg('facilities'),
-                avg_free_wifi=Avg('free_wifi')
-            )
-
-            # Calculate overall rating if there are reviews
-            overall_rating = (
-                avg_ratings['avg_location'] +
-                avg_ratings['avg_staff'] +
-                avg_ratings['avg_cleanliness'] +
-                avg_ratings['avg_value_for_money'] +
-                avg_ratings['avg_comfort'] +
-                avg_ratings['avg_facilities'] +
-                avg_ratings['avg_free_wifi']
-            ) / 7 if all(value is not None for value in avg_ratings.values()) else 0
-
-            return {
-                'total_reviews': reviews.count(),
-                'overall_rating': round(overall_rating, 2) if overall_rating else 0
-            }
-        else:
+        summary = obj.get_rating_summary()
+        if not summary.review_count:
             return None
+        return summary.as_review_data()
 
 class CategoryNestedSerializer(serializers.ModelSerializer):
     """
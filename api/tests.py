@@ -1,3 +1,114 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.serializers import *
+from backend.models import *
 
-# Create your tests here.
+class PropertySerializerQueryTests(TestCase):
+    """
+    The property list and detail endpoints must run a fixed number of
+    queries regardless of how many properties, images or reviews exist:
+    one for the cache versions (which the list ETag is built from), one
+    for the detail ETag/Last-Modified validators and four to serialize.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = User.objects.create_user(
+            email='provider@example.com', name='Provider', phone_number='0780000000',
+            password='secret', role='House Provider',
+        )
+        cls.category = Category.objects.create(name='Apartment')
+        cls.amenities = [Amenity.objects.create(name=f'Amenity {i}') for i in range(3)]
+
+    def create_properties(self, count):
+        for i in range(count):
+            prop = Property.objects.create(
+                name=f'Property {Property.objects.count()}', description='Listing',
+                category=self.category, created_by=self.provider, city='Kacyiru', type='Rent',
+            )
+            prop.amenities.set(self.amenities)
+            PropertyImage.objects.create(property=prop)
+            PropertyImage.objects.create(property=prop)
+            PropertyReview.objects.create(property=prop, name='A', location=4, staff=3)
+            PropertyReview.objects.create(property=prop, name='B', comfort=2)
+            PropertyReview.objects.create(property=prop, name='C', status=False)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_list_query_count_is_constant(self):
+        self.create_properties(2)
+        small = self.count_queries('/api/properties/?limit=100')
+        self.create_properties(10)
+        large = self.count_queries('/api/properties/?limit=100')
+        self.assertEqual(small, large)
+        self.assertEqual(large, 5)
+
+    def test_detail_query_count(self):
+        self.create_properties(1)
+        prop = Property.objects.get()
+        self.assertEqual(self.count_queries(f'/api/property/{prop.id}/'), 6)
+
+    def test_list_etag_is_read_from_cache_versions(self):
+        self.create_properties(2)
+        etag = self.client.get('/api/properties/?city=Kacyiru')['ETag']
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/properties/?city=Kacyiru', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        Property.objects.filter(name='Property 0').get().save()
+        response = self.client.get('/api/properties/?city=Kacyiru', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_optimized_output_matches_plain_serializer(self):
+        self.create_properties(3)
+        Property.objects.create(name='No reviews', description='Listing')
+        plain = PropertySerializer(Property.objects.order_by('id'), many=True).data
+        optimized = PropertySerializer(
+            PropertySerializer.setup_eager_loading(Property.objects.order_by('id')), many=True
+        ).data
+        self.assertEqual(plain, optimized)
+
+class KeysetPaginationTests(TestCase):
+    """
+    The property list pages by (created_at, id) cursors: walking `next`
+    and then `previous` visits every row once in order, ties on created_at
+    included.
+    """
+
+    def setUp(self):
+        for i in range(7):
+            Property.objects.create(name=f'Property {i}', description='Listing')
+        # Three rows share a created_at, so only the id tells them apart
+        Property.objects.filter(name__in=['Property 2', 'Property 3', 'Property 4']).update(
+            created_at=Property.objects.get(name='Property 3').created_at
+        )
+        self.expected = list(Property.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def walk(self, url, link):
+        """The ids of each page reached by following `link` from `url`, and the last response."""
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append([row['id'] for row in response.data['results']])
+            url = response.data[link]
+        return pages, response
+
+    def test_next_and_previous_visit_every_row_in_order(self):
+        pages, last = self.walk('/api/properties/?limit=2', 'next')
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+        self.assertEqual([pk for page in pages for pk in page], self.expected)
+
+        backwards, first = self.walk(last.data['previous'], 'previous')
+        self.assertEqual([pk for page in reversed(backwards) for pk in page], self.expected[:6])
+        self.assertIsNotNone(first.data['next'])
+
+    def test_invalid_cursor_is_not_found(self):
+        self.assertEqual(self.client.get('/api/properties/?cursor=bogus').status_code, 404)
@@ -12,6 +12,7 @@ urlpatterns = [
     path('verify_token/', VerifyTokenView.as_view(), name='verify_token'),
 
     path('dashboard/', DashboardAPIView.as_view(), name='dashboard'),
+    path('analytics/timeseries/', AnalyticsTimeseriesView.as_view(), name='analyticsTimeseries'),
 
     path('amenities/', GetAmenitiesView.as_view(), name='getAmenities'),
     path('amenity/<int:id>/', ShowAmenityView.as_view(), name='showAmenity'),
@@ -20,7 +21,10 @@ urlpatterns = [
     path('category/<int:id>/', ShowCategoryView.as_view(), name='showCategory'),
 
     path('properties/', GetPropertiesView.as_view(), name='getProperties'),
+    path('properties/facets/', PropertyFacetsView.as_view(), name='getPropertyFacets'),
+    path('properties/clusters/', PropertyClustersView.as_view(), name='getPropertyClusters'),
     path('property/<int:id>/', ShowPropertyView.as_view(), name='showProperty'),
+    path('property/<int:id>/similar/', SimilarPropertiesView.as_view(), name='similarProperties'),
 
     path('notifications/',  NotificationsAPIView.as_view(), name='notifications'),
 
@@ -29,4 +33,4 @@ urlpatterns = [
 
     path('contracts/', ContractsAPIView.as_view(), name='getContracts'),
     path('contract/<int:contract_id>/accept/', AcceptContractAPIView.as_view(), name='acceptContract'),
-]  + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)+ static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+]  + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
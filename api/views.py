@@ -1,6 +1,20 @@
 from users.models import *
 from backend.models import *
 from api.serializers import *
+from api.pagination import KeysetPagination
+from backend.search import search_terms
+from backend.facets import compute_facets
+from backend.metrics import tenant_metrics
+from backend.analytics import parse_timeseries_params, timeseries
+from dataclasses import asdict
+from backend.filters import filter_properties
+from backend.geo import geo_params_error, parse_geo_params
+from backend.clusters import clusters_in_viewport
+from backend.similarity import similar_properties
+from backend.cache import LISTING_MODELS, cache_api_response
+from backend.conditional import conditional_listing, conditional_properties
+from django.utils.decorators import method_decorator
+from django.conf import settings
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -143,37 +157,44 @@ class DashboardAPIView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        # Application metrics
-        total_apps       = RentApplication.objects.filter(user=user).count()
-        pending_apps     = RentApplication.objects.filter(user=user, status='Pending').count()
-        accepted_apps    = RentApplication.objects.filter(user=user, status='Accepted').count()
-        rejected_apps    = RentApplication.objects.filter(user=user, status='Rejected').count()
-        moved_out_apps   = RentApplication.objects.filter(user=user, status='Moved Out').count()
-
-        # Contract metrics
-        total_contracts  = Contract.objects.filter(tenant=user).count()
-        active_contracts = Contract.objects.filter(tenant=user, status='Active').count()
-        overdue_contracts= Contract.objects.filter(tenant=user, payment_status='Overdue').count()
-
+        metrics = tenant_metrics(user)
         data = {
-            'total_applications': total_apps,
-            'pending_applications': pending_apps,
-            'accepted_applications': accepted_apps,
-            'rejected_applications': rejected_apps,
-            'moved_out_applications': moved_out_apps,
-            'total_contracts': total_contracts,
-            'active_contracts': active_contracts,
-            'overdue_contracts': overdue_contracts,
-            'status_labels': ['Pending', 'Accepted', 'Rejected', 'Moved Out'],
-            'status_data': [pending_apps, accepted_apps, rejected_apps, moved_out_apps],
+            **asdict(metrics),
+            'status_labels': metrics.status_labels,
+            'status_data': metrics.status_data,
         }
 
         return Response(data, status=status.HTTP_200_OK)
 
+class AnalyticsTimeseriesView(APIView):
+    """
+    Retrieve daily rollups as a Chart.js-ready time series (admins only):
+      - metric: applications, contracts, signed_contracts or listings
+      - start/end (YYYY-MM-DD, the 30 days through yesterday by default)
+      - granularity: day, week or month
+      - group_by: city, category or status; city/category to filter
+    Counts cover the days the nightly rollup_analytics job has processed.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        if not request.user.is_admin:
+            return Response(
+                {'detail': 'You are not authorized to view this resource.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        try:
+            params = parse_timeseries_params(request.query_params)
+        except ValueError as error:
+            return Response({'detail': str(error)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(timeseries(**params), status=status.HTTP_200_OK)
+
 class GetAmenitiesView(APIView):
     """
     Retrieve a list of all amenities with their properties.
     """
+    @cache_api_response(*LISTING_MODELS)
     def get(self, request, *args, **kwargs):
         amenities = Amenity.objects.all().order_by('-id')
 
@@ -186,6 +207,7 @@ class ShowAmenityView(APIView):
     """
     Retrieve a single amenity by ID along with all properties that have this amenity.
     """
+    @cache_api_response(*LISTING_MODELS)
     def get(self, request, id, *args, **kwargs):
         try:
             amenity = Amenity.objects.get(id=id)
@@ -201,6 +223,7 @@ class GetCategoriesView(APIView):
     """
     Retrieve a list of all categories with their properties.
     """
+    @cache_api_response(*LISTING_MODELS)
     def get(self, request, *args, **kwargs):
         categories = Category.objects.all().order_by('-id')
 
@@ -213,6 +236,7 @@ class ShowCategoryView(APIView):
     """
     Retrieve a single category by ID along with all properties in that category.
     """
+    @cache_api_response(*LISTING_MODELS)
     def get(self, request, id, *args, **kwargs):
         try:
             category = Category.objects.get(id=id)  # Fetch category by ID
@@ -226,25 +250,94 @@ class ShowCategoryView(APIView):
 
 class GetPropertiesView(APIView):
     """
-    Retrieve a list of all properties. This is not protected.
+    Retrieve a page of properties, newest first. This is not protected.
+    Pass the opaque `next`/`previous` cursor back as `?cursor=` and
+    `?limit=` to change the page size (capped by API_MAX_PAGE_SIZE).
+    Accepts the same filters as the property list pages; `?q=` runs a
+    full-text search and orders by relevance instead; `?lat=&lng=` with
+    `?radius=` (km) or `?bbox=south,west,north,east` restricts by location
+    and orders by distance.
     """
+    pagination_class = KeysetPagination
+
+    @method_decorator(conditional_listing(*LISTING_MODELS))
+    @cache_api_response(*LISTING_MODELS)
     def get(self, request, *args, **kwargs):
-        properties = Property.objects.all().order_by('-id')
+        error = geo_params_error(request.query_params)
+        if error:
+            return Response({"detail": error}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Optional: You can add filtering here based on query params, like city, price, etc.
+        properties = PropertySerializer.setup_eager_loading(Property.objects.all())
+        paginator = self.pagination_class()
 
-        # If a serializer exists for Property
-        serializer = PropertySerializer(properties, many=True, context={'request': request})
+        properties = filter_properties(properties, request.query_params)
+        if search_terms(request.query_params.get('q')):
+            paginator.ordering = ('-search_rank', '-id')
+        elif parse_geo_params(request.query_params):
+            paginator.ordering = ('distance_km', 'id')
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        page = paginator.paginate_queryset(properties, request, view=self)
+        serializer = PropertySerializer(page, many=True, context={'request': request})
+
+        return paginator.get_paginated_response(serializer.data)
+
+class PropertyFacetsView(APIView):
+    """
+    Retrieve facet counts (city, type, category, amenity, price bucket)
+    for the properties matching the given filters, each facet counted
+    without its own filter. This is not protected.
+    """
+    def get(self, request, *args, **kwargs):
+        return Response(compute_facets(request.query_params), status=status.HTTP_200_OK)
+
+class PropertyClustersView(APIView):
+    """
+    Retrieve map clusters for a viewport: `?bbox=south,west,north,east`
+    and `?zoom=` (0-22). Each cluster has its count, centroid and RWF price
+    range, read from the precomputed per-zoom aggregates. This is not
+    protected.
+    """
+    @cache_api_response('property')
+    def get(self, request, *args, **kwargs):
+        geo = parse_geo_params(request.query_params) or {}
+        if 'bbox' not in geo:
+            return Response(
+                {"detail": geo_params_error(request.query_params) or "A valid bbox=south,west,north,east is required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            zoom = min(max(int(request.query_params.get('zoom', '')), 0), 22)
+        except ValueError:
+            return Response({"detail": "A numeric zoom is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        precision, clusters = clusters_in_viewport(*geo['bbox'], zoom)
+
+        return Response({
+            "zoom": zoom,
+            "precision": precision,
+            "clusters": [
+                {
+                    "geohash": cluster.geohash,
+                    "count": cluster.count,
+                    "latitude": cluster.latitude,
+                    "longitude": cluster.longitude,
+                    "min_price_rwf": cluster.min_price_rwf,
+                    "max_price_rwf": cluster.max_price_rwf,
+                }
+                for cluster in clusters
+            ],
+        }, status=status.HTTP_200_OK)
 
 class ShowPropertyView(APIView):
     """
     Retrieve a single property by ID. This is not protected.
+    Supports If-None-Match/If-Modified-Since.
     """
+    @method_decorator(conditional_properties(lambda request, id: Property.objects.filter(id=id)))
+    @cache_api_response(*LISTING_MODELS)
     def get(self, request, id, *args, **kwargs):
         try:
-            property = Property.objects.get(id=id)
+            property = PropertySerializer.setup_eager_loading(Property.objects.all()).get(id=id)
         except Property.DoesNotExist:
             return Response({"detail": "Property not found."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -253,6 +346,32 @@ class ShowPropertyView(APIView):
 
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+class SimilarPropertiesView(APIView):
+    """
+    Retrieve the properties most similar to the given one, best first,
+    each with its cosine `similarity` score. `?limit=` sets how many
+    (default 4, at most API_MAX_PAGE_SIZE). This is not protected.
+    """
+    @cache_api_response(*LISTING_MODELS)
+    def get(self, request, id, *args, **kwargs):
+        try:
+            property = Property.objects.get(id=id)
+        except Property.DoesNotExist:
+            return Response({"detail": "Property not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            limit = min(max(int(request.query_params.get('limit', 4)), 1), getattr(settings, 'API_MAX_PAGE_SIZE', 100))
+        except ValueError:
+            limit = 4
+
+        queryset = PropertySerializer.setup_eager_loading(Property.objects.all())
+        similar = similar_properties(property, limit, queryset=queryset)
+        results = PropertySerializer(similar, many=True, context={'request': request}).data
+        for data, match in zip(results, similar):
+            data['similarity'] = getattr(match, 'similarity', None)
+
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
 class NotificationsAPIView(APIView):
     """
     Retrieve the latest notifications for the logged-in user.
@@ -271,8 +390,8 @@ class NotificationsAPIView(APIView):
 
         if user.role == 'User' or user.is_superuser:
             # Regular user notifications
-            new_properties = Property.objects.order_by('-created_at')[:10]
-            user_apps = RentApplication.objects.filter(user=user).order_by('-created_at')[:10]
+            new_properties = PropertySerializer.setup_eager_loading(Property.objects.order_by('-created_at'))[:10]
+            user_apps = RentApplication.objects.filter(user=user).select_related('property').order_by('-created_at')[:10]
             user_contracts = Contract.objects.filter(tenant=user).order_by('-created_at')[:10]
 
             return Response({
@@ -0,0 +1,150 @@
+import threading
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from backend.models import *
+from backend.cache import cache_version, bump_cache_version, lock_cache_version
+
+class AmenityBitmapIndex:
+    """
+    In-process bitset index of amenity id -> property ids, using Python ints
+    as bitmaps (bit N set means property N has the amenity).
+
+    "Has all of" is a bitwise AND over the amenity bitmaps and "has any of"
+    a bitwise OR, so neither needs the M2M join. The m2m_changed and delete
+    signals patch the local bitmaps in place and bump the `amenity_index`
+    version, a CacheVersion row, so that every other process sees the new
+    version on its next read and reloads. A freshly built index is also
+    stored in the cache under its version; processes sharing that cache
+    load it instead of scanning the M2M table.
+    """
+    cache_key = 'amenity_index:bitmaps'
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._bitmaps = None
+        self._version = None
+
+    def build(self):
+        bitmaps = {amenity_id: 0 for amenity_id in Amenity.objects.values_list('id', flat=True)}
+        memberships = Property.amenities.through.objects.values_list('amenity_id', 'property_id')
+        for amenity_id, property_id in memberships.iterator(chunk_size=10000):
+            bitmaps[amenity_id] = bitmaps.get(amenity_id, 0) | (1 << property_id)
+        return bitmaps
+
+    def bitmaps(self):
+        with self._lock:
+            version = cache_version('amenity_index')
+            if self._bitmaps is None or self._version != version:
+                persisted = cache.get(self.cache_key)
+                if persisted and persisted[0] == version:
+                    self._bitmaps = persisted[1]
+                else:
+                    self._bitmaps = self.build()
+                    cache.set(self.cache_key, (version, self._bitmaps), None)
+                self._version = version
+            return self._bitmaps
+
+    def _patched(self, update):
+        # Apply `update` locally and publish a new version so that other
+        # processes reload. The version row stays locked from the read to
+        # the bump, so no other process can publish in between and leave
+        # our copy without its change.
+        with self._lock, transaction.atomic():
+            lock_cache_version('amenity_index')
+            bitmaps = self.bitmaps()
+            update(bitmaps)
+            cache.delete(self.cache_key)
+            self._version = bump_cache_version('amenity_index')
+
+    def add(self, property_ids, amenity_ids):
+        def update(bitmaps):
+            mask = self.to_bitmap(property_ids)
+            for amenity_id in amenity_ids:
+                bitmaps[amenity_id] = bitmaps.get(amenity_id, 0) | mask
+        self._patched(update)
+
+    def remove(self, property_ids, amenity_ids=None):
+        def update(bitmaps):
+            mask = self.to_bitmap(property_ids)
+            for amenity_id in (bitmaps.keys() if amenity_ids is None else amenity_ids):
+                if amenity_id in bitmaps:
+                    bitmaps[amenity_id] &= ~mask
+        self._patched(update)
+
+    def drop_amenity(self, amenity_id):
+        self._patched(lambda bitmaps: bitmaps.pop(amenity_id, None))
+
+    def clear_amenity(self, amenity_id):
+        def update(bitmaps):
+            bitmaps[amenity_id] = 0
+        self._patched(update)
+
+    def invalidate(self):
+        with self._lock:
+            self._bitmaps = None
+            cache.delete(self.cache_key)
+            bump_cache_version('amenity_index')
+
+    def match_all(self, amenity_ids):
+        bitmaps = self.bitmaps()
+        result = None
+        for amenity_id in set(amenity_ids):
+            bitmap = bitmaps.get(amenity_id, 0)
+            result = bitmap if result is None else result & bitmap
+            if not result:
+                return 0
+        return result or 0
+
+    def match_any(self, amenity_ids):
+        bitmaps = self.bitmaps()
+        result = 0
+        for amenity_id in set(amenity_ids):
+            result |= bitmaps.get(amenity_id, 0)
+        return result
+
+    @staticmethod
+    def to_bitmap(property_ids):
+        bitmap = 0
+        for property_id in property_ids:
+            bitmap |= 1 << property_id
+        return bitmap
+
+    @staticmethod
+    def to_ids(bitmap):
+        bits = bin(bitmap)[:1:-1]
+        return [index for index, bit in enumerate(bits) if bit == '1']
+
+
+amenity_index = AmenityBitmapIndex()
+
+def filter_by_amenities(queryset, amenity_ids, match='all'):
+    """
+    Restrict a Property queryset to properties having all (or, with
+    match='any', at least one) of `amenity_ids`.
+
+    Matches are resolved from the bitmap index; when they are too many to
+    pass as an IN list (AMENITY_INDEX_MAX_IDS) the equivalent grouped
+    subquery is used instead.
+    """
+    amenity_ids = set(amenity_ids)
+    if not amenity_ids:
+        return queryset
+
+    if match == 'any':
+        bitmap = amenity_index.match_any(amenity_ids)
+    else:
+        bitmap = amenity_index.match_all(amenity_ids)
+
+    if bitmap.bit_count() <= getattr(settings, 'AMENITY_INDEX_MAX_IDS', 5000):
+        return queryset.filter(id__in=amenity_index.to_ids(bitmap))
+
+    memberships = Property.amenities.through.objects.filter(amenity_id__in=amenity_ids)
+    if match != 'any':
+        memberships = (
+            memberships.values('property_id')
+            .annotate(matched=Count('amenity_id'))
+            .filter(matched=len(amenity_ids))
+        )
+    return queryset.filter(id__in=memberships.values('property_id'))
@@ -0,0 +1,302 @@
+import datetime
+from itertools import islice
+from django.db import models, transaction
+from django.db.models import Count, F, Min, Q, Sum
+from django.db.models.functions import TruncDate
+from django.conf import settings
+from django.utils import timezone
+from backend.models import *
+
+# DailyRollup metric: (model, the field dating a row, then the lookups of
+# its status, city, category and rent; None where the metric has none)
+ROLLUP_METRICS = {
+    'applications': (RentApplication, 'created_at', 'status', 'property__city', 'property__category_id', 'property__price_rwf'),
+    'contracts': (Contract, 'created_at', None, 'property__city', 'property__category_id', 'rent_amount'),
+    'signed_contracts': (Contract, 'signed_date', None, 'property__city', 'property__category_id', 'rent_amount'),
+    'listings': (Property, 'created_at', None, 'city', 'category_id', 'price_rwf'),
+}
+
+GRANULARITIES = ('day', 'week', 'month')
+GROUPINGS = {'city': 'city', 'category': 'category_id', 'status': 'status'}
+# Longest series the API returns, in periods
+MAX_PERIODS = 1000
+
+def start_of_day(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+def days_between(metric, start, end):
+    """A filter for the rows of `metric` dated from `start` to `end` (dates, inclusive), using the date field's index."""
+    model, date_field, *lookups = ROLLUP_METRICS[metric]
+    if isinstance(model._meta.get_field(date_field), models.DateTimeField):
+        return Q(**{
+            f'{date_field}__gte': start_of_day(start),
+            f'{date_field}__lt': start_of_day(end + datetime.timedelta(days=1)),
+        })
+    return Q(**{f'{date_field}__range': (start, end)})
+
+def rows_between(metric, ranges):
+    """The rows of `metric` dated within any of the (start, end) `ranges`."""
+    model = ROLLUP_METRICS[metric][0]
+    condition = Q()
+    for start, end in ranges:
+        condition |= days_between(metric, start, end)
+    return model._default_manager.filter(condition)
+
+def day_ranges(days):
+    """Sorted (start, end) runs of consecutive days covering `days`."""
+    ranges = []
+    for day in sorted(set(days)):
+        if ranges and ranges[-1][1] + datetime.timedelta(days=1) == day:
+            ranges[-1][1] = day
+        else:
+            ranges.append([day, day])
+    return [tuple(run) for run in ranges]
+
+def rollup_day(value):
+    """The local day a date or datetime column value falls on."""
+    return timezone.localtime(value).date() if isinstance(value, datetime.datetime) else value
+
+def changed_days(metric, modified_after, before):
+    """
+    The days before `before` holding rows of `metric` saved at or after
+    `modified_after`: rows created with an old date, re-dated (a contract
+    signed retroactively) or moved to another status since the last run.
+    """
+    model, date_field, *lookups = ROLLUP_METRICS[metric]
+    rows = model._default_manager.filter(**{'updated_at__gte': modified_after, f'{date_field}__isnull': False})
+    field = model._meta.get_field(date_field)
+    if isinstance(field, models.DateTimeField):
+        rows = rows.filter(**{f'{date_field}__lt': start_of_day(before)})
+        return {rollup_day(value) for value in rows.values_list(date_field, flat=True).distinct()}
+    return set(rows.filter(**{f'{date_field}__lt': before}).values_list(date_field, flat=True).distinct())
+
+def rollup_date_fields(model):
+    """(metric, date field) for each DailyRollup metric counting rows of `model`."""
+    return [(metric, spec[1]) for metric, spec in ROLLUP_METRICS.items() if spec[0] is model]
+
+def mark_rollup_days(metric, days):
+    """Record `days` of `metric` as dirty (see RollupDirtyDay)."""
+    days = {rollup_day(day) for day in days if day}
+    if days:
+        RollupDirtyDay.objects.bulk_create([RollupDirtyDay(metric=metric, day=day) for day in days], ignore_conflicts=True)
+
+def mark_property_rollup_days(property_id):
+    """
+    Mark the days of a property's applications and contracts, which are
+    rolled up under its city and category, after those changed.
+    """
+    for metric, (model, date_field, *lookups) in ROLLUP_METRICS.items():
+        if lookups[1].startswith('property__'):
+            rows = model._default_manager.filter(property_id=property_id, **{f'{date_field}__isnull': False})
+            mark_rollup_days(metric, rows.values_list(date_field, flat=True).distinct())
+
+def first_day(metric):
+    model, date_field, *lookups = ROLLUP_METRICS[metric]
+    first = model._default_manager.aggregate(first=Min(date_field))['first']
+    if isinstance(first, datetime.datetime):
+        first = timezone.localtime(first).date()
+    return first
+
+def daily_rollups(metric, ranges):
+    """DailyRollup rows (unsaved) for `metric` on the days of the (start, end) `ranges`, from one grouped query."""
+    model, date_field, status, city, category, rent = ROLLUP_METRICS[metric]
+    day = TruncDate(date_field) if isinstance(model._meta.get_field(date_field), models.DateTimeField) else F(date_field)
+    keys = {'rollup_day': day, 'rollup_city': F(city), 'rollup_category': F(category)}
+    if status:
+        keys['rollup_status'] = F(status)
+    rows = rows_between(metric, ranges).order_by().values(**keys).annotate(
+        rows=Count('pk'), rent_sum=Sum(rent), rent_count=Count(rent),
+    )
+    return [
+        DailyRollup(
+            day=row['rollup_day'], metric=metric, status=row.get('rollup_status') or '',
+            city=row['rollup_city'] or '', category_id=row['rollup_category'] or 0,
+            count=row['rows'], rent_sum=row['rent_sum'] or 0, rent_count=row['rent_count'],
+        )
+        for row in rows
+    ]
+
+def rollup_metric(metric, through, since=None):
+    """
+    Roll up `metric` for the days after its cursor (or from `since`, to
+    redo days by hand) through `through`, and again for the older days
+    whose rows were saved since the previous run started or that were
+    marked dirty, replacing any rollups of those days; then advance the
+    cursor. Returns the rollups written.
+    """
+    started = timezone.now()
+    cursor = RollupCursor.objects.filter(metric=metric).first()
+    dirty = dict(RollupDirtyDay.objects.filter(metric=metric).values_list('pk', 'day'))
+    if since is None:
+        since = cursor.rolled_up_through + datetime.timedelta(days=1) if cursor else first_day(metric)
+    if since is None:
+        # Nothing at all yet
+        RollupDirtyDay.objects.filter(pk__in=dirty).delete()
+        return 0
+
+    ranges = [(since, through)] if since <= through else []
+    # Later days are rolled up from scratch when their turn comes
+    before = min(since, through + datetime.timedelta(days=1))
+    redo = {day for day in dirty.values() if day < before}
+    if cursor is not None and cursor.modified_after is not None:
+        # The overlap catches rows whose transaction was still open when
+        # the previous run read
+        overlap = datetime.timedelta(seconds=getattr(settings, 'ROLLUP_WATERMARK_OVERLAP', 300))
+        redo |= changed_days(metric, cursor.modified_after - overlap, before)
+    ranges += day_ranges(redo)
+    if not ranges:
+        if cursor is not None:
+            RollupCursor.objects.filter(pk=cursor.pk).update(modified_after=started)
+        RollupDirtyDay.objects.filter(pk__in=dirty).delete()
+        return 0
+
+    rollups = daily_rollups(metric, ranges)
+    days = Q()
+    for start, end in ranges:
+        days |= Q(day__range=(start, end))
+    rolled_up_through = max(through, cursor.rolled_up_through) if cursor else through
+    with transaction.atomic():
+        DailyRollup.objects.filter(days, metric=metric).delete()
+        DailyRollup.objects.bulk_create(rollups, batch_size=1000)
+        # Only the marks read above: days marked since then stay dirty
+        RollupDirtyDay.objects.filter(pk__in=dirty).delete()
+        RollupCursor.objects.update_or_create(metric=metric, defaults={
+            'rolled_up_through': rolled_up_through, 'modified_after': started,
+        })
+    return len(rollups)
+
+def rollup_analytics(through=None, since=None):
+    """
+    The nightly job: roll every metric up through `through` (yesterday, the
+    last complete day, by default). Returns {metric: rollups written}.
+    """
+    if through is None:
+        through = timezone.localdate() - datetime.timedelta(days=1)
+    return {metric: rollup_metric(metric, through, since) for metric in ROLLUP_METRICS}
+
+def period_start(day, granularity):
+    if granularity == 'week':
+        return day - datetime.timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    return day
+
+def periods(start, end, granularity):
+    """The start of every period from the one holding `start` to the one holding `end`."""
+    current, last = period_start(start, granularity), period_start(end, granularity)
+    while current <= last:
+        yield current
+        if granularity == 'month':
+            current = (current + datetime.timedelta(days=32)).replace(day=1)
+        else:
+            current += datetime.timedelta(days=7 if granularity == 'week' else 1)
+
+def parse_timeseries_params(params):
+    """
+    Read `metric`, `start`/`end` (YYYY-MM-DD; the 30 days through yesterday
+    by default), `granularity` (day, week or month), `group_by` (city,
+    category or status) and the `city`/`category` filters from a
+    QueryDict. Raises ValueError naming the first invalid one.
+    """
+    metric = params.get('metric') or 'applications'
+    if metric not in ROLLUP_METRICS:
+        raise ValueError(f"metric must be one of {', '.join(ROLLUP_METRICS)}.")
+    granularity = params.get('granularity') or 'day'
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"granularity must be one of {', '.join(GRANULARITIES)}.")
+    group_by = params.get('group_by') or None
+    if group_by and group_by not in GROUPINGS:
+        raise ValueError(f"group_by must be one of {', '.join(GROUPINGS)}.")
+
+    try:
+        end = datetime.date.fromisoformat(params['end']) if params.get('end') else timezone.localdate() - datetime.timedelta(days=1)
+        start = datetime.date.fromisoformat(params['start']) if params.get('start') else end - datetime.timedelta(days=29)
+    except ValueError:
+        raise ValueError("start and end must be dates (YYYY-MM-DD).")
+    if start > end:
+        raise ValueError("start must not be after end.")
+    if next(islice(periods(start, end, granularity), MAX_PERIODS, None), None) is not None:
+        raise ValueError(f"The range spans more than {MAX_PERIODS} periods; use a coarser granularity.")
+
+    try:
+        category = int(params['category']) if params.get('category') else None
+    except ValueError:
+        raise ValueError("category must be a category id.")
+    return {
+        'metric': metric, 'start': start, 'end': end, 'granularity': granularity,
+        'group_by': group_by, 'city': params.get('city') or None, 'category': category,
+    }
+
+def timeseries(metric, start, end, granularity='day', group_by=None, city=None, category=None):
+    """
+    `metric` per period from `start` to `end`, as Chart.js-ready labels
+    (period starts) and one series per city, category or status (a single
+    one without `group_by`), each with its counts and average rent (None
+    where nothing was counted). Reads only DailyRollup, in one query (two
+    when grouping by category, for the names).
+    """
+    rollups = DailyRollup.objects.filter(metric=metric, day__range=(start, end))
+    if city:
+        rollups = rollups.filter(city=city)
+    if category:
+        rollups = rollups.filter(category_id=category)
+    key = GROUPINGS.get(group_by)
+    fields = ('day', key) if key else ('day',)
+    rows = rollups.order_by().values(*fields).annotate(
+        count_total=Sum('count'), rent_total=Sum('rent_sum'), rent_counted=Sum('rent_count'),
+    )
+
+    labels = list(periods(start, end, granularity))
+    index = {period: position for position, period in enumerate(labels)}
+    series = {}
+    for row in rows:
+        counts, rent_sums, rent_counts = series.setdefault(
+            row[key] if key else metric, ([0] * len(labels), [0] * len(labels), [0] * len(labels)),
+        )
+        position = index[period_start(row['day'], granularity)]
+        counts[position] += row['count_total']
+        rent_sums[position] += row['rent_total'] or 0
+        rent_counts[position] += row['rent_counted']
+
+    names = dict(DailyRollup.METRIC_CHOICES)
+    if group_by == 'category':
+        names = dict(Category.objects.filter(pk__in=series).values_list('pk', 'name'))
+        names[0] = 'Uncategorized'
+    elif group_by:
+        names = {'': 'Unknown'}
+    return {
+        'metric': metric,
+        'granularity': granularity,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'labels': [period.isoformat() for period in labels],
+        'series': [
+            {
+                'key': series_key,
+                'label': str(names.get(series_key, series_key)),
+                'counts': counts,
+                'average_rent': [
+                    round(float(total) / counted, 2) if counted else None
+                    for total, counted in zip(rent_sums, rent_counts)
+                ],
+            }
+            for series_key, (counts, rent_sums, rent_counts) in sorted(series.items(), key=lambda item: str(item[0]))
+        ],
+    }
+
+def activity_chart(days=30):
+    """
+    Chart.js data for the admin dashboard: each metric's daily count over
+    the `days` through yesterday, one dataset per metric, from one query.
+    """
+    end = timezone.localdate() - datetime.timedelta(days=1)
+    start = end - datetime.timedelta(days=days - 1)
+    labels = list(periods(start, end, 'day'))
+    data = {metric: [0] * len(labels) for metric in ROLLUP_METRICS}
+    rows = DailyRollup.objects.filter(day__range=(start, end)).order_by().values('metric', 'day').annotate(total=Sum('count'))
+    for row in rows:
+        data[row['metric']][(row['day'] - start).days] += row['total']
+    return {
+        'labels': [day.isoformat() for day in labels],
+        'datasets': [{'label': label, 'data': data[metric]} for metric, label in DailyRollup.METRIC_CHOICES],
+    }
@@ -0,0 +1,95 @@
+from concurrent.futures import ProcessPoolExecutor
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from backend.cache import invalidate
+from backend.renditions import rendition_image_fields
+
+class ImageBackfillCommand(BaseCommand):
+    """
+    The batch loop shared by backfill_renditions and backfill_placeholders:
+    walk the rows of every image field with renditions, run `function` for
+    each row that needs it in a process pool (or inline with --workers 0)
+    and write the results back. Subclasses pick the rows (candidates()),
+    the pool arguments (arguments()) and how a result is stored (store()).
+    """
+    function = None
+    # Exceptions that fail one image rather than the whole run
+    errors = (OSError,)
+    failure_message = "Could not render {name}: {error}"
+    force_help = "Re-render images that already have renditions."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None, help="Worker processes (default IMAGE_JOB_WORKERS; 0 renders inline).")
+        parser.add_argument('--batch-size', type=int, default=200)
+        parser.add_argument('--force', action='store_true', help=self.force_help)
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        if workers is None:
+            workers = getattr(settings, 'IMAGE_JOB_WORKERS', 4)
+        self.force = options['force']
+        self.batch_size = options['batch_size']
+        self.rendered = self.failed = self.skipped = 0
+
+        pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+        try:
+            for model in apps.get_models():
+                for field_name in rendition_image_fields(model):
+                    self.backfill(model, model._meta.get_field(field_name), pool)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(self.summary()))
+
+    def candidates(self, model, field):
+        """Yield the (pk, name, renditions) rows of `field` to process, counting the ones skipped."""
+        raise NotImplementedError
+
+    def arguments(self, model, field, name, renditions):
+        """The arguments `function` runs with in the pool for one row."""
+        raise NotImplementedError
+
+    def store(self, model, field, pk, name, renditions, result):
+        """Write one row's result, if it still has the image; returns whether it did."""
+        raise NotImplementedError
+
+    def summary(self):
+        raise NotImplementedError
+
+    def backfill(self, model, field, pool):
+        batch, rendered = [], 0
+        for row in self.candidates(model, field):
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                rendered += self.render_batch(model, field, batch, pool)
+                batch = []
+        if batch:
+            rendered += self.render_batch(model, field, batch, pool)
+        if rendered:
+            invalidate(model._meta.model_name)
+
+    def render_batch(self, model, field, batch, pool):
+        arguments = [self.arguments(model, field, name, renditions) for pk, name, renditions in batch]
+        if pool is None:
+            results = (self.attempt(name, self.function, *args) for (pk, name, renditions), args in zip(batch, arguments))
+        else:
+            futures = [pool.submit(self.function, *args) for args in arguments]
+            results = (self.attempt(name, future.result) for (pk, name, renditions), future in zip(batch, futures))
+
+        rendered = 0
+        for (pk, name, renditions), result in zip(batch, results):
+            if result is None:
+                self.failed += 1
+            elif self.store(model, field, pk, name, renditions, result):
+                rendered += 1
+        self.rendered += rendered
+        return rendered
+
+    def attempt(self, name, function, *args):
+        try:
+            return function(*args)
+        except self.errors as error:
+            self.stderr.write(self.failure_message.format(name=name, error=error))
+            return None
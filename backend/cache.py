@@ -0,0 +1,189 @@
+import time
+import hashlib
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.contrib import messages
+from django.http import HttpResponse
+from rest_framework.response import Response
+from backend.models import *
+
+# Models whose rows appear on the public listing pages and API. Each has
+# its own version namespace (a CacheVersion row), bumped by the signals in
+# backend/signals.py.
+LISTING_MODELS = ('property', 'propertyimage', 'propertyreview', 'amenity', 'category')
+
+def version_clock():
+    # Microseconds since the epoch. Versions move to at least this, so a
+    # bumped version is never one handed out before, even after a bump was
+    # rolled back or the database restored.
+    return time.time_ns() // 1000
+
+def create_cache_version(namespace):
+    try:
+        with transaction.atomic():
+            return CacheVersion.objects.create(namespace=namespace, version=version_clock()).version
+    except IntegrityError:
+        # Created by a concurrent reader in between
+        return CacheVersion.objects.values_list('version', flat=True).get(namespace=namespace)
+
+def current_versions(namespaces):
+    """{namespace: version} for `namespaces`, read in one query."""
+    versions = dict(CacheVersion.objects.filter(namespace__in=namespaces).values_list('namespace', 'version'))
+    for namespace in namespaces:
+        if namespace not in versions:
+            versions[namespace] = create_cache_version(namespace)
+    return versions
+
+def cache_version(namespace):
+    """
+    Current version of `namespace`. Cache keys that embed it are
+    invalidated all at once by bump_cache_version().
+    """
+    return current_versions([namespace])[namespace]
+
+def lock_cache_version(namespace):
+    """
+    Current version of `namespace`, locking its row until the surrounding
+    transaction ends so that no other process bumps it in between.
+    """
+    version = CacheVersion.objects.select_for_update().filter(namespace=namespace).values_list('version', flat=True).first()
+    return create_cache_version(namespace) if version is None else version
+
+def bump_cache_version(namespace):
+    """Move `namespace` to a version it never had before and return it."""
+    with transaction.atomic():
+        versions = CacheVersion.objects.filter(namespace=namespace)
+        bumped = {'version': Greatest(F('version') + 1, Value(version_clock())), 'updated_at': timezone.now()}
+        if not versions.update(**bumped):
+            try:
+                with transaction.atomic():
+                    return CacheVersion.objects.create(namespace=namespace, version=version_clock()).version
+            except IntegrityError:
+                versions.update(**bumped)
+        return versions.values_list('version', flat=True).get()
+
+def cache_versions(*namespaces, request=None):
+    """
+    A key fragment combining the current versions of `namespaces`, read
+    in one query. Given the `request`, versions already read while
+    handling it are reused.
+    """
+    known = getattr(request, '_cache_versions', {})
+    missing = [namespace for namespace in namespaces if namespace not in known]
+    if missing:
+        known = {**known, **current_versions(missing)}
+        if request is not None:
+            request._cache_versions = known
+    return '.'.join(f'{namespace}{known[namespace]}' for namespace in namespaces)
+
+def count_stat(name):
+    key = f'stats:{name}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+def invalidate(namespace):
+    """Bump a model namespace and record the invalidation."""
+    count_stat(f'invalidations:{namespace}')
+    return bump_cache_version(namespace)
+
+def response_cache_stats():
+    """Hit/miss counts, hit ratio and invalidations per namespace."""
+    keys = ['stats:hits', 'stats:misses'] + [f'stats:invalidations:{namespace}' for namespace in LISTING_MODELS + ('user',)]
+    found = cache.get_many(keys)
+    hits, misses = found.get('stats:hits', 0), found.get('stats:misses', 0)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else None,
+        'invalidations': {
+            key.rsplit(':', 1)[1]: found.get(key, 0) for key in keys[2:]
+        },
+    }
+
+def response_cache_key(request, namespaces):
+    digest = hashlib.md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+    return f'response:{cache_versions(*namespaces, request=request)}:{digest}'
+
+def cacheable(request):
+    return request.method in ('GET', 'HEAD') and getattr(settings, 'RESPONSE_CACHE_ENABLED', True)
+
+def shareable(request, response):
+    """
+    Whether a rendered page may be served to other visitors. Middleware
+    sets cookies after the view returns: the CSRF cookie once the page
+    asked for a token (which the HTML then embeds too) and the session
+    cookie once the view wrote to the session, so those are read from the
+    request rather than from response.cookies.
+    """
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    if request.META.get('CSRF_COOKIE_NEEDS_UPDATE') or request.META.get('CSRF_COOKIE_USED'):
+        return False
+    session = getattr(request, 'session', None)
+    return not (session is not None and session.modified)
+
+def cache_anonymous_page(*namespaces, timeout=None):
+    """
+    Cache a function view's rendered page for anonymous visitors under the
+    current versions of `namespaces`. Signed-in users (whose pages carry
+    per-user parts such as the application status) and requests with
+    pending flash messages always get a fresh render.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if not cacheable(request) or request.user.is_authenticated or len(messages.get_messages(request)):
+                return view(request, *args, **kwargs)
+
+            key = response_cache_key(request, namespaces)
+            cached = cache.get(key)
+            if cached is not None:
+                count_stat('hits')
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+                response['X-Cache'] = 'HIT'
+                return response
+
+            count_stat('misses')
+            response = view(request, *args, **kwargs)
+            if shareable(request, response):
+                cache.set(key, (response.content, response['Content-Type']), timeout or getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 600))
+            response['X-Cache'] = 'MISS'
+            return response
+        return wrapped
+    return decorator
+
+def cache_api_response(*namespaces, timeout=None):
+    """
+    Cache an APIView handler's successful response data under the current
+    versions of `namespaces`. Only for endpoints whose output does not
+    depend on who is asking.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapped(self, request, *args, **kwargs):
+            if not cacheable(request):
+                return method(self, request, *args, **kwargs)
+
+            key = response_cache_key(request, namespaces)
+            cached = cache.get(key)
+            if cached is not None:
+                count_stat('hits')
+                return Response(cached, headers={'X-Cache': 'HIT'})
+
+            count_stat('misses')
+            response = method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, timeout or getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 600))
+            response['X-Cache'] = 'MISS'
+            return response
+        return wrapped
+    return decorator
@@ -0,0 +1,67 @@
+import os
+import re
+from django.conf import settings
+from django.core.checks import Error, register
+from django.template.utils import get_app_template_dirs
+
+# Absolute (or protocol-relative) URLs of image files
+EXTERNAL_IMAGE_RE = re.compile(
+    r'''(?:https?:)?//(?P<host>[a-z0-9-]+(?:\.[a-z0-9-]+)+)(?::\d+)?/[^\s"'()<>{}]*?\.(?:png|jpe?g|gif|svg|webp|avif|bmp|ico)(?![\w-])''',
+    re.IGNORECASE,
+)
+# <img>/<source> pointing off-site, whatever the URL looks like
+EXTERNAL_SRC_RE = re.compile(
+    r'''<(?:img|source)\b[^>]*?\b(?:src|srcset)\s*=\s*["']?\s*(?:https?:)?//(?P<host>[^/"'\s>]+)''',
+    re.IGNORECASE,
+)
+# Image services that never serve anything else
+PLACEHOLDER_HOSTS_RE = re.compile(
+    r'//(?P<host>(?:via\.)?placeholder\.com|placehold\.(?:co|it)|picsum\.photos|dummyimage\.com|placekitten\.com)\b',
+    re.IGNORECASE,
+)
+
+def asset_files():
+    """The templates, and the stylesheets under STATICFILES_DIRS, that pages are built from."""
+    template_dirs = [directory for engine in settings.TEMPLATES for directory in engine.get('DIRS', [])]
+    template_dirs += [str(directory) for directory in get_app_template_dirs('templates')]
+    for directory in template_dirs:
+        for root, dirs, files in os.walk(directory):
+            for name in files:
+                if name.endswith(('.html', '.txt', '.xml')):
+                    yield os.path.join(root, name)
+    for directory in settings.STATICFILES_DIRS:
+        directory = directory[1] if isinstance(directory, (list, tuple)) else directory
+        for root, dirs, files in os.walk(directory):
+            for name in files:
+                if name.endswith('.css'):
+                    yield os.path.join(root, name)
+
+def external_images(text):
+    """(line number, host) for every image the text loads from another site."""
+    found = set()
+    for pattern in (EXTERNAL_IMAGE_RE, EXTERNAL_SRC_RE, PLACEHOLDER_HOSTS_RE):
+        for match in pattern.finditer(text):
+            found.add((text.count('\n', 0, match.start()) + 1, match.group('host').lower()))
+    return sorted(found)
+
+@register('templates')
+def check_external_images(app_configs, **kwargs):
+    """
+    Pages must not hotlink images from other hosts: each one costs a DNS
+    lookup, TLS handshake and cross-origin round trip, and breaks offline.
+    """
+    errors = []
+    for path in sorted(set(asset_files())):
+        try:
+            with open(path, encoding='utf-8') as handle:
+                text = handle.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        for line, host in external_images(text):
+            errors.append(Error(
+                f"{os.path.relpath(path, settings.BASE_DIR)}:{line} loads an image from {host}.",
+                hint="Vendor the file into static/ and reference it with {% static %}.",
+                obj=path,
+                id='backend.E001',
+            ))
+    return errors
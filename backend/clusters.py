@@ -0,0 +1,136 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Min, Sum
+from django.db.models.functions import Substr
+from backend.models import *
+from backend.geo import geohash_prefix
+
+CLUSTER_FIELDS = ('count', 'latitude_sum', 'longitude_sum', 'min_price_rwf', 'max_price_rwf')
+
+def max_precision():
+    return getattr(settings, 'GEO_CLUSTER_MAX_PRECISION', 8)
+
+def zoom_precision(zoom):
+    """
+    The longest geohash whose cells are still at least GEO_CLUSTER_CELL_PX
+    wide at this web map zoom level (256px tiles).
+    """
+    cell_px = getattr(settings, 'GEO_CLUSTER_CELL_PX', 64)
+    precision = 1
+    for candidate in range(1, max_precision() + 1):
+        lng_bits = (candidate * 5 + 1) // 2
+        if 256 * 2 ** zoom / 2 ** lng_bits >= cell_px:
+            precision = candidate
+    return precision
+
+def merge_totals(totals, row):
+    """Fold one child cell's totals into `totals` (in place)."""
+    if not totals:
+        totals.update(row)
+        return totals
+    totals['count'] += row['count']
+    totals['latitude_sum'] += row['latitude_sum']
+    totals['longitude_sum'] += row['longitude_sum']
+    for field, pick in (('min_price_rwf', min), ('max_price_rwf', max)):
+        values = [value for value in (totals[field], row[field]) if value is not None]
+        totals[field] = pick(values) if values else None
+    return totals
+
+def make_cluster(precision, geohash, totals):
+    return PropertyCluster(
+        precision=precision,
+        geohash=geohash,
+        latitude=totals['latitude_sum'] / totals['count'],
+        longitude=totals['longitude_sum'] / totals['count'],
+        **{field: totals[field] for field in CLUSTER_FIELDS},
+    )
+
+def property_totals():
+    return dict(
+        count=Count('id'),
+        latitude_sum=Sum('latitude'),
+        longitude_sum=Sum('longitude'),
+        min_price_rwf=Min('price_rwf'),
+        max_price_rwf=Max('price_rwf'),
+    )
+
+def build_clusters():
+    """
+    Every PropertyCluster row, computed from scratch: one GROUP BY over the
+    finest cells, then each coarser level merged from the one below.
+    """
+    top = max_precision()
+    level = {}
+    rows = (
+        Property.objects.filter(geohash__isnull=False).order_by()
+        .annotate(cell=Substr('geohash', 1, top))
+        .values('cell')
+        .annotate(**property_totals())
+    )
+    for row in rows:
+        level[row.pop('cell')] = row
+
+    clusters = []
+    for precision in range(top, 0, -1):
+        if precision < top:
+            parents = {}
+            for cell, totals in level.items():
+                merge_totals(parents.setdefault(cell[:precision], {}), dict(totals))
+            level = parents
+        clusters.extend(make_cluster(precision, cell, totals) for cell, totals in level.items())
+    return clusters
+
+def rebuild_clusters(batch_size=1000):
+    clusters = build_clusters()
+    with transaction.atomic():
+        PropertyCluster.objects.all().delete()
+        PropertyCluster.objects.bulk_create(clusters, batch_size=batch_size)
+    return len(clusters)
+
+def refresh_cells(geohashes):
+    """
+    Recompute the clusters containing each of `geohashes` at every level.
+    The finest cell is aggregated from its properties and each coarser one
+    from its (at most 32) child clusters, so an update touches a bounded
+    number of rows however many properties share the city.
+    """
+    top = max_precision()
+    cells = {geohash[:top] for geohash in geohashes if geohash}
+    with transaction.atomic():
+        for precision in range(top, 0, -1):
+            cells = {cell[:precision] for cell in cells}
+            for cell in cells:
+                if precision == top:
+                    members = Property.objects.filter(geohash_prefix(cell))
+                    totals = members.aggregate(**property_totals())
+                else:
+                    children = PropertyCluster.objects.filter(geohash_prefix(cell), precision=precision + 1)
+                    totals = children.aggregate(
+                        count=Sum('count'),
+                        latitude_sum=Sum('latitude_sum'),
+                        longitude_sum=Sum('longitude_sum'),
+                        min_price_rwf=Min('min_price_rwf'),
+                        max_price_rwf=Max('max_price_rwf'),
+                    )
+
+                if not totals['count']:
+                    PropertyCluster.objects.filter(precision=precision, geohash=cell).delete()
+                    continue
+                cluster = make_cluster(precision, cell, totals)
+                PropertyCluster.objects.update_or_create(
+                    precision=precision, geohash=cell,
+                    defaults={field: getattr(cluster, field) for field in CLUSTER_FIELDS + ('latitude', 'longitude')},
+                )
+
+def clusters_in_viewport(south, west, north, east, zoom):
+    """
+    The precomputed clusters for this zoom level whose centroid falls in
+    the box, largest first, capped at GEO_CLUSTER_MAX_RESULTS.
+    """
+    precision = zoom_precision(zoom)
+    clusters = PropertyCluster.objects.filter(
+        precision=precision,
+        latitude__gte=south, latitude__lte=north,
+        longitude__gte=west, longitude__lte=east,
+    ).order_by('-count', 'geohash')
+    return precision, clusters[:getattr(settings, 'GEO_CLUSTER_MAX_RESULTS', 500)]
@@ -0,0 +1,98 @@
+import hashlib
+from functools import wraps
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from backend.models import *
+from backend.cache import cache_versions
+
+def latest_child_update(model):
+    return Subquery(
+        model.objects.filter(property=OuterRef('pk')).order_by()
+        .values('property').annotate(latest=Max('updated_at')).values('latest')
+    )
+
+def property_freshness(queryset):
+    """
+    (count, last_modified) for a Property queryset, where last_modified is
+    the latest `updated_at` among the properties, their images and their
+    reviews. A single aggregate query; nothing is serialized.
+    """
+    latest = Greatest(
+        'updated_at',
+        Coalesce(latest_child_update(PropertyImage), 'updated_at'),
+        Coalesce(latest_child_update(PropertyReview), 'updated_at'),
+    )
+    totals = queryset.order_by().annotate(latest=latest).aggregate(count=Count('id'), last_modified=Max('latest'))
+    return totals['count'], totals['last_modified']
+
+def conditional_properties(get_queryset, vary=None):
+    """
+    Answer conditional GETs for a view rendering the properties returned by
+    `get_queryset(request, *args, **kwargs)`.
+
+    The ETag hashes the URL, Accept header, property count and latest
+    update; Last-Modified is that latest update. A matching If-None-Match
+    or If-Modified-Since returns 304 before the view runs. `vary(request)`
+    may add further state to the ETag, or return None to skip validation
+    for that request.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            extra = vary(request) if vary else ''
+            if request.method not in ('GET', 'HEAD') or extra is None:
+                return view(request, *args, **kwargs)
+
+            count, last_modified = property_freshness(get_queryset(request, *args, **kwargs))
+            if not count:
+                return view(request, *args, **kwargs)
+
+            state = '|'.join((
+                request.get_full_path(), request.META.get('HTTP_ACCEPT', ''),
+                str(count), last_modified.isoformat(), extra,
+            ))
+            etag = quote_etag(hashlib.md5(state.encode('utf-8')).hexdigest())
+            last_modified = int(last_modified.timestamp())
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view(request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response['ETag'] = etag
+                response['Last-Modified'] = http_date(last_modified)
+            return response
+        return wrapped
+    return decorator
+
+def conditional_listing(*namespaces):
+    """
+    Answer conditional GETs for a list view whose output depends only on
+    the URL and the rows of the `namespaces` models.
+
+    The ETag hashes the URL, Accept header and the namespaces' cache
+    versions: one indexed read, shared with the response cache, whatever
+    the filters. Any change to those models changes it, so there is no
+    Last-Modified.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            state = '|'.join((
+                request.get_full_path(), request.META.get('HTTP_ACCEPT', ''),
+                cache_versions(*namespaces, request=request),
+            ))
+            etag = quote_etag(hashlib.md5(state.encode('utf-8')).hexdigest())
+
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = view(request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response['ETag'] = etag
+            return response
+        return wrapped
+    return decorator
@@ -0,0 +1,132 @@
+import collections
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from backend.models import *
+
+GLOBAL, PROVIDER, TENANT = 'Global', 'Provider', 'Tenant'
+
+def scoped_keys(metric, status, provider_id=None, tenant_id=None):
+    """The (scope, owner, metric, status) counters one row adds to: always global, plus its provider's and tenant's."""
+    status = status or ''
+    keys = [(GLOBAL, 0, metric, status)]
+    if provider_id:
+        keys.append((PROVIDER, provider_id, metric, status))
+    if tenant_id:
+        keys.append((TENANT, tenant_id, metric, status))
+    return keys
+
+def application_keys(status, tenant_id, provider_id):
+    return scoped_keys('applications', status, provider_id, tenant_id)
+
+def contract_keys(status, payment_status, tenant_id, provider_id):
+    return (
+        scoped_keys('contracts', status, provider_id, tenant_id)
+        + scoped_keys('payments', payment_status, provider_id, tenant_id)
+    )
+
+def property_keys(provider_id):
+    return scoped_keys('properties', '', provider_id)
+
+def user_keys(role):
+    return scoped_keys('users', role)
+
+# Counted model: (the values_list() lookups its counters depend on, the
+# keys a row with those values adds to). A house provider owns the
+# applications and contracts of the properties they created.
+COUNTED_MODELS = {
+    RentApplication: (('status', 'user_id', 'property__created_by_id'), application_keys),
+    Contract: (('status', 'payment_status', 'tenant_id', 'property__created_by_id'), contract_keys),
+    Property: (('created_by_id',), property_keys),
+    User: (('role',), user_keys),
+}
+
+def counted_fields(model):
+    """Names (and attnames) of the fields of `model` whose change can move its counters."""
+    fields = (model._meta.get_field(lookup.split('__')[0]) for lookup in COUNTED_MODELS[model][0])
+    return {name for field in fields for name in (field.name, field.attname)}
+
+def counted(queryset):
+    """How much the rows of `queryset` add to each counter, from one grouped query."""
+    lookups, keys = COUNTED_MODELS[queryset.model]
+    totals = collections.Counter()
+    for *values, count in queryset.order_by().values_list(*lookups).annotate(rows=Count('pk')):
+        for key in keys(*values):
+            totals[key] += count
+    return totals
+
+def stored_counts(instance, with_children=False):
+    """
+    What the stored row of `instance` adds to each counter (nothing if it
+    is not saved yet). With `with_children`, a property's applications and
+    contracts are included, as their provider follows the property's
+    created_by.
+    """
+    totals = collections.Counter()
+    if instance.pk is None:
+        return totals
+    model = type(instance)
+    totals.update(counted(model._default_manager.filter(pk=instance.pk)))
+    if with_children:
+        totals.update(counted(RentApplication.objects.filter(property_id=instance.pk)))
+        totals.update(counted(Contract.objects.filter(property_id=instance.pk)))
+    return totals
+
+def apply_counter_deltas(deltas):
+    """
+    Add each of `deltas` ({key: signed change}) to its counter in one
+    transaction (the caller's, when there is one), creating missing rows.
+    Keys are taken in order so concurrent writers lock rows alike.
+    """
+    with transaction.atomic():
+        for (scope, owner_id, metric, status), delta in sorted(deltas.items()):
+            if not delta:
+                continue
+            rows = DashboardCounter.objects.filter(scope=scope, owner_id=owner_id, metric=metric, status=status)
+            if rows.update(value=F('value') + delta):
+                continue
+            try:
+                with transaction.atomic():
+                    DashboardCounter.objects.create(scope=scope, owner_id=owner_id, metric=metric, status=status, value=delta)
+            except IntegrityError:
+                # Created by a concurrent writer in between
+                rows.update(value=F('value') + delta)
+
+def counter_values(scope, owner_id=0):
+    """{(metric, status): value} of one scope's counters, in one query."""
+    rows = DashboardCounter.objects.filter(scope=scope, owner_id=owner_id).values_list('metric', 'status', 'value')
+    return {(metric, status): value for metric, status, value in rows}
+
+def expected_counters():
+    """Every counter's value recomputed from the counted tables (one grouped query each); zeros left out."""
+    totals = collections.Counter()
+    for model in COUNTED_MODELS:
+        totals.update(counted(model._default_manager.all()))
+    return +totals
+
+def reconcile_counters(fix=True):
+    """
+    Compare the stored counters with expected_counters() and, with `fix`,
+    correct the ones that drifted (deleting rows that should be zero).
+    Returns [(key, stored, expected)] for every drifted counter.
+    """
+    with transaction.atomic():
+        stored = {
+            (scope, owner_id, metric, status): value
+            for scope, owner_id, metric, status, value in DashboardCounter.objects.select_for_update().values_list(
+                'scope', 'owner_id', 'metric', 'status', 'value',
+            )
+        }
+        expected = expected_counters()
+        drift = [
+            (key, stored.get(key, 0), expected.get(key, 0))
+            for key in sorted(set(stored) | set(expected))
+            if stored.get(key, 0) != expected.get(key, 0)
+        ]
+        if fix:
+            for (scope, owner_id, metric, status), was, value in drift:
+                key = dict(scope=scope, owner_id=owner_id, metric=metric, status=status)
+                if value:
+                    DashboardCounter.objects.update_or_create(**key, defaults={'value': value})
+                else:
+                    DashboardCounter.objects.filter(**key).delete()
+    return drift
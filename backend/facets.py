@@ -0,0 +1,180 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Case, CharField, Count, Value, When
+from backend.models import *
+from backend.cache import cache_versions
+from backend.filters import filter_properties
+
+def price_buckets():
+    """
+    (label, lower, upper) tuples built from settings.PROPERTY_PRICE_BUCKETS,
+    a sorted list of USD lower bounds. The last bucket is open-ended.
+    """
+    bounds = list(getattr(settings, 'PROPERTY_PRICE_BUCKETS', (0, 500, 1000, 2000, 5000)))
+    buckets = []
+    for index, lower in enumerate(bounds):
+        upper = bounds[index + 1] if index + 1 < len(bounds) else None
+        label = f"{lower}-{upper - 1}" if upper is not None else f"{lower}+"
+        buckets.append((label, lower, upper))
+    return buckets
+
+def price_bucket_expression(buckets):
+    whens = []
+    for label, lower, upper in buckets:
+        condition = {'price_usd__gte': lower}
+        if upper is not None:
+            condition['price_usd__lt'] = upper
+        whens.append(When(then=Value(label), **condition))
+    return Case(*whens, default=Value(None), output_field=CharField())
+
+# Facet: the query parameters that filter on it
+FACET_PARAMS = {
+    'city': ('city',),
+    'type': ('type',),
+    'category': ('category',),
+    'price': ('price_min', 'price_max'),
+    'amenity': ('amenities', 'amenity_match'),
+}
+
+# Single-valued facet: the columns its counts are grouped on
+FACET_COLUMNS = {
+    'city': ('city',),
+    'type': ('type',),
+    'category': ('category_id', 'category__name'),
+    'price': ('price_bucket',),
+}
+
+def without_params(params, names):
+    params = params.copy()
+    for name in names:
+        params.pop(name, None)
+    return params
+
+def active_facets(params):
+    """The facets whose own filter is set in `params`, amenities only when matched with any."""
+    active = [facet for facet, names in FACET_PARAMS.items() if any(params.get(name) for name in names)]
+    if 'amenity' in active and params.get('amenity_match') != 'any':
+        # Matched with all, ticking another amenity narrows the list, so
+        # its count within the current matches is the useful one
+        active.remove('amenity')
+    return active
+
+def compute_facets(params, filter_queryset=filter_properties, queryset=None):
+    """
+    Counts per city, type, category, price bucket and amenity for the
+    properties `filter_queryset(queryset, params)` returns (all properties
+    through filter_properties() by default).
+
+    Facets are disjunctive: each one is counted with every filter except
+    its own, so choosing a city still shows how many listings the other
+    cities have. Amenities matched with all are the exception, as each one
+    ticked narrows the list further.
+
+    Results are cached per filter function and parameters under the
+    property, category and amenity cache versions, which their signals
+    bump on every change.
+    """
+    queryset = Property.objects.all() if queryset is None else queryset
+    try:
+        sql, sql_params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return count_facets(params, filter_queryset, queryset)
+    state = (
+        f"{filter_queryset.__module__}.{filter_queryset.__qualname__}|{sql}|{sql_params!r}|"
+        f"{sorted((name, values) for name, values in params.lists() if any(values))!r}"
+    )
+    digest = hashlib.md5(state.encode('utf-8')).hexdigest()
+    key = f"facets:{cache_versions('property', 'category', 'amenity')}:{digest}"
+
+    facets = cache.get(key)
+    if facets is None:
+        facets = count_facets(params, filter_queryset, queryset)
+        cache.set(key, facets, getattr(settings, 'FACETS_CACHE_TIMEOUT', 300))
+    return facets
+
+def count_facets(params, filter_queryset, queryset):
+    """
+    The single-valued facets come from one GROUP BY over every combination
+    of (city, type, category, price bucket) in the filtered set, which is
+    then summed per facet in Python; amenities are many-to-many and get one
+    grouped query over the through table. Each facet with its own filter
+    set is then recounted, in one grouped query, over the set filtered by
+    everything else. Two queries, plus one per such facet.
+    """
+    buckets = price_buckets()
+    filtered = filter_queryset(queryset, params)
+    facets = summarize_facets(facet_rows(filtered, sum(FACET_COLUMNS.values(), ()), buckets), buckets)
+    facets['amenity'] = amenity_facet(filtered)
+
+    for facet in active_facets(params):
+        others = filter_queryset(queryset, without_params(params, FACET_PARAMS[facet]))
+        if facet == 'amenity':
+            facets['amenity'] = amenity_facet(others)
+        else:
+            facets[facet] = summarize_facets(facet_rows(others, FACET_COLUMNS[facet], buckets), buckets)[facet]
+
+    return {name: facets[name] for name in ('total', 'city', 'type', 'category', 'amenity', 'price')}
+
+def facet_rows(queryset, columns, buckets):
+    """Property counts of `queryset` grouped on `columns`, one query."""
+    queryset = queryset.order_by()
+    # Joins through amenities duplicate rows; only then is DISTINCT needed
+    distinct = queryset.query.distinct
+    if 'price_bucket' in columns:
+        queryset = queryset.annotate(price_bucket=price_bucket_expression(buckets))
+    return queryset.values(*columns).annotate(count=Count('id', distinct=distinct))
+
+def summarize_facets(rows, buckets):
+    """Sum grouped facet_rows() into each facet's list (facets whose columns are missing come out empty)."""
+    total = 0
+    city_counts, type_counts, price_counts = {}, {}, {}
+    category_counts, category_names = {}, {}
+    for row in rows:
+        count = row['count']
+        total += count
+        city_counts[row.get('city')] = city_counts.get(row.get('city'), 0) + count
+        type_counts[row.get('type')] = type_counts.get(row.get('type'), 0) + count
+        price_counts[row.get('price_bucket')] = price_counts.get(row.get('price_bucket'), 0) + count
+        if row.get('category_id') is not None:
+            category_counts[row['category_id']] = category_counts.get(row['category_id'], 0) + count
+            category_names[row['category_id']] = row['category__name']
+
+    return {
+        'total': total,
+        'city': [
+            {'value': code, 'label': label, 'count': city_counts.get(code, 0)}
+            for code, label in Property.CITY_CHOICES
+        ],
+        'type': [
+            {'value': code, 'label': label, 'count': type_counts.get(code, 0)}
+            for code, label in Property.TYPE_CHOICES
+        ],
+        'category': sorted(
+            (
+                {'value': pk, 'label': category_names[pk], 'count': count}
+                for pk, count in category_counts.items()
+            ),
+            key=lambda facet: facet['label'],
+        ),
+        'price': [
+            {'value': label, 'label': label, 'min': lower, 'max': upper, 'count': price_counts.get(label, 0)}
+            for label, lower, upper in buckets
+        ],
+    }
+
+def amenity_facet(queryset):
+    memberships = Property.amenities.through.objects.all()
+    if queryset.query.where:
+        memberships = memberships.filter(property_id__in=queryset.values('pk'))
+    amenity_rows = (
+        memberships
+        .values('amenity_id', 'amenity__name')
+        .annotate(count=Count('property_id'))
+        .order_by('amenity__name')
+    )
+    return [
+        {'value': row['amenity_id'], 'label': row['amenity__name'], 'count': row['count']}
+        for row in amenity_rows
+    ]
@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.templatetags.static import static
+from django.db.models.fields.files import ImageFieldFile
+from imagekit.models import ProcessedImageField
+from imagekit.models.fields.files import ProcessedImageFieldFile
+
+IMAGE_STATE_CHOICES = (
+    ('Pending', 'Pending'),
+    ('Processing', 'Processing'),
+    ('Ready', 'Ready'),
+    ('Failed', 'Failed'),
+)
+
+def deferred_processing_enabled():
+    return getattr(settings, 'IMAGE_PROCESSING_ASYNC', True)
+
+
+class DeferredProcessedImageFieldFile(ProcessedImageFieldFile):
+
+    def save(self, name, content, save=True):
+        if not deferred_processing_enabled():
+            return super().save(name, content, save)
+
+        # Keep the upload as it is; the image job queue renders it later
+        setattr(self.instance, self.field.state_field, 'Pending')
+        pending = self.instance.__dict__.setdefault('_pending_images', set())
+        pending.add(self.field.name)
+        return ImageFieldFile.save(self, name, content, save)
+
+    @property
+    def ready(self):
+        return getattr(self.instance, self.field.state_field) not in ('Pending', 'Processing')
+
+    @property
+    def url(self):
+        if not self.ready:
+            return static(getattr(settings, 'IMAGE_PROCESSING_PLACEHOLDER', 'frontend/img/processing.svg'))
+        return super().url
+
+
+class DeferredProcessedImageField(ProcessedImageField):
+    """
+    A ProcessedImageField that stores uploads untouched and leaves the
+    processors/format/options to the background image job queue
+    (backend/image_jobs.py), so requests no longer decode and resize.
+
+    `state_field` names a CharField (choices IMAGE_STATE_CHOICES, default
+    'Ready') declared *after* this field on the model, which tracks the
+    processing state. While an image is Pending or Processing its `url`
+    is the placeholder in IMAGE_PROCESSING_PLACEHOLDER.
+    """
+    attr_class = DeferredProcessedImageFieldFile
+
+    def __init__(self, *args, state_field=None, **kwargs):
+        self.state_field = state_field
+        super().__init__(*args, **kwargs)
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        if self.state_field is None:
+            self.state_field = f'{name}_state'
+        super().contribute_to_class(cls, name, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.state_field != f'{self.name}_state':
+            kwargs['state_field'] = self.state_field
+        return name, path, args, kwargs
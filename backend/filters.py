@@ -0,0 +1,100 @@
+from django.db.models import IntegerField
+from django.db.models.functions import Cast
+from backend.search import search_properties
+from backend.amenity_index import filter_by_amenities
+from backend.geo import filter_by_location, parse_geo_params
+
+def filter_properties(qs, params):
+    """
+    Apply the property list filters from a QueryDict (`q`, `city`, `type`,
+    `category` id, `capacity`/`bathroom` maximums, `size`, `address`,
+    `price_min`/`price_max` in USD and `amenities` ids, matched with
+    `amenity_match` all/any), plus `lat`/`lng`/`radius` (km) and `bbox`
+    (south,west,north,east), which annotate `distance_km`. Malformed
+    numbers are ignored.
+    """
+    # Full-text search
+    q = params.get('q', '').strip()
+    if q:
+        qs = search_properties(qs, q)
+
+    # City
+    city = params.get('city')
+    if city:
+        qs = qs.filter(city__iexact=city)
+
+    # Property Type
+    prop_type = params.get('type')
+    if prop_type:
+        qs = qs.filter(type__iexact=prop_type)
+
+    # Category by ID
+    cat = params.get('category')
+    if cat:
+        try:
+            qs = qs.filter(category_id=int(cat))
+        except ValueError:
+            pass
+
+    # Bedrooms <=
+    capacity = params.get('capacity')
+    if capacity:
+        try:
+            qs = qs.filter(capacity__lte=int(capacity))
+        except ValueError:
+            pass
+
+    # Bathrooms <=
+    bathroom = params.get('bathroom')
+    if bathroom:
+        try:
+            qs = qs.filter(bathroom__lte=int(bathroom))
+        except ValueError:
+            pass
+
+    # Size (assumes `size` stores a plain number as string)
+    size_val = params.get('size')
+    if size_val:
+        try:
+            max_size = int(size_val)
+            qs = qs.annotate(
+                size_int=Cast('size', IntegerField())
+            ).filter(size_int__lte=max_size)
+        except ValueError:
+            pass
+
+    # Address contains
+    address = params.get('address')
+    if address:
+        qs = qs.filter(address__icontains=address)
+
+    # Price range
+    price_min = params.get('price_min')
+    if price_min:
+        try:
+            qs = qs.filter(price_usd__gte=int(price_min))
+        except ValueError:
+            pass
+
+    price_max = params.get('price_max')
+    if price_max:
+        try:
+            qs = qs.filter(price_usd__lte=int(price_max))
+        except ValueError:
+            pass
+
+    # Amenities: all of them, or any of them with amenity_match=any
+    amenities = params.getlist('amenities')
+    if amenities:
+        try:
+            amenity_ids = [int(a) for a in amenities]
+            qs = filter_by_amenities(qs, amenity_ids, match=params.get('amenity_match', 'all'))
+        except ValueError:
+            pass
+
+    # Location: radius around lat/lng and/or a map viewport
+    geo = parse_geo_params(params)
+    if geo:
+        qs = filter_by_location(qs, geo)
+
+    return qs
@@ -0,0 +1,108 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from django.conf import settings
+from django.db import transaction
+from django.core.files.base import ContentFile
+from backend.models import *
+from backend.cache import invalidate
+from backend.fields import deferred_processing_enabled
+from backend.image_jobs import render_source, enqueue_image_jobs
+from backend.renditions import render_renditions, delete_renditions
+
+def ingest_workers():
+    return getattr(settings, 'IMAGE_INGEST_WORKERS', None) or min(4, os.cpu_count() or 1)
+
+def check_image(data):
+    """
+    Raise unless `data` is an image Pillow can open. Reads the header (and
+    verifies what it can without decoding the pixels), so it costs the
+    same however large the photo is.
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        image.verify()
+
+def prepare_gallery_image(property_id, filename, data, defer, threaded=False):
+    """
+    Check one uploaded gallery file and store it, either raw for the image
+    job queue (`defer`) or processed with its renditions (see
+    render_source() for `threaded`). Returns the PropertyImage column
+    values. Touches only the storage, never the database.
+    """
+    field = PropertyImage._meta.get_field('image')
+    name = field.generate_filename(PropertyImage(property_id=property_id), filename)
+    if defer:
+        check_image(data)
+        return {'image': field.storage.save(name, ContentFile(data)), 'image_state': 'Pending'}
+
+    name, content = render_source(field, ContentFile(data, name=filename), name, threaded)
+    stored = field.storage.save(name, content)
+    content.seek(0)
+    return {
+        'image': stored,
+        'image_state': 'Ready',
+        'image_renditions': render_renditions(field.storage, stored, content.read()),
+    }
+
+def run_inline(property_id, name, data, defer, threaded=False):
+    try:
+        return prepare_gallery_image(property_id, name, data, defer, threaded)
+    except Exception as error:
+        return error
+
+def describe_failure(error):
+    if isinstance(error, (Image.UnidentifiedImageError, Image.DecompressionBombError)):
+        return "not a supported image"
+    return str(error) or type(error).__name__
+
+def ingest_gallery(prop, files, workers=None):
+    """
+    Add uploaded `files` to `prop`'s gallery and insert their rows with one
+    bulk_create.
+
+    With deferred processing (the default) each file only has its header
+    checked and is stored raw; decoding, resizing and renditions are left
+    to the process_images job workers. Otherwise files are processed here,
+    on up to `workers` threads (IMAGE_INGEST_WORKERS by default); Pillow
+    releases the GIL while it decodes, resizes and encodes, and no process
+    is forked inside the web worker.
+
+    A file that cannot be used does not stop the others. Returns (images,
+    failures) where failures lists (file name, reason) pairs.
+    """
+    uploads = [(upload.name, upload.read()) for upload in files]
+    if not uploads:
+        return [], []
+
+    defer = deferred_processing_enabled()
+    workers = min(workers or ingest_workers(), len(uploads))
+    if defer or workers <= 1:
+        results = [run_inline(prop.pk, name, data, defer) for name, data in uploads]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda upload: run_inline(prop.pk, *upload, defer, threaded=True), uploads))
+
+    images, failures = [], []
+    for (name, data), result in zip(uploads, results):
+        if isinstance(result, Exception):
+            failures.append((name, describe_failure(result)))
+        else:
+            images.append(PropertyImage(property=prop, **result))
+    if not images:
+        return [], failures
+
+    try:
+        with transaction.atomic():
+            images = PropertyImage.objects.bulk_create(images)
+            if defer:
+                enqueue_image_jobs(images, 'image')
+    except Exception:
+        for image in images:
+            image.image.storage.delete(image.image.name)
+            delete_renditions(image.image.storage, image.image_renditions)
+        raise
+
+    # bulk_create sends no post_save, which would have done this per row
+    invalidate('propertyimage')
+    return images, failures
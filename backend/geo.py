@@ -0,0 +1,230 @@
+import re
+import math
+from django.conf import settings
+from django.db.models import FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Round, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9
+
+# Google Maps embeds carry the centre as !2d<lng>!3d<lat>; links use
+# @lat,lng or q=/ll=/center=lat,lng; plain text may just be "lat, lng".
+NUMBER = r'(-?\d{1,3}(?:\.\d+)?)'
+EMBED_PATTERN = re.compile(rf'!2d{NUMBER}!3d{NUMBER}')
+AT_PATTERN = re.compile(rf'@{NUMBER},\s*{NUMBER}')
+QUERY_PATTERN = re.compile(rf'[?&](?:q|ll|center|query|destination)={NUMBER}(?:,|%2C)\s*{NUMBER}', re.IGNORECASE)
+PAIR_PATTERN = re.compile(rf'(?<![\w.!]){NUMBER}\s*,\s*{NUMBER}(?![\w.])')
+
+def valid_coordinates(lat, lng):
+    return -90 <= lat <= 90 and -180 <= lng <= 180 and (lat, lng) != (0, 0)
+
+def parse_coordinates(text):
+    """
+    Extract a (latitude, longitude) pair from free text such as a Google
+    Maps embed snippet, a maps link or "lat, lng". Returns None if nothing
+    plausible is found.
+    """
+    if not text:
+        return None
+
+    match = EMBED_PATTERN.search(text)
+    if match:
+        lng, lat = float(match.group(1)), float(match.group(2))
+        if valid_coordinates(lat, lng):
+            return lat, lng
+
+    for pattern in (AT_PATTERN, QUERY_PATTERN, PAIR_PATTERN):
+        for match in pattern.finditer(text):
+            lat, lng = float(match.group(1)), float(match.group(2))
+            if valid_coordinates(lat, lng):
+                return lat, lng
+    return None
+
+def geohash_encode(lat, lng, precision=GEOHASH_PRECISION):
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        target, bounds = (lng, lng_range) if even else (lat, lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        if target >= middle:
+            value = (value << 1) | 1
+            bounds[0] = middle
+        else:
+            value <<= 1
+            bounds[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(GEOHASH_ALPHABET[value])
+            bits, value = 0, 0
+    return ''.join(chars)
+
+def geohash_cell_size(precision):
+    """(height, width) in degrees of a geohash cell of this length."""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+def covering_cells(south, west, north, east, max_cells=None):
+    """
+    The geohash prefixes, at the finest precision that needs at most
+    `max_cells` of them, whose union covers the bounding box.
+    """
+    max_cells = max_cells or getattr(settings, 'GEO_MAX_CELLS', 32)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = geohash_cell_size(precision)
+        rows = math.floor(north / height) - math.floor(south / height) + 1
+        columns = math.floor(east / width) - math.floor(west / width) + 1
+        if rows * columns <= max_cells:
+            break
+
+    cells = set()
+    lat = math.floor(south / height) * height + height / 2
+    while lat - height / 2 <= north:
+        lng = math.floor(west / width) * width + width / 2
+        while lng - width / 2 <= east:
+            cells.add(geohash_encode(max(-90.0, min(90.0, lat)), max(-180.0, min(180.0, lng)), precision))
+            lng += width
+        lat += height
+    return sorted(cells)
+
+def radius_bbox(lat, lng, radius_km):
+    """(south, west, north, east) box enclosing a circle."""
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    dlng = math.degrees(radius_km / (EARTH_RADIUS_KM * max(math.cos(math.radians(lat)), 1e-6)))
+    return max(lat - dlat, -90.0), max(lng - dlng, -180.0), min(lat + dlat, 90.0), min(lng + dlng, 180.0)
+
+def geohash_successor(prefix):
+    """
+    The first geohash prefix after every string starting with `prefix`
+    ('u4pr' -> 'u4ps', 'u4pz' -> 'u4q'), or None when there is none
+    ('zz').
+    """
+    prefix = prefix.rstrip(GEOHASH_ALPHABET[-1])
+    if not prefix:
+        return None
+    return prefix[:-1] + GEOHASH_ALPHABET[GEOHASH_ALPHABET.index(prefix[-1]) + 1]
+
+def geohash_prefix(prefix, field='geohash'):
+    """
+    Q for `field` starting with the geohash `prefix`, as a range between
+    it and its successor. Geohashes only hold digits and lowercase letters,
+    which every collation orders alike (binary and UCA ones included), so
+    the range is right and served by the column's index on any database.
+    """
+    condition = Q(**{f'{field}__gte': prefix})
+    successor = geohash_successor(prefix)
+    if successor:
+        condition &= Q(**{f'{field}__lt': successor})
+    return condition
+
+def within_bbox(queryset, south, west, north, east):
+    """
+    Restrict a Property queryset to the box, using geohash prefix ranges
+    (index-friendly on every backend) before the exact coordinate check.
+    """
+    cells = Q()
+    for cell in covering_cells(south, west, north, east):
+        cells |= geohash_prefix(cell)
+    return queryset.filter(cells).filter(
+        latitude__gte=south, latitude__lte=north,
+        longitude__gte=west, longitude__lte=east,
+    )
+
+def distance_km(lat, lng):
+    """
+    Great-circle (haversine) distance in km from (lat, lng) to each row's
+    coordinates, as an expression the database evaluates.
+    """
+    lat_radians = math.radians(lat)
+    half_dlat = (Radians('latitude') - lat_radians) / 2
+    half_dlng = (Radians('longitude') - math.radians(lng)) / 2
+    a = Power(Sin(half_dlat), 2) + math.cos(lat_radians) * Cos(Radians('latitude')) * Power(Sin(half_dlng), 2)
+    # Rounding can push sqrt(a) a hair above 1 for antipodal points
+    return Round(2 * EARTH_RADIUS_KM * ASin(Least(Sqrt(a), Value(1.0))), 4, output_field=FloatField())
+
+def with_distance(queryset, lat, lng, radius_km=None):
+    """
+    Annotate `distance_km` from (lat, lng) on a queryset already narrowed
+    to a spatial candidate set, dropping rows beyond `radius_km`. Computed
+    in SQL, so every match is kept and the database can count and order
+    them.
+    """
+    queryset = queryset.annotate(distance_km=distance_km(lat, lng))
+    if radius_km is not None:
+        queryset = queryset.filter(distance_km__lte=radius_km)
+    return queryset
+
+def parse_geo_params(params):
+    """
+    Read `lat`/`lng`/`radius` (km) and `bbox` (south,west,north,east) from a
+    QueryDict. Returns a dict with the validated values, or None when no
+    usable spatial filter was given. A point needs a radius or a bbox to
+    bound the search; on its own it is ignored (see geo_params_error()).
+    """
+    geo = {}
+    try:
+        if params.get('bbox'):
+            south, west, north, east = (float(value) for value in params['bbox'].split(','))
+            if south <= north and west <= east:
+                geo['bbox'] = (south, west, north, east)
+        if params.get('lat') and params.get('lng'):
+            lat, lng = float(params['lat']), float(params['lng'])
+            if valid_coordinates(lat, lng):
+                geo['point'] = (lat, lng)
+                if params.get('radius'):
+                    geo['radius'] = max(float(params['radius']), 0.0)
+    except ValueError:
+        return None
+    if 'point' in geo and 'radius' not in geo and 'bbox' not in geo:
+        return None
+    return geo or None
+
+def geo_params_error(params):
+    """
+    Why the `lat`/`lng`/`radius`/`bbox` of a QueryDict cannot be used, or
+    None when they can (or are not given). parse_geo_params() leaves out
+    what is invalid; the API rejects it with this message instead.
+    """
+    if params.get('bbox'):
+        try:
+            south, west, north, east = (float(value) for value in params['bbox'].split(','))
+        except ValueError:
+            return "bbox must be four numbers: south,west,north,east."
+        if not (-90 <= south <= 90 and -90 <= north <= 90 and -180 <= west <= 180 and -180 <= east <= 180):
+            return "bbox latitudes must be within -90..90 and longitudes within -180..180."
+        if south > north:
+            return "bbox south must not be above north."
+        if west > east:
+            return "A bbox crossing the antimeridian (west > east) is not supported; request each side of it separately."
+    if params.get('lat') or params.get('lng'):
+        try:
+            lat, lng = float(params.get('lat', '')), float(params.get('lng', ''))
+            radius = float(params['radius']) if params.get('radius') else None
+        except ValueError:
+            return "lat, lng and radius must be numbers."
+        if not valid_coordinates(lat, lng):
+            return "lat/lng is not a valid location."
+        if radius is None and not params.get('bbox'):
+            return "lat/lng needs a radius (km) or a bbox=south,west,north,east to search within."
+    return None
+
+def filter_by_location(queryset, geo):
+    """
+    Apply parsed geo params: a radius around the point and/or a viewport
+    box. Results are annotated with `distance_km` from the point (or from
+    the centre of the box).
+    """
+    if 'bbox' in geo:
+        queryset = within_bbox(queryset, *geo['bbox'])
+    if 'radius' in geo:
+        queryset = within_bbox(queryset, *radius_bbox(*geo['point'], geo['radius']))
+
+    if 'point' in geo:
+        origin = geo['point']
+    else:
+        south, west, north, east = geo['bbox']
+        origin = ((south + north) / 2, (west + east) / 2)
+    return with_distance(queryset, *origin, radius_km=geo.get('radius'))
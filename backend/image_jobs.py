@@ -0,0 +1,278 @@
+import io
+import os
+import time
+import logging
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from django.apps import apps
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from django.core.files.base import ContentFile
+from django.contrib.contenttypes.models import ContentType
+from imagekit.utils import generate, suggest_extension
+from pilkit.processors import ProcessorPipeline
+from pilkit.utils import open_image, prepare_image
+from backend.models import *
+from backend.cache import invalidate
+from backend.fields import DeferredProcessedImageField
+from backend.renditions import rendition_image_fields, render_renditions, renditions_field_name, delete_renditions
+
+logger = logging.getLogger(__name__)
+
+def deferred_image_fields(model):
+    return [field for field in model._meta.fields if isinstance(field, DeferredProcessedImageField)]
+
+def enqueue_images(instance, field_names):
+    """Queue a rendition job for each named field of a saved instance."""
+    content_type = ContentType.objects.get_for_model(instance, for_concrete_model=False)
+    ImageJob.objects.bulk_create([
+        ImageJob(
+            content_type=content_type,
+            object_id=instance.pk,
+            field_name=name,
+            source_name=getattr(instance, name).name,
+        )
+        for name in sorted(field_names)
+        if getattr(instance, name)
+    ])
+
+def enqueue_image_jobs(instances, field_name):
+    """Queue the `field_name` job of many saved instances of one model with a single insert."""
+    if not instances:
+        return []
+    content_type = ContentType.objects.get_for_model(instances[0], for_concrete_model=False)
+    return ImageJob.objects.bulk_create([
+        ImageJob(
+            content_type=content_type,
+            object_id=instance.pk,
+            field_name=field_name,
+            source_name=getattr(instance, field_name).name,
+        )
+        for instance in instances
+        if getattr(instance, field_name)
+    ])
+
+def claim_jobs(limit, model=ImageJob, timeout=None):
+    """
+    Atomically move up to `limit` due Pending jobs to Processing and return
+    them. Another worker that races for the same row simply loses it.
+    `model` is the queue table: ImageJob, or ReportJob which has the same
+    state columns.
+    """
+    now = timezone.now()
+    if timeout is None:
+        timeout = getattr(settings, 'IMAGE_JOB_TIMEOUT', 600)
+    # Jobs left Processing by a worker that died go back to the queue
+    model.objects.filter(state='Processing', started_at__lt=now - timedelta(seconds=timeout)).update(state='Pending')
+
+    claimed = []
+    candidates = model.objects.filter(state='Pending', run_after__lte=now).order_by('id')
+    for job_id in candidates.values_list('id', flat=True)[:limit * 2]:
+        updated = model.objects.filter(pk=job_id, state='Pending').update(
+            state='Processing', started_at=now, attempts=F('attempts') + 1,
+        )
+        if updated:
+            claimed.append(job_id)
+        if len(claimed) >= limit:
+            break
+    jobs = model.objects.filter(pk__in=claimed)
+    if model is ImageJob:
+        jobs = jobs.select_related('content_type')
+    return list(jobs)
+
+def encode_spec(spec):
+    """
+    imagekit's generate() for callers on threads. pilkit's save points fd 2
+    at /dev/null and back around each encode, for the whole process: other
+    threads' logs are lost meanwhile, and saves interleaving on threads can
+    leave it at /dev/null for good. Pillow encodes here directly instead.
+    """
+    image = open_image(spec.source)
+    original_format = image.format
+    image = ProcessorPipeline(spec.processors or []).process(image)
+    format = spec.format or image.format or original_format or 'JPEG'
+    options = spec.options or {}
+    if spec.autoconvert:
+        image, save_kwargs = prepare_image(image, format)
+        options = {**save_kwargs, **options}
+    buffer = io.BytesIO()
+    image.save(buffer, format, **options)
+    buffer.seek(0)
+    return buffer
+
+def render_source(field, source, name, threaded=False):
+    """
+    Run the field's processors over an image file; returns (name, content)
+    with `name`'s extension changed to suit the output format. Pass
+    `threaded` when other threads of the process may be running.
+    """
+    spec = field.get_spec(source=source)
+    rendered = encode_spec(spec) if threaded else generate(spec)
+    return os.path.splitext(name)[0] + suggest_extension(name, spec.format), ContentFile(rendered.read())
+
+def render_image(field, source_name):
+    """Run the field's processors over the stored upload; returns (name, content)."""
+    with field.storage.open(source_name) as source:
+        return render_source(field, source, source_name)
+
+def render_job(model_label, field_name, source_name):
+    """
+    Pool entry point: render one upload (and its responsive renditions, if
+    the model keeps them) into new files. Returns (name, renditions).
+    Touches only the storage, never the database.
+    """
+    model = apps.get_model(model_label)
+    field = model._meta.get_field(field_name)
+    name, content = render_image(field, source_name)
+    stored = field.storage.save(name, content)
+    renditions = None
+    if field_name in rendition_image_fields(model):
+        content.seek(0)
+        renditions = render_renditions(field.storage, stored, content.read())
+    return stored, renditions
+
+def job_rows(job):
+    model = job.content_type.model_class()
+    field = model._meta.get_field(job.field_name)
+    rows = model._default_manager.filter(pk=job.object_id, **{job.field_name: job.source_name})
+    return model, field, rows
+
+def start_job(job):
+    """
+    Mark the job's row as Processing and return the render_job() arguments,
+    or None (and close the job) if the row was deleted or re-uploaded since.
+    """
+    model, field, rows = job_rows(job)
+    if not rows.update(**{field.state_field: 'Processing'}):
+        # Deleted, or replaced by a newer upload with its own job
+        ImageJob.objects.filter(pk=job.pk).update(state='Done', finished_at=timezone.now())
+        return None
+    return model._meta.label, job.field_name, job.source_name
+
+def finish_job(job, rendered):
+    """
+    Point the row at the rendered file and renditions. The row is only
+    updated if it still points at the upload the job was queued for, so a
+    newer upload is never overwritten.
+    """
+    stored, renditions = rendered
+    model, field, rows = job_rows(job)
+    changes = {job.field_name: stored, field.state_field: 'Ready'}
+    if renditions is not None:
+        changes[renditions_field_name(job.field_name)] = renditions
+    if any(f.name == 'updated_at' for f in model._meta.fields):
+        changes['updated_at'] = timezone.now()
+    if rows.update(**changes):
+        field.storage.delete(job.source_name)
+        invalidate(model._meta.model_name)
+    else:
+        # Deleted (release_files dropped the upload's reference) or
+        # re-uploaded; an orphaned upload is left to gc_media
+        field.storage.delete(stored)
+        delete_renditions(field.storage, renditions)
+    ImageJob.objects.filter(pk=job.pk).update(state='Done', finished_at=timezone.now(), error=None)
+
+def fail_job(job, error):
+    model, field, rows = job_rows(job)
+    max_attempts = getattr(settings, 'IMAGE_JOB_MAX_ATTEMPTS', 3)
+    if job.attempts < max_attempts:
+        # Retry with a growing delay
+        ImageJob.objects.filter(pk=job.pk).update(
+            state='Pending', error=error,
+            run_after=timezone.now() + timedelta(seconds=30 * 2 ** job.attempts),
+        )
+        rows.update(**{field.state_field: 'Pending'})
+        return
+
+    ImageJob.objects.filter(pk=job.pk).update(state='Failed', error=error, finished_at=timezone.now())
+    # Fall back to serving the unprocessed upload
+    rows.update(**{field.state_field: 'Failed'})
+
+def process_jobs(jobs, pool=None):
+    """
+    Render `jobs` in `pool` (or inline without one), recording each outcome
+    as it completes. Returns a list of (job, ok) pairs.
+    """
+    outcomes, pending = [], {}
+
+    def failed(job, error):
+        logger.error("Image job %s failed: %s", job.pk, error, exc_info=error)
+        fail_job(job, f"{type(error).__name__}: {error}")
+        outcomes.append((job, False))
+
+    def finished(job, render):
+        try:
+            finish_job(job, render())
+        except Exception as error:
+            return failed(job, error)
+        outcomes.append((job, True))
+
+    for job in jobs:
+        try:
+            arguments = start_job(job)
+        except Exception as error:
+            failed(job, error)
+            continue
+        if arguments is None:
+            outcomes.append((job, True))
+        elif pool is None:
+            finished(job, lambda: render_job(*arguments))
+        else:
+            pending[pool.submit(render_job, *arguments)] = job
+
+    for future in as_completed(pending):
+        finished(pending[future], future.result)
+    return outcomes
+
+def working_pool(pool, workers):
+    """
+    `pool`, or a new one if a worker process died (killed for memory, or a
+    decoder crash), which breaks the pool for every later job.
+    """
+    try:
+        pool.submit(int).result()
+    except BrokenProcessPool:
+        logger.warning("An image worker process died; starting a new pool")
+        pool.shutdown(wait=False)
+        return ProcessPoolExecutor(max_workers=workers)
+    return pool
+
+def run_workers(workers=None, once=False, poll_interval=2.0, stdout=None, claim=claim_jobs, process=process_jobs):
+    """
+    Process the queue, decoding/resizing/encoding in a pool of `workers`
+    processes while this process claims jobs and updates the rows
+    (workers=0 renders inline). With `once`, stop when no job is due;
+    otherwise poll every `poll_interval` seconds. Other queues pass their
+    own `claim(limit)` and `process(jobs, pool)`.
+    The pool is replaced after a batch with failures if a worker process
+    died; its jobs were recorded as failed and retry like any other.
+    Returns (succeeded, failed) counts.
+    """
+    if workers is None:
+        workers = getattr(settings, 'IMAGE_JOB_WORKERS', os.cpu_count() or 2)
+    succeeded = failed = 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+    try:
+        while True:
+            jobs = claim(max(workers, 1) * 2)
+            if not jobs:
+                if once:
+                    break
+                time.sleep(poll_interval)
+                continue
+            outcomes = process(jobs, pool)
+            for job, ok in outcomes:
+                if ok:
+                    succeeded += 1
+                else:
+                    failed += 1
+                if stdout:
+                    stdout.write(f"{'done' if ok else 'failed'}: {job}")
+            if pool is not None and not all(ok for job, ok in outcomes):
+                pool = working_pool(pool, workers)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return succeeded, failed
@@ -0,0 +1,39 @@
+from django.utils import timezone
+from django.core.management.base import BaseCommand
+from backend.models import *
+from backend.clusters import rebuild_clusters
+
+class Command(BaseCommand):
+    help = "Parse coordinates from each property's map embed/location and refresh latitude, longitude and geohash."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        fields = ['latitude', 'longitude', 'geohash', 'updated_at']
+        batch, updated, missing = [], 0, 0
+
+        properties = Property.objects.only('id', 'location', 'map_embed', *fields)
+        for prop in properties.iterator(chunk_size=batch_size):
+            before = (prop.latitude, prop.longitude, prop.geohash)
+            prop.update_coordinates()
+            if prop.geohash is None:
+                missing += 1
+            if (prop.latitude, prop.longitude, prop.geohash) != before:
+                prop.updated_at = timezone.now()
+                batch.append(prop)
+            if len(batch) >= batch_size:
+                Property.objects.bulk_update(batch, fields)
+                updated += len(batch)
+                batch = []
+        if batch:
+            Property.objects.bulk_update(batch, fields)
+            updated += len(batch)
+        if updated:
+            # bulk_update skips the signals that keep map clusters current
+            rebuild_clusters()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Updated coordinates for {updated} properties; {missing} have no parseable location."
+        ))
@@ -0,0 +1,34 @@
+from backend.backfill import ImageBackfillCommand
+from backend.renditions import renditions_field_name, stored_placeholder
+
+class Command(ImageBackfillCommand):
+    help = (
+        "Add the blurred inline placeholder to images whose renditions were rendered without one. "
+        "Images with no renditions yet get theirs from backfill_renditions."
+    )
+    function = staticmethod(stored_placeholder)
+    errors = (OSError, KeyError)
+    failure_message = "Could not render a placeholder for {name}: {error}"
+    force_help = "Recompute placeholders that already exist."
+
+    def candidates(self, model, field):
+        column = renditions_field_name(field.name)
+        rows = model._default_manager.exclude(**{column: {}})
+        for pk, name, renditions in rows.order_by('pk').values_list('pk', field.name, column).iterator(chunk_size=self.batch_size):
+            if not renditions or renditions.get('source') != name or not renditions.get('files'):
+                continue
+            if renditions.get('placeholder') and not self.force:
+                self.skipped += 1
+                continue
+            yield pk, name, renditions
+
+    def arguments(self, model, field, name, renditions):
+        return model._meta.label, field.name, renditions
+
+    def store(self, model, field, pk, name, renditions, placeholder):
+        # Only if the row still has the image the placeholder was made from
+        column = renditions_field_name(field.name)
+        return bool(model._default_manager.filter(pk=pk, **{field.name: name}).update(**{column: {**renditions, 'placeholder': placeholder}}))
+
+    def summary(self):
+        return f"Added {self.rendered} placeholders; {self.skipped} already present, {self.failed} failed."
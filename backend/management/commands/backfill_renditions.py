@@ -0,0 +1,34 @@
+from backend.backfill import ImageBackfillCommand
+from backend.renditions import renditions_field_name, render_stored_renditions, delete_renditions
+
+class Command(ImageBackfillCommand):
+    help = "Generate the responsive renditions of existing category, property and gallery images."
+    function = staticmethod(render_stored_renditions)
+
+    def candidates(self, model, field):
+        column = renditions_field_name(field.name)
+        rows = model._default_manager.exclude(**{f'{field.name}__isnull': True}).exclude(**{field.name: ''})
+        state_field = getattr(field, 'state_field', None)
+        if state_field:
+            # Images still in the job queue get their renditions from the job
+            rows = rows.filter(**{state_field: 'Ready'})
+
+        for pk, name, renditions in rows.order_by('pk').values_list('pk', field.name, column).iterator(chunk_size=self.batch_size):
+            if not self.force and (renditions or {}).get('source') == name:
+                self.skipped += 1
+                continue
+            yield pk, name, renditions
+
+    def arguments(self, model, field, name, renditions):
+        return model._meta.label, field.name, name
+
+    def store(self, model, field, pk, name, old, new):
+        # Only if the row still has the image that was rendered
+        if model._default_manager.filter(pk=pk, **{field.name: name}).update(**{renditions_field_name(field.name): new}):
+            delete_renditions(field.storage, old)
+            return True
+        delete_renditions(field.storage, new)
+        return False
+
+    def summary(self):
+        return f"Rendered {self.rendered} images; {self.skipped} already up to date, {self.failed} failed."
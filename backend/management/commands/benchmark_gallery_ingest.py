@@ -0,0 +1,74 @@
+import io
+import time
+import shutil
+import tempfile
+from PIL import Image, ImageDraw
+from django.db import transaction
+from django.test import override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from backend.models import *
+from backend.gallery import ingest_gallery, ingest_workers
+
+class Rollback(Exception):
+    pass
+
+class Command(BaseCommand):
+    help = (
+        "Compare the wall-clock time of adding N gallery images one "
+        "PropertyImage.objects.create() at a time with ingest_gallery(). "
+        "Runs against a temporary MEDIA_ROOT and rolls back its rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--counts', type=int, nargs='+', default=[10, 30, 100])
+        parser.add_argument('--size', default='3000x2000', help="Width x height of each upload.")
+        parser.add_argument('--deferred', action='store_true', help="Leave resizing to the image job queue (IMAGE_PROCESSING_ASYNC) in both paths.")
+
+    def handle(self, *args, **options):
+        width, height = (int(part) for part in options['size'].lower().split('x'))
+        photo = self.sample_photo(width, height)
+        media_root = tempfile.mkdtemp(prefix='gallery-benchmark-')
+        try:
+            with override_settings(MEDIA_ROOT=media_root, IMAGE_PROCESSING_ASYNC=options['deferred']):
+                self.stdout.write(
+                    f"{width}x{height} JPEG uploads ({len(photo) // 1024} KB), "
+                    f"{'deferred processing' if options['deferred'] else f'inline processing, up to {ingest_workers()} worker threads'}"
+                )
+                self.stdout.write(f"{'images':>8} {'loop (s)':>10} {'ingest (s)':>11} {'speedup':>8}")
+                for count in options['counts']:
+                    loop = self.measure(count, photo, self.loop)
+                    bulk = self.measure(count, photo, self.ingest)
+                    self.stdout.write(f"{count:>8} {loop:>10.2f} {bulk:>11.2f} {loop / bulk:>7.1f}x")
+        finally:
+            shutil.rmtree(media_root, ignore_errors=True)
+
+    def sample_photo(self, width, height):
+        """A JPEG with enough detail to cost about as much to decode as a photo."""
+        image = Image.effect_noise((width, height), 48).convert('RGB')
+        draw = ImageDraw.Draw(image)
+        for step in range(0, width, 40):
+            draw.line([(step, 0), (width - step, height)], fill=(step % 255, 120, 200), width=9)
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=90)
+        return buffer.getvalue()
+
+    def measure(self, count, photo, run):
+        uploads = [SimpleUploadedFile(f'photo_{index}.jpg', photo, content_type='image/jpeg') for index in range(count)]
+        try:
+            with transaction.atomic():
+                prop = Property.objects.create(name='Gallery benchmark', description='Benchmark')
+                start = time.perf_counter()
+                run(prop, uploads)
+                elapsed = time.perf_counter() - start
+                raise Rollback
+        except Rollback:
+            return elapsed
+
+    def loop(self, prop, uploads):
+        for upload in uploads:
+            PropertyImage.objects.create(property=prop, image=upload)
+
+    def ingest(self, prop, uploads):
+        images, failures = ingest_gallery(prop, uploads)
+        assert not failures, failures
@@ -0,0 +1,80 @@
+import io
+import time
+import statistics
+from datetime import date
+from decimal import Decimal
+from django.core.management.base import BaseCommand, CommandError
+from backend.models import *
+from backend.utils.pdf_reports import contract_report_lines, render_report
+from backend.utils.report_layout import ReportDocTemplate, text_blocks
+
+CLAUSES = (
+    "The tenant shall keep the premises clean and in good repair and shall notify the agent in writing of any damage or defect within seven days of discovering it.",
+    "Rent is payable monthly in advance on the first day of each month; a payment more than ten days late incurs a fee of five percent of the monthly rent.",
+    "The security deposit is returned within thirty days of the end of the tenancy, less the cost of repairing damage beyond normal wear and tear.",
+    "No structural alterations, repainting or additional fixtures may be made without the prior written consent of the agent.",
+    "The agent may inspect the premises at reasonable times on giving the tenant at least twenty-four hours notice, except in an emergency.",
+)
+
+class Command(BaseCommand):
+    help = (
+        "Time render_report() on a contract whose additional terms run to N pages. "
+        "Builds the contract in memory; touches neither the database nor the report cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, default=20)
+        parser.add_argument('--repeat', type=int, default=20, help="Timed renders (after one untimed warm-up).")
+        parser.add_argument('--budget', type=float, default=100.0, help="Fail if the median render takes longer, in milliseconds.")
+
+    def handle(self, *args, **options):
+        clauses, lines, pages = self.contract_lines(options['pages'])
+        # Font metrics and reportlab's module state load on first use
+        size = len(render_report(lines).getvalue())
+
+        timings = []
+        for run in range(options['repeat']):
+            start = time.perf_counter()
+            render_report(lines)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        median = statistics.median(timings)
+        self.stdout.write(f"Contract with {clauses} clauses: {pages} pages, {size // 1024} KB")
+        self.stdout.write(f"{'runs':>6} {'min (ms)':>9} {'median (ms)':>12} {'max (ms)':>9} {'per page (ms)':>14}")
+        self.stdout.write(
+            f"{len(timings):>6} {min(timings):>9.1f} {median:>12.1f} {max(timings):>9.1f} {median / pages:>14.2f}"
+        )
+        if median > options['budget']:
+            raise CommandError(f"Median render of {median:.1f} ms is over the {options['budget']:.0f} ms budget.")
+
+    def contract_lines(self, target):
+        """(clauses, report lines, pages) for a contract whose report reaches `target` pages."""
+        clauses, pages = target, 0
+        while pages < target:
+            # Grow in proportion to the pages still missing
+            clauses += max(1, clauses * (target - pages) // max(pages, 1)) if pages else 0
+            lines = contract_report_lines(self.contract(clauses))
+            pages = self.page_count(lines)
+        return clauses, lines, pages
+
+    def contract(self, clauses):
+        return Contract(
+            tenant=User(name="Benchmark Tenant", email='tenant@example.com'),
+            agent=User(name="Benchmark Agent", email='agent@example.com'),
+            property=Property(name="Benchmark Residence"),
+            contract_number='BENCH-0001',
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+            rental_period_months=12,
+            rent_amount=Decimal('850.00'),
+            security_deposit=Decimal('1700.00'),
+            status='Active',
+            additional_terms='\n'.join(
+                f"{index + 1}. {CLAUSES[index % len(CLAUSES)]}" for index in range(clauses)
+            ),
+        )
+
+    def page_count(self, lines):
+        document = ReportDocTemplate(io.BytesIO(), title=lines[0][0])
+        document.build(text_blocks(lines))
+        return document.page
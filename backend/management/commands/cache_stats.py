@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from backend.cache import response_cache_stats
+
+class Command(BaseCommand):
+    help = "Show response cache hits, misses, hit ratio and invalidations per model (set CACHE_DIR so that the counts are shared with the web processes)."
+
+    def handle(self, *args, **options):
+        stats = response_cache_stats()
+        ratio = 'n/a' if stats['hit_ratio'] is None else f"{stats['hit_ratio']:.1%}"
+        self.stdout.write(f"Hits: {stats['hits']}  Misses: {stats['misses']}  Hit ratio: {ratio}")
+        self.stdout.write("Invalidations:")
+        for namespace, count in stats['invalidations'].items():
+            self.stdout.write(f"  {namespace}: {count}")
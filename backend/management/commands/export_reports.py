@@ -0,0 +1,49 @@
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from backend.reports import export_queryset, export_reports, zip_reports
+
+class Command(BaseCommand):
+    help = (
+        "Write a ZIP of application or contract PDF reports, rendered in a process pool "
+        "(cached reports are reused)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help="ZIP file to write ('-' for stdout).")
+        parser.add_argument('--kind', choices=['application', 'contract'], default='application')
+        parser.add_argument('--property', type=int, default=None, help="Only this property's reports.")
+        parser.add_argument('--month', default=None, help="Only those created in this month (YYYY-MM).")
+        parser.add_argument('--status', default=None)
+        parser.add_argument('--workers', type=int, default=None, help="Worker processes (default REPORT_JOB_WORKERS; 0 renders inline).")
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        if workers is None:
+            workers = getattr(settings, 'REPORT_JOB_WORKERS', 2)
+        kind = options['kind'].capitalize()
+        try:
+            objects = export_queryset(kind, options['property'], options['month'], options['status'])
+        except ValueError:
+            raise CommandError("--month must look like 2025-05.")
+
+        files = written = 0
+        pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+        output = sys.stdout.buffer if options['output'] == '-' else open(options['output'], 'wb')
+        try:
+            def counted(pairs):
+                nonlocal files
+                for pair in pairs:
+                    files += 1
+                    yield pair
+            for chunk in zip_reports(counted(export_reports(kind, objects, pool, workers=workers))):
+                output.write(chunk)
+                written += len(chunk)
+        finally:
+            if output is not sys.stdout.buffer:
+                output.close()
+            if pool is not None:
+                pool.shutdown()
+
+        self.stderr.write(self.style.SUCCESS(f"Exported {files} {options['kind']} reports ({written} bytes)."))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from backend.image_jobs import run_workers
+
+class Command(BaseCommand):
+    help = "Run the image processing worker pool over the ImageJob queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None, help="Worker processes (default IMAGE_JOB_WORKERS; 0 renders inline).")
+        parser.add_argument('--once', action='store_true', help="Exit once no job is due instead of polling.")
+        parser.add_argument('--poll-interval', type=float, default=2.0)
+
+    def handle(self, *args, **options):
+        succeeded, failed = run_workers(
+            workers=options['workers'],
+            once=options['once'],
+            poll_interval=options['poll_interval'],
+            stdout=self.stdout,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Processed {succeeded} images; {failed} failed."))
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from backend.image_jobs import run_workers
+from backend.reports import claim_report_jobs, process_report_jobs
+
+class Command(BaseCommand):
+    help = "Run the PDF report worker pool over the ReportJob queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None, help="Worker processes (default REPORT_JOB_WORKERS; 0 renders inline).")
+        parser.add_argument('--once', action='store_true', help="Exit once no job is due instead of polling.")
+        parser.add_argument('--poll-interval', type=float, default=1.0)
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        if workers is None:
+            workers = getattr(settings, 'REPORT_JOB_WORKERS', 2)
+        succeeded, failed = run_workers(
+            workers=workers,
+            once=options['once'],
+            poll_interval=options['poll_interval'],
+            stdout=self.stdout,
+            claim=claim_report_jobs,
+            process=process_report_jobs,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rendered {succeeded} reports; {failed} failed."))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from backend.clusters import rebuild_clusters
+
+class Command(BaseCommand):
+    help = "Recompute every PropertyCluster (map cluster aggregates) from the located properties."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        count = rebuild_clusters(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} property clusters."))
@@ -0,0 +1,31 @@
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.core.management.base import BaseCommand
+from backend.models import *
+
+class Command(BaseCommand):
+    help = "Recompute every PropertyRatingSummary from the active PropertyReview rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        aggregates = {'review_count': Count('propertyreview', filter=Q(propertyreview__status=True))}
+        for field in REVIEW_RATING_FIELDS:
+            active = Q(propertyreview__status=True, **{f'propertyreview__{field}__isnull': False})
+            aggregates[f'{field}_sum'] = Sum(f'propertyreview__{field}', filter=active)
+            aggregates[f'{field}_count'] = Count(f'propertyreview__{field}', filter=active)
+
+        summaries = []
+        for row in Property.objects.order_by().values('id').annotate(**aggregates).iterator():
+            summary = PropertyRatingSummary(property_id=row.pop('id'))
+            for name, value in row.items():
+                setattr(summary, name, value or 0)
+            summary.overall_rating = summary.compute_overall_rating()
+            summaries.append(summary)
+
+        with transaction.atomic():
+            PropertyRatingSummary.objects.all().delete()
+            PropertyRatingSummary.objects.bulk_create(summaries, batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rating summaries for {len(summaries)} properties."))
@@ -0,0 +1,16 @@
+from django.db import connection, transaction
+from django.core.management.base import BaseCommand
+from backend.models import *
+from backend.search import get_search_backend
+
+class Command(BaseCommand):
+    help = "Drop and rebuild the property full-text search index."
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        with transaction.atomic(), connection.cursor() as cursor:
+            backend.rebuild(cursor)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {connection.vendor} search index over {Property.objects.count()} properties."
+        ))
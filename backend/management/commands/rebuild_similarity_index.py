@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from backend.similarity import similarity_index
+
+class Command(BaseCommand):
+    help = "Re-encode every property into the memory-mapped similar-properties matrix."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        count = similarity_index.rebuild(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Encoded {count} properties into {similarity_index.path}."
+        ))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+from backend.counters import reconcile_counters
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the dashboard counters from the applications, contracts, properties and users, "
+        "list every counter that drifted and correct it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help="Only report drift, and exit with an error if there is any.")
+
+    def handle(self, *args, **options):
+        drift = reconcile_counters(fix=not options['check'])
+        for (scope, owner_id, metric, status), stored, expected in drift:
+            owner = f"#{owner_id}" if owner_id else ''
+            self.stdout.write(f"{scope}{owner} {metric}[{status}]: stored {stored}, expected {expected}")
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Dashboard counters are in sync."))
+        elif options['check']:
+            raise CommandError(f"{len(drift)} dashboard counters drifted.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Corrected {len(drift)} dashboard counters."))
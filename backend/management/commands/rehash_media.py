@@ -0,0 +1,132 @@
+import os
+from django.apps import apps
+from django.db.models import FileField
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from backend.models import *
+from backend.renditions import rendition_image_fields, renditions_field_name
+from backend.storage import ContentAddressedStorage, content_name, content_namespace, file_digest, is_content_addressed
+
+class Command(BaseCommand):
+    help = (
+        "Move existing media to content-addressed names (merging identical files) "
+        "and point every file field, rendition set and queued image job at them. "
+        "Run with the process_images workers stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help="Only report what would be moved.")
+        parser.add_argument('--keep-originals', action='store_true', help="Leave the old files in place.")
+
+    def handle(self, *args, **options):
+        self.storage = default_storage
+        if not isinstance(self.storage, ContentAddressedStorage):
+            raise CommandError("DEFAULT_FILE_STORAGE is not backend.storage.ContentAddressedStorage.")
+        self.dry_run = options['dry_run']
+        self.batch_size = options['batch_size']
+
+        # Old name -> new name, and saves not yet matched to a referencing row
+        self.mapping, self.unclaimed = {}, {}
+        self.rows = self.missing = 0
+
+        for model in apps.get_models():
+            for field in model._meta.fields:
+                if isinstance(field, FileField) and field.storage is self.storage:
+                    self.rehash_field(model, field)
+        for model in apps.get_models():
+            for field_name in rendition_image_fields(model):
+                self.rehash_renditions(model, field_name)
+        self.rehash_jobs()
+
+        if not self.dry_run and not options['keep_originals']:
+            for old in self.mapping:
+                self.storage.delete(old)
+
+        merged = len(self.mapping) - len(set(self.mapping.values()))
+        verb = "Would move" if self.dry_run else "Moved"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {len(self.mapping)} files to {len(set(self.mapping.values()))} content-addressed names "
+            f"({merged} duplicates merged); {self.rows} rows updated, {self.missing} referenced files missing."
+        ))
+
+    def rehash(self, old):
+        """The content-addressed name for `old`, storing it on first sight; None if missing."""
+        if old in self.mapping:
+            return self.mapping[old]
+        if not self.storage.exists(old):
+            self.missing += 1
+            self.stderr.write(f"Missing: {old}")
+            return None
+        with self.storage.open(old, 'rb') as content:
+            if self.dry_run:
+                new = content_name(file_digest(content), os.path.splitext(old)[1], content_namespace(old))
+            else:
+                new = self.storage.save(old, content)
+                self.unclaimed[old] = 1
+        self.mapping[old] = new
+        return new
+
+    def claim(self, old, count):
+        """Give `count` rows that now point at old's new name a reference each."""
+        references = count - self.unclaimed.pop(old, 0)
+        if references and not self.dry_run:
+            new = self.mapping[old]
+            with self.storage.locked(new):
+                self.storage.add_reference(new, references)
+
+    def rehash_field(self, model, field):
+        rows = model._default_manager.exclude(**{f'{field.name}__isnull': True}).exclude(**{field.name: ''})
+        names = list(rows.order_by().values_list(field.name, flat=True).distinct())
+        for old in names:
+            if is_content_addressed(old):
+                continue
+            new = self.rehash(old)
+            if new is None:
+                continue
+            if self.dry_run:
+                updated = rows.filter(**{field.name: old}).count()
+            else:
+                updated = rows.filter(**{field.name: old}).update(**{field.name: new})
+            self.claim(old, updated)
+            self.rows += updated
+
+    def rehash_renditions(self, model, field_name):
+        column = renditions_field_name(field_name)
+        rows = model._default_manager.exclude(**{column: {}}).only('pk', column).order_by('pk')
+        batch = []
+        for instance in rows.iterator(chunk_size=self.batch_size):
+            renditions = getattr(instance, column) or {}
+            changed = False
+            for formats in renditions.get('files', {}).values():
+                for key, old in formats.items():
+                    new = None if is_content_addressed(old) else self.rehash(old)
+                    if new is not None:
+                        formats[key] = new
+                        self.claim(old, 1)
+                        changed = True
+            if renditions.get('source') in self.mapping:
+                renditions['source'] = self.mapping[renditions['source']]
+                changed = True
+            if changed:
+                batch.append(instance)
+            if len(batch) >= self.batch_size:
+                self.save_renditions(model, column, batch)
+                batch = []
+        if batch:
+            self.save_renditions(model, column, batch)
+
+    def save_renditions(self, model, column, batch):
+        if not self.dry_run:
+            model._default_manager.bulk_update(batch, [column])
+        self.rows += len(batch)
+
+    def rehash_jobs(self):
+        # Queued jobs name the raw upload they render; it moved with its row
+        jobs = ImageJob.objects.filter(state__in=['Pending', 'Processing']).only('pk', 'source_name')
+        moved = [job for job in jobs if job.source_name in self.mapping]
+        for job in moved:
+            job.source_name = self.mapping[job.source_name]
+        if moved and not self.dry_run:
+            ImageJob.objects.bulk_update(moved, ['source_name'], batch_size=self.batch_size)
+        self.rows += len(moved)
@@ -1,3 +1,5 @@
+from django.db import models
+from django.db.models import F
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.models import BaseUserManager
 
@@ -21,3 +23,22 @@ class CustomUserManager(BaseUserManager):
             raise ValueError(_('Superuser must have is_superuser=True.'))
 
         return self.create_user(email, name, phone_number, password, **extra_fields)
+
+REVIEW_RATING_FIELDS = (
+    'location', 'staff', 'cleanliness', 'value_for_money',
+    'comfort', 'facilities', 'free_wifi',
+)
+
+class PropertyQuerySet(models.QuerySet):
+    def with_rating_summary(self):
+        """
+        Join the denormalized PropertyRatingSummary so review data can be
+        read without a query per property.
+        """
+        return self.select_related('rating_summary')
+
+    def order_by_rating(self):
+        """
+        Highest overall rating first; unrated properties sort last.
+        """
+        return self.order_by(F('rating_summary__overall_rating').desc(nulls_last=True), '-created_at')
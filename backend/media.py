@@ -0,0 +1,190 @@
+import os
+import re
+import hashlib
+import mimetypes
+from urllib.parse import quote
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.http import FileResponse, HttpResponse, Http404
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from django.core.exceptions import PermissionDenied, SuspiciousFileOperation
+from users.models import *
+from backend.cache import cache_versions
+from backend.storage import is_content_addressed, is_bookkeeping, immutable_max_age
+
+# Files that only the people allowed to see their rent application may
+# fetch: the applicant, the provider of the property and admins
+PROTECTED_MEDIA_FIELDS = ('id_number_image', 'applicant_image')
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+def media_viewers(name):
+    """
+    The ids of the users allowed to fetch `name`, or None when it is
+    public. Cached until a rent application or property changes.
+    """
+    key = f"media-access:{cache_versions('rentapplication', 'property')}:{hashlib.md5(name.encode('utf-8')).hexdigest()}"
+    viewers = cache.get(key)
+    if viewers is None:
+        lookup = Q()
+        for field in PROTECTED_MEDIA_FIELDS:
+            lookup |= Q(**{field: name})
+        pairs = list(RentApplication.objects.filter(lookup).values_list('user_id', 'property__created_by_id'))
+        viewers = sorted({user for pair in pairs for user in pair if user is not None}) if pairs else 'public'
+        cache.set(key, viewers, timeout=None)
+    return None if viewers == 'public' else set(viewers)
+
+def check_media_access(request, name):
+    viewers = media_viewers(name)
+    if viewers is None:
+        return False
+    user = request.user
+    if not (user.is_authenticated and (user.is_admin or user.pk in viewers)):
+        raise PermissionDenied("You do not have permission to view this file.")
+    return True
+
+def media_etag(name, stat):
+    if is_content_addressed(name):
+        # The name is the hash of the bytes
+        return quote_etag(os.path.splitext(os.path.basename(name))[0])
+    return quote_etag(f'{stat.st_mtime_ns:x}-{stat.st_size:x}')
+
+def requested_range(request, size, etag, last_modified):
+    """
+    (start, length) for a satisfiable single-range GET, 'unsatisfiable',
+    or None to send the whole file (no Range, several ranges, or an
+    If-Range that no longer matches).
+    """
+    header = request.META.get('HTTP_RANGE', '').strip()
+    if not header or request.method != 'GET':
+        return None
+    if_range = request.META.get('HTTP_IF_RANGE', '').strip()
+    if if_range and if_range != etag and parse_http_date_safe(if_range) != last_modified:
+        return None
+    match = RANGE_RE.match(header)
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or (last and int(last) < start):
+            return 'unsatisfiable'
+    else:
+        suffix = int(last)
+        if not suffix:
+            return 'unsatisfiable'
+        start, end = max(size - suffix, 0), size - 1
+    return start, end - start + 1
+
+
+class RangeFile:
+    """
+    A window of `length` bytes from `start` in an open file. It keeps the
+    real file descriptor behind fileno(), so a WSGI server's
+    wsgi.file_wrapper (gunicorn, uWSGI) can send it with os.sendfile()
+    from the current offset for Content-Length bytes.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.name = file.name
+        self.remaining = length
+        file.seek(start)
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+def offload_response(path, name, prefix=None):
+    """
+    An empty response that hands the file to the front proxy, if one is
+    configured. `name` is relative to the internal location at `prefix`
+    (MEDIA_ACCEL_REDIRECT_PREFIX by default).
+    """
+    offload = getattr(settings, 'MEDIA_OFFLOAD', None)
+    if offload == 'x-accel-redirect':
+        if prefix is None:
+            prefix = getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', '/_media/')
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = prefix + quote(name)
+        return response
+    if offload == 'x-sendfile':
+        response = HttpResponse()
+        response['X-Sendfile'] = path
+        return response
+    return None
+
+def media_response(request, name):
+    """
+    Serve the media file `name`:
+
+    - rent application images only to the users allowed to see the
+      application;
+    - conditional GETs answered with 304 from the ETag (the content hash
+      for content-addressed names) and Last-Modified;
+    - handed to nginx (X-Accel-Redirect) or Apache/lighttpd (X-Sendfile)
+      when MEDIA_OFFLOAD is set, which then also handle Range;
+    - otherwise streamed from the file descriptor, honouring single byte
+      ranges with 206/416.
+    """
+    try:
+        path = safe_join(settings.MEDIA_ROOT, name)
+    except SuspiciousFileOperation:
+        raise Http404("Not found.")
+    name = os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, '/')
+    if is_bookkeeping(name) or not os.path.isfile(path):
+        raise Http404("Not found.")
+
+    protected = check_media_access(request, name)
+    stat = os.stat(path)
+    etag = media_etag(name, stat)
+    last_modified = int(stat.st_mtime)
+
+    if protected:
+        cache_control = 'private, no-store'
+    elif is_content_addressed(name):
+        cache_control = f'public, max-age={immutable_max_age()}, immutable'
+    else:
+        # Legacy names can be re-used for new bytes; revalidate every time
+        cache_control = 'public, no-cache'
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = offload_response(path, name)
+    if response is None:
+        byte_range = requested_range(request, stat.st_size, etag, last_modified)
+        if byte_range == 'unsatisfiable':
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+        else:
+            start, length = byte_range or (0, stat.st_size)
+            if request.method == 'HEAD':
+                response = HttpResponse()
+            else:
+                response = FileResponse(RangeFile(open(path, 'rb'), start, length))
+            response['Content-Length'] = length
+            if byte_range:
+                response.status_code = 206
+                response['Content-Range'] = f'bytes {start}-{start + length - 1}/{stat.st_size}'
+        response['Accept-Ranges'] = 'bytes'
+
+    if response.status_code in (200, 206):
+        response['Content-Type'] = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = cache_control
+    response['X-Content-Type-Options'] = 'nosniff'
+    return response
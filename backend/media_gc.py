@@ -0,0 +1,93 @@
+import os
+import hashlib
+import numpy as np
+from django.apps import apps
+from django.db.models import FileField
+from backend.models import *
+from backend.renditions import rendition_image_fields, renditions_field_name
+
+def name_key(name):
+    """A 64-bit key for a media name."""
+    return int.from_bytes(hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def referenced_names(chunk_size=2000):
+    """
+    Every media name the database refers to, streamed with chunked
+    values_list queries: all file/image fields, the rendition sets and the
+    uploads of queued image jobs. Names may repeat.
+    """
+    for model in apps.get_models():
+        manager = model._default_manager
+        for field in model._meta.fields:
+            if isinstance(field, FileField):
+                rows = manager.exclude(**{f'{field.name}__isnull': True}).exclude(**{field.name: ''})
+                yield from rows.values_list(field.name, flat=True).iterator(chunk_size=chunk_size)
+        for field_name in rendition_image_fields(model):
+            column = renditions_field_name(field_name)
+            for renditions in manager.exclude(**{column: {}}).values_list(column, flat=True).iterator(chunk_size=chunk_size):
+                for formats in (renditions or {}).get('files', {}).values():
+                    yield from formats.values()
+    jobs = ImageJob.objects.filter(state__in=['Pending', 'Processing'])
+    yield from jobs.values_list('source_name', flat=True).iterator(chunk_size=chunk_size)
+
+def referenced_keys(chunk_size=2000):
+    """
+    The sorted, unique name_key() of every referenced name: 8 bytes per
+    file however long the names are. A key collision can only make an
+    unreferenced file look referenced, never the reverse.
+    """
+    chunks, buffer = [], []
+    for name in referenced_names(chunk_size):
+        buffer.append(name_key(name))
+        if len(buffer) >= chunk_size * 50:
+            chunks.append(np.unique(np.array(buffer, dtype=np.uint64)))
+            buffer = []
+    chunks.append(np.array(buffer, dtype=np.uint64))
+    return np.unique(np.concatenate(chunks))
+
+def is_referenced(name):
+    """
+    Whether the database refers to `name` right now; the one-name re-check
+    gc_media makes under a blob's lock, after the referenced_keys() snapshot.
+    """
+    for model in apps.get_models():
+        manager = model._default_manager
+        for field in model._meta.fields:
+            if isinstance(field, FileField) and manager.filter(**{field.name: name}).exists():
+                return True
+        for field_name in rendition_image_fields(model):
+            if manager.filter(**{f'{renditions_field_name(field_name)}__icontains': name}).exists():
+                return True
+    return ImageJob.objects.filter(state__in=['Pending', 'Processing'], source_name=name).exists()
+
+def referenced(keys, names):
+    """A boolean array telling which of `names` have their key in `keys`."""
+    wanted = np.array([name_key(name) for name in names], dtype=np.uint64)
+    if not len(keys):
+        return np.zeros(len(wanted), dtype=bool)
+    positions = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+    return keys[positions] == wanted
+
+def walk_media(root, exclude=()):
+    """
+    Yield (name, os.DirEntry) for each file below `root`, names relative
+    and '/'-separated as stored in file fields. Directories are scanned one
+    at a time rather than listed up front; those in `exclude` (absolute
+    paths) are skipped.
+    """
+    exclude = {os.path.abspath(path) for path in exclude}
+    pending = ['']
+    while pending:
+        relative = pending.pop()
+        try:
+            entries = os.scandir(os.path.join(root, relative))
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                name = f'{relative}/{entry.name}' if relative else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if os.path.abspath(entry.path) not in exclude:
+                        pending.append(name)
+                elif entry.is_file(follow_symlinks=False):
+                    yield name, entry
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from backend.models import *
+from backend.counters import GLOBAL, PROVIDER, TENANT, counter_values
+
+@dataclass(frozen=True)
+class TenantMetrics:
+    """A tenant's applications by status and contracts, for users.views.dashboard and the dashboard API."""
+    total_applications: int
+    pending_applications: int
+    accepted_applications: int
+    rejected_applications: int
+    moved_out_applications: int
+    total_contracts: int
+    active_contracts: int
+    overdue_contracts: int
+
+    @property
+    def status_labels(self):
+        return [label for value, label in RentApplication.STATUS_CHOICES]
+
+    @property
+    def status_data(self):
+        return [
+            self.pending_applications, self.accepted_applications,
+            self.rejected_applications, self.moved_out_applications,
+        ]
+
+@dataclass(frozen=True)
+class OverviewMetrics:
+    """
+    Site-wide ('admin') or one house provider's ('provider') numbers for
+    backend.views.dashboard. The status counts are {'status', 'count'}
+    dicts in STATUS_CHOICES order, zeros included, ready for Chart.js.
+    """
+    dashboard_type: str
+    total_properties: int
+    total_applications: int
+    app_status_counts: list
+    total_contracts: int
+    contract_status_counts: list
+    total_users: int = None
+    total_providers: int = None
+
+def status_counts(counts, metric, choices):
+    """(total, [{'status', 'count'}] per choice) of one metric of counter_values()."""
+    total = sum(value for (name, status), value in counts.items() if name == metric)
+    return total, [{'status': value, 'count': counts.get((metric, value), 0)} for value, label in choices]
+
+def tenant_metrics(user):
+    """`user`'s dashboard numbers, from their Tenant counters (one query)."""
+    counts = counter_values(TENANT, user.pk)
+    return TenantMetrics(
+        total_applications=status_counts(counts, 'applications', RentApplication.STATUS_CHOICES)[0],
+        pending_applications=counts.get(('applications', 'Pending'), 0),
+        accepted_applications=counts.get(('applications', 'Accepted'), 0),
+        rejected_applications=counts.get(('applications', 'Rejected'), 0),
+        moved_out_applications=counts.get(('applications', 'Moved Out'), 0),
+        total_contracts=status_counts(counts, 'contracts', Contract.STATUS_CHOICES)[0],
+        active_contracts=counts.get(('contracts', 'Active'), 0),
+        overdue_contracts=counts.get(('payments', 'Overdue'), 0),
+    )
+
+def overview_metrics(user):
+    """
+    The backend dashboard's numbers: the Global counters for admins, the
+    house provider's own (their properties and those properties'
+    applications and contracts) otherwise. One query either way.
+    """
+    admin = user.is_admin
+    counts = counter_values(GLOBAL) if admin else counter_values(PROVIDER, user.pk)
+    total_applications, app_status_counts = status_counts(counts, 'applications', RentApplication.STATUS_CHOICES)
+    total_contracts, contract_status_counts = status_counts(counts, 'contracts', Contract.STATUS_CHOICES)
+    metrics = dict(
+        dashboard_type='admin' if admin else 'provider',
+        total_properties=counts.get(('properties', ''), 0),
+        total_applications=total_applications,
+        app_status_counts=app_status_counts,
+        total_contracts=total_contracts,
+        contract_status_counts=contract_status_counts,
+    )
+    if admin:
+        metrics.update(total_users=counts.get(('users', 'User'), 0), total_providers=counts.get(('users', 'House Provider'), 0))
+    return OverviewMetrics(**metrics)
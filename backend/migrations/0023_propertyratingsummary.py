@@ -0,0 +1,67 @@
+# Generated by Django 4.2.21 on 2026-10-18 01:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+RATING_FIELDS = ('location', 'staff', 'cleanliness', 'value_for_money', 'comfort', 'facilities', 'free_wifi')
+
+
+def build_rating_summaries(apps, schema_editor):
+    Property = apps.get_model('backend', 'Property')
+    PropertyReview = apps.get_model('backend', 'PropertyReview')
+    PropertyRatingSummary = apps.get_model('backend', 'PropertyRatingSummary')
+
+    summaries = {pk: PropertyRatingSummary(property_id=pk) for pk in Property.objects.values_list('pk', flat=True)}
+    for review in PropertyReview.objects.filter(status=True, property__isnull=False).iterator():
+        summary = summaries[review.property_id]
+        summary.review_count += 1
+        for field in RATING_FIELDS:
+            value = getattr(review, field)
+            if value is not None:
+                setattr(summary, f'{field}_sum', getattr(summary, f'{field}_sum') + value)
+                setattr(summary, f'{field}_count', getattr(summary, f'{field}_count') + 1)
+
+    for summary in summaries.values():
+        counts = [getattr(summary, f'{field}_count') for field in RATING_FIELDS]
+        if summary.review_count and all(counts):
+            averages = [getattr(summary, f'{field}_sum') / getattr(summary, f'{field}_count') for field in RATING_FIELDS]
+            summary.overall_rating = sum(averages) / len(averages)
+
+    PropertyRatingSummary.objects.bulk_create(summaries.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0022_property_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertyRatingSummary',
+            fields=[
+                ('property', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to='backend.property')),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('location_sum', models.PositiveIntegerField(default=0)),
+                ('location_count', models.PositiveIntegerField(default=0)),
+                ('staff_sum', models.PositiveIntegerField(default=0)),
+                ('staff_count', models.PositiveIntegerField(default=0)),
+                ('cleanliness_sum', models.PositiveIntegerField(default=0)),
+                ('cleanliness_count', models.PositiveIntegerField(default=0)),
+                ('value_for_money_sum', models.PositiveIntegerField(default=0)),
+                ('value_for_money_count', models.PositiveIntegerField(default=0)),
+                ('comfort_sum', models.PositiveIntegerField(default=0)),
+                ('comfort_count', models.PositiveIntegerField(default=0)),
+                ('facilities_sum', models.PositiveIntegerField(default=0)),
+                ('facilities_count', models.PositiveIntegerField(default=0)),
+                ('free_wifi_sum', models.PositiveIntegerField(default=0)),
+                ('free_wifi_count', models.PositiveIntegerField(default=0)),
+                ('overall_rating', models.FloatField(db_index=True, default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Property Rating Summaries',
+            },
+        ),
+        migrations.RunPython(build_rating_summaries, migrations.RunPython.noop),
+    ]
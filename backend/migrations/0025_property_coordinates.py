@@ -0,0 +1,42 @@
+# Generated by Django 4.2.21 on 2026-10-18 01:19
+
+from django.db import migrations, models
+from backend.geo import geohash_encode, parse_coordinates
+
+
+def fill_coordinates(apps, schema_editor):
+    Property = apps.get_model('backend', 'Property')
+    located = []
+    for prop in Property.objects.only('id', 'location', 'map_embed').iterator():
+        coordinates = parse_coordinates(prop.map_embed) or parse_coordinates(prop.location)
+        if coordinates:
+            prop.latitude, prop.longitude = coordinates
+            prop.geohash = geohash_encode(*coordinates)
+            located.append(prop)
+    Property.objects.bulk_update(located, ['latitude', 'longitude', 'geohash'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0024_property_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, max_length=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.RunPython(fill_coordinates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.21 on 2026-10-18 01:21
+
+from django.db import migrations, models
+
+MAX_PRECISION = 8
+
+
+def build_clusters(apps, schema_editor):
+    Property = apps.get_model('backend', 'Property')
+    PropertyCluster = apps.get_model('backend', 'PropertyCluster')
+
+    cells = {}
+    located = Property.objects.filter(geohash__isnull=False).values_list('geohash', 'latitude', 'longitude', 'price_rwf')
+    for geohash, latitude, longitude, price in located.iterator():
+        for precision in range(1, MAX_PRECISION + 1):
+            totals = cells.setdefault((precision, geohash[:precision]), {'count': 0, 'lat': 0.0, 'lng': 0.0, 'prices': []})
+            totals['count'] += 1
+            totals['lat'] += latitude
+            totals['lng'] += longitude
+            if price is not None:
+                totals['prices'].append(price)
+
+    PropertyCluster.objects.bulk_create([
+        PropertyCluster(
+            precision=precision, geohash=cell, count=totals['count'],
+            latitude_sum=totals['lat'], longitude_sum=totals['lng'],
+            latitude=totals['lat'] / totals['count'], longitude=totals['lng'] / totals['count'],
+            min_price_rwf=min(totals['prices'], default=None), max_price_rwf=max(totals['prices'], default=None),
+        )
+        for (precision, cell), totals in cells.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0025_property_coordinates'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertyCluster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('precision', models.PositiveSmallIntegerField()),
+                ('geohash', models.CharField(max_length=12)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('latitude_sum', models.FloatField(default=0)),
+                ('longitude_sum', models.FloatField(default=0)),
+                ('latitude', models.FloatField()),
+                ('longitude', models.FloatField()),
+                ('min_price_rwf', models.IntegerField(blank=True, null=True)),
+                ('max_price_rwf', models.IntegerField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Property Clusters',
+                'indexes': [models.Index(fields=['precision', 'latitude', 'longitude'], name='property_cluster_viewport_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='propertycluster',
+            constraint=models.UniqueConstraint(fields=('precision', 'geohash'), name='property_cluster_cell_unique'),
+        ),
+        migrations.RunPython(build_clusters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 4.2.21 on 2026-10-18 01:30
+
+import backend.fields
+import backend.models
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('backend', '0027_image_review_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='image_state',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Ready', 'Ready'), ('Failed', 'Failed')], default='Ready', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='video_thumbnail_state',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Ready', 'Ready'), ('Failed', 'Failed')], default='Ready', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='image_state',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Ready', 'Ready'), ('Failed', 'Failed')], default='Ready', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='image_state',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Ready', 'Ready'), ('Failed', 'Failed')], default='Ready', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='property',
+            name='image',
+            field=backend.fields.DeferredProcessedImageField(blank=True, null=True, state_field=None, upload_to=backend.models.property_image_path),
+        ),
+        migrations.AlterField(
+            model_name='property',
+            name='video_thumbnail',
+            field=backend.fields.DeferredProcessedImageField(blank=True, null=True, state_field=None, upload_to='video_thumbnail'),
+        ),
+        migrations.AlterField(
+            model_name='propertyimage',
+            name='image',
+            field=backend.fields.DeferredProcessedImageField(blank=True, null=True, state_field=None, upload_to=backend.models.property_add_on_image_path),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='image',
+            field=backend.fields.DeferredProcessedImageField(blank=True, null=True, state_field=None, upload_to=backend.models.user_image_path),
+        ),
+        migrations.CreateModel(
+            name='ImageJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('field_name', models.CharField(max_length=100)),
+                ('source_name', models.CharField(max_length=255)),
+                ('state', models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Done', 'Done'), ('Failed', 'Failed')], default='Pending', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name_plural': 'Image Jobs',
+                'indexes': [models.Index(fields=['state', 'run_after'], name='image_job_queue_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.21 on 2026-10-18 02:01
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0029_image_renditions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('Application', 'Application'), ('Contract', 'Contract')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('version', models.CharField(max_length=64)),
+                ('state', models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Done', 'Done'), ('Failed', 'Failed')], default='Pending', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Report Jobs',
+                'indexes': [models.Index(fields=['state', 'run_after'], name='report_job_queue_idx'), models.Index(fields=['kind', 'object_id', 'version'], name='report_job_object_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.21 on 2026-10-18 02:15
+
+import collections
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def scoped_keys(metric, status, provider_id=None, tenant_id=None):
+    keys = [('Global', 0, metric, status or '')]
+    if provider_id:
+        keys.append(('Provider', provider_id, metric, status or ''))
+    if tenant_id:
+        keys.append(('Tenant', tenant_id, metric, status or ''))
+    return keys
+
+
+def build_dashboard_counters(apps, schema_editor):
+    counted = (
+        (apps.get_model('users', 'RentApplication'), ('status', 'user_id', 'property__created_by_id'),
+         lambda status, tenant, provider: scoped_keys('applications', status, provider, tenant)),
+        (apps.get_model('backend', 'Contract'), ('status', 'payment_status', 'tenant_id', 'property__created_by_id'),
+         lambda status, payment, tenant, provider: scoped_keys('contracts', status, provider, tenant) + scoped_keys('payments', payment, provider, tenant)),
+        (apps.get_model('backend', 'Property'), ('created_by_id',),
+         lambda provider: scoped_keys('properties', '', provider)),
+        (apps.get_model('backend', 'User'), ('role',),
+         lambda role: scoped_keys('users', role)),
+    )
+    totals = collections.Counter()
+    for model, lookups, keys in counted:
+        for *values, count in model.objects.order_by().values_list(*lookups).annotate(rows=Count('pk')):
+            for key in keys(*values):
+                totals[key] += count
+
+    DashboardCounter = apps.get_model('backend', 'DashboardCounter')
+    DashboardCounter.objects.bulk_create([
+        DashboardCounter(scope=scope, owner_id=owner_id, metric=metric, status=status, value=value)
+        for (scope, owner_id, metric, status), value in totals.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0030_report_jobs'),
+        ('users', '0003_deferred_image_processing'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('Global', 'Global'), ('Provider', 'Provider'), ('Tenant', 'Tenant')], max_length=10)),
+                ('owner_id', models.PositiveBigIntegerField(default=0)),
+                ('metric', models.CharField(max_length=30)),
+                ('status', models.CharField(blank=True, default='', max_length=30)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Dashboard Counters',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dashboardcounter',
+            constraint=models.UniqueConstraint(fields=('scope', 'owner_id', 'metric', 'status'), name='dashboard_counter_key_unique'),
+        ),
+        migrations.RunPython(build_dashboard_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.21 on 2026-10-18 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0031_dashboard_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(max_length=30, unique=True)),
+                ('rolled_up_through', models.DateField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('metric', models.CharField(choices=[('applications', 'New applications'), ('contracts', 'New contracts'), ('signed_contracts', 'Signed contracts'), ('listings', 'New listings')], max_length=30)),
+                ('status', models.CharField(blank=True, default='', max_length=30)),
+                ('city', models.CharField(blank=True, default='', max_length=30)),
+                ('category_id', models.PositiveBigIntegerField(default=0)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('rent_sum', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('rent_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'Daily Rollups',
+                'indexes': [models.Index(fields=['metric', 'day'], name='daily_rollup_series_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyrollup',
+            constraint=models.UniqueConstraint(fields=('day', 'metric', 'status', 'city', 'category_id'), name='daily_rollup_key_unique'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.21 on 2026-10-18 02:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0033_cache_versions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='propertyratingsummary',
+            name='cleanliness_sum',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='propertyratingsummary',
+            name='comfort_sum',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='propertyratingsummary',
+            name='facilities_sum',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='propertyratingsummary',
+            name='free_wifi_sum',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='propertyratingsummary',
+            name='location_sum',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='propertyratingsummary',
+            name='staff_sum',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='propertyratingsummary',
+            name='value_for_money_sum',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
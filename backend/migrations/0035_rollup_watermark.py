@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0034_rating_summary_signed_sums'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rollupcursor',
+            name='modified_after',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
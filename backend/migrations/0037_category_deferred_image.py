@@ -0,0 +1,25 @@
+# Generated by Django 4.2.21 on 2026-10-18 03:35
+
+import backend.fields
+import backend.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0036_rollup_dirty_day'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='image_state',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Ready', 'Ready'), ('Failed', 'Failed')], default='Ready', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='image',
+            field=backend.fields.DeferredProcessedImageField(blank=True, null=True, state_field=None, upload_to=backend.models.category_image_path),
+        ),
+    ]
@@ -3,13 +3,15 @@ import random
 from users.models import *
 from django.db import models
 from backend.managers import *
-from django.db.models import Avg
+from backend.geo import geohash_encode, parse_coordinates
+from backend.fields import DeferredProcessedImageField, IMAGE_STATE_CHOICES
 from django.utils import timezone
 from django.utils.text import slugify
 from imagekit.processors import ResizeToFill
 from imagekit.models import ProcessedImageField
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, Permission
+from django.contrib.contenttypes.models import ContentType
 
 def user_image_path(instance, filename):
     base_filename, file_extension = os.path.splitext(filename)
@@ -25,7 +27,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     name = models.CharField(max_length=255)
     email = models.EmailField(unique=True)
     phone_number = models.CharField(max_length=15, unique=True)
-    image = ProcessedImageField(
+    image = DeferredProcessedImageField(
         upload_to=user_image_path,
         processors=[ResizeToFill(720, 720)],
         format='JPEG',
@@ -33,6 +35,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         null=True,
         blank=True,
     )
+    image_state = models.CharField(max_length=20, choices=IMAGE_STATE_CHOICES, default='Ready')
     role = models.CharField(max_length=30, choices=ROLE_CHOICES)
     slug = models.SlugField(unique=True, max_length=255, null=True, blank=True)
     added_by = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True, related_name='added_users')
@@ -49,6 +52,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.email
 
+    @property
+    def is_admin(self):
+        """Admins by role, and superusers whatever their role."""
+        return self.role == 'Admin' or self.is_superuser
+
     def save(self, *args, **kwargs):
         # Handle image deletion and update slug on name change
         try:
@@ -110,7 +118,7 @@ def category_image_path(instance, filename):
 
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
-    image = ProcessedImageField(
+    image = DeferredProcessedImageField(
         upload_to=category_image_path,
         format='JPEG',
         processors=[ResizeToFill(500, 500)],
@@ -118,6 +126,9 @@ class Category(models.Model):
         null=True,
         blank=True
     )
+    image_state = models.CharField(max_length=20, choices=IMAGE_STATE_CHOICES, default='Ready')
+    # Responsive sizes of `image`, see backend/renditions.py
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -167,7 +178,7 @@ class Property(models.Model):
     bathroom = models.IntegerField(null=True, blank=True)
     capacity = models.IntegerField(null=True, blank=True)
     size = models.CharField(max_length=255, null=True, blank=True)
-    image = ProcessedImageField(
+    image = DeferredProcessedImageField(
         upload_to=property_image_path,
         format='JPEG',
         processors=[ResizeToFill(1340, 894)],
@@ -175,6 +186,8 @@ class Property(models.Model):
         null=True,
         blank=True,
     )
+    image_state = models.CharField(max_length=20, choices=IMAGE_STATE_CHOICES, default='Ready')
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     amenities = models.ManyToManyField('Amenity', blank=True)
     address = models.CharField(max_length=255, default='Kigali Rwanda')
 
@@ -187,7 +200,7 @@ class Property(models.Model):
 
     location = models.TextField(null=True, blank=True)
     video_url = models.TextField(null=True, blank=True)
-    video_thumbnail = ProcessedImageField(
+    video_thumbnail = DeferredProcessedImageField(
         upload_to='video_thumbnail',
         format='JPEG',
         processors=[ResizeToFill(1340, 894)],
@@ -195,17 +208,41 @@ class Property(models.Model):
         null=True,
         blank=True,
     )
+    video_thumbnail_state = models.CharField(max_length=20, choices=IMAGE_STATE_CHOICES, default='Ready')
     map_embed = models.TextField(null=True, blank=True)
 
+    # Coordinates parsed from location/map_embed on save; geohash is indexed
+    # so that radius and viewport searches can use prefix range scans
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    geohash = models.CharField(max_length=12, null=True, blank=True, db_index=True)
+
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='properties_created')
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PropertyQuerySet.as_manager()
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = self._generate_unique_slug()
+        self.update_coordinates()
         super().save(*args, **kwargs)
 
+    def update_coordinates(self):
+        """
+        Take latitude/longitude from the map embed or location text when
+        either contains coordinates (otherwise keep whatever was set) and
+        keep the geohash in step.
+        """
+        coordinates = parse_coordinates(self.map_embed) or parse_coordinates(self.location)
+        if coordinates:
+            self.latitude, self.longitude = coordinates
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = geohash_encode(self.latitude, self.longitude)
+        else:
+            self.geohash = None
+
     def _generate_unique_slug(self):
         base_slug = slugify(self.name)
         unique_slug = base_slug
@@ -215,46 +252,28 @@ class Property(models.Model):
             num += 1
         return unique_slug
 
+    def get_rating_summary(self):
+        """
+        Return the denormalized rating summary, or an empty unsaved one if
+        the property has never been summarized.
+        """
+        try:
+            return self.rating_summary
+        except PropertyRatingSummary.DoesNotExist:
+            return PropertyRatingSummary(property=self)
+
     # Method to retrieve review data (total reviews and average ratings)
     def get_review_data(self):
-        reviews = self.propertyreview.filter(status=True)  # Filter reviews with status=True
-        total_reviews = reviews.count()
-        
-        # Aggregate average ratings
-        avg_ratings = reviews.aggregate(
-            avg_location=Avg('location'),
-            avg_staff=Avg('staff'),
-            avg_cleanliness=Avg('cleanliness'),
-            avg_value_for_money=Avg('value_for_money'),
-            avg_comfort=Avg('comfort'),
-            avg_facilities=Avg('facilities'),
-            avg_free_wifi=Avg('free_wifi')
-        )
-
-        # Calculate overall rating
-        if total_reviews > 0:
-            overall_rating = (
-                avg_ratings['avg_location'] +
-                avg_ratings['avg_staff'] +
-                avg_ratings['avg_cleanliness'] +
-                avg_ratings['avg_value_for_money'] +
-                avg_ratings['avg_comfort'] +
-                avg_ratings['avg_facilities'] +
-                avg_ratings['avg_free_wifi']
-            ) / 7
-        else:
-            overall_rating = 0  # Default to 0 if no reviews
-
-        return {
-            'total_reviews': total_reviews,
-            'overall_rating': round(overall_rating, 2) if overall_rating else 0
-        }
+        return self.get_rating_summary().as_review_data()
 
     def __str__(self):
         return self.name
 
     class Meta:
         verbose_name_plural = "Properties"
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='property_created_id_idx'),
+        ]
 
 def property_add_on_image_path(instance, filename):
     base_filename, file_extension = os.path.splitext(filename)
@@ -263,7 +282,7 @@ def property_add_on_image_path(instance, filename):
 
 class PropertyImage(models.Model):
     property = models.ForeignKey(Property, related_name='images', on_delete=models.CASCADE)
-    image = ProcessedImageField(
+    image = DeferredProcessedImageField(
         upload_to=property_add_on_image_path,
         processors=[ResizeToFill(1340, 894)],
         format='JPEG',
@@ -271,7 +290,10 @@ class PropertyImage(models.Model):
         null=True,
         blank=True,
     )
+    image_state = models.CharField(max_length=20, choices=IMAGE_STATE_CHOICES, default='Ready')
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Image for {self.property.name} - {self.created_at}"
@@ -299,6 +321,7 @@ class PropertyReview(models.Model):
     free_wifi = models.IntegerField(default=5, null=True, blank=True)
     status = models.BooleanField(default=1, null=True, blank=True)
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Review by {self.name} for {self.property.name}"
@@ -349,3 +372,286 @@ class Contract(models.Model):
     class Meta:
         verbose_name_plural = "Contracts"
         ordering = ['start_date']
+
+class PropertyRatingSummary(models.Model):
+    """
+    Running sums and counts of active review ratings for a property.
+    Kept up to date incrementally by the PropertyReview signals in
+    backend/signals.py; `rebuild_ratings` recomputes it from scratch.
+    """
+    property = models.OneToOneField(Property, on_delete=models.CASCADE, primary_key=True, related_name='rating_summary')
+    review_count = models.PositiveIntegerField(default=0)
+
+    # Signed, like the review rating fields they add up
+    location_sum = models.BigIntegerField(default=0)
+    location_count = models.PositiveIntegerField(default=0)
+    staff_sum = models.BigIntegerField(default=0)
+    staff_count = models.PositiveIntegerField(default=0)
+    cleanliness_sum = models.BigIntegerField(default=0)
+    cleanliness_count = models.PositiveIntegerField(default=0)
+    value_for_money_sum = models.BigIntegerField(default=0)
+    value_for_money_count = models.PositiveIntegerField(default=0)
+    comfort_sum = models.BigIntegerField(default=0)
+    comfort_count = models.PositiveIntegerField(default=0)
+    facilities_sum = models.BigIntegerField(default=0)
+    facilities_count = models.PositiveIntegerField(default=0)
+    free_wifi_sum = models.BigIntegerField(default=0)
+    free_wifi_count = models.PositiveIntegerField(default=0)
+
+    overall_rating = models.FloatField(default=0, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def apply(self, ratings, sign=1):
+        """
+        Add (sign=1) or remove (sign=-1) one active review's ratings, given
+        as a dict of rating field -> value, and refresh the overall rating.
+        """
+        self.review_count += sign
+        for field in REVIEW_RATING_FIELDS:
+            value = ratings.get(field)
+            if value is not None:
+                setattr(self, f'{field}_sum', getattr(self, f'{field}_sum') + sign * value)
+                setattr(self, f'{field}_count', getattr(self, f'{field}_count') + sign)
+        self.overall_rating = self.compute_overall_rating()
+
+    def average(self, field):
+        count = getattr(self, f'{field}_count')
+        return getattr(self, f'{field}_sum') / count if count else None
+
+    def compute_overall_rating(self):
+        averages = [self.average(field) for field in REVIEW_RATING_FIELDS]
+        if not self.review_count or any(value is None for value in averages):
+            return 0
+        return sum(averages) / len(averages)
+
+    def as_review_data(self):
+        return {
+            'total_reviews': self.review_count,
+            'overall_rating': round(self.overall_rating, 2) if self.overall_rating else 0
+        }
+
+    def __str__(self):
+        return f"Rating summary for {self.property.name}"
+
+    class Meta:
+        verbose_name_plural = "Property Rating Summaries"
+
+class PropertyCluster(models.Model):
+    """
+    Aggregate of the located properties inside one geohash cell, stored for
+    every cell length from 1 to GEO_CLUSTER_MAX_PRECISION so that map
+    viewports read a bounded number of rows at any zoom. Maintained by the
+    Property signals in backend/signals.py; `rebuild_clusters` recomputes
+    it from scratch.
+    """
+    precision = models.PositiveSmallIntegerField()
+    geohash = models.CharField(max_length=12)
+    count = models.PositiveIntegerField(default=0)
+
+    # Sums are kept so that parent cells can be merged from their children
+    latitude_sum = models.FloatField(default=0)
+    longitude_sum = models.FloatField(default=0)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+
+    min_price_rwf = models.IntegerField(null=True, blank=True)
+    max_price_rwf = models.IntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.geohash} ({self.count})"
+
+    class Meta:
+        verbose_name_plural = "Property Clusters"
+        constraints = [
+            models.UniqueConstraint(fields=['precision', 'geohash'], name='property_cluster_cell_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['precision', 'latitude', 'longitude'], name='property_cluster_viewport_idx'),
+        ]
+
+class ImageJob(models.Model):
+    """
+    One deferred image rendition: resize and re-encode the raw upload in
+    `source_name` for `field_name` on the given row, using that field's
+    processors. Claimed and run by the `process_images` worker pool.
+    """
+    STATE_CHOICES = (
+        ('Pending', 'Pending'),
+        ('Processing', 'Processing'),
+        ('Done', 'Done'),
+        ('Failed', 'Failed'),
+    )
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    field_name = models.CharField(max_length=100)
+    source_name = models.CharField(max_length=255)
+
+    state = models.CharField(max_length=20, choices=STATE_CHOICES, default='Pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+    run_after = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.content_type.model}#{self.object_id}.{self.field_name} ({self.state})"
+
+    class Meta:
+        verbose_name_plural = "Image Jobs"
+        indexes = [
+            models.Index(fields=['state', 'run_after'], name='image_job_queue_idx'),
+        ]
+
+class ReportJob(models.Model):
+    """
+    One PDF report to render into the report cache (backend/reports.py) for
+    an application or contract, as it read when queued (`version`). Claimed
+    and run by the `process_reports` worker pool.
+    """
+    KIND_CHOICES = (
+        ('Application', 'Application'),
+        ('Contract', 'Contract'),
+    )
+    STATE_CHOICES = ImageJob.STATE_CHOICES
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    version = models.CharField(max_length=64)
+
+    state = models.CharField(max_length=20, choices=STATE_CHOICES, default='Pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(null=True, blank=True)
+    run_after = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.kind} report #{self.object_id} ({self.state})"
+
+    class Meta:
+        verbose_name_plural = "Report Jobs"
+        indexes = [
+            models.Index(fields=['state', 'run_after'], name='report_job_queue_idx'),
+            models.Index(fields=['kind', 'object_id', 'version'], name='report_job_object_idx'),
+        ]
+
+class DashboardCounter(models.Model):
+    """
+    How many applications, contracts, properties or users have one status
+    (or payment status, or role) within a scope: site-wide ('Global', owner
+    0), one house provider's properties or one tenant's ('Provider' and
+    'Tenant', owner = that user's id). Dashboards read a scope's rows in
+    one query. Maintained by the signals in backend/signals.py;
+    `reconcile_counters` recomputes them and reports drift.
+    """
+    SCOPE_CHOICES = (
+        ('Global', 'Global'),
+        ('Provider', 'Provider'),
+        ('Tenant', 'Tenant'),
+    )
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES)
+    owner_id = models.PositiveBigIntegerField(default=0)
+    metric = models.CharField(max_length=30)
+    status = models.CharField(max_length=30, blank=True, default='')
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.scope}#{self.owner_id} {self.metric}[{self.status}] = {self.value}"
+
+    class Meta:
+        verbose_name_plural = "Dashboard Counters"
+        constraints = [
+            models.UniqueConstraint(fields=['scope', 'owner_id', 'metric', 'status'], name='dashboard_counter_key_unique'),
+        ]
+
+class DailyRollup(models.Model):
+    """
+    One day's new applications (by status), new contracts, signed contracts
+    or new listings in one city and category, with their rent summed so
+    that averages survive merging days into weeks or months. Written by
+    the nightly `rollup_analytics` job (backend/analytics.py) for the days
+    after its RollupCursor and the older days whose rows changed; read by
+    the time-series API and dashboard.
+    """
+    METRIC_CHOICES = (
+        ('applications', 'New applications'),
+        ('contracts', 'New contracts'),
+        ('signed_contracts', 'Signed contracts'),
+        ('listings', 'New listings'),
+    )
+    day = models.DateField()
+    metric = models.CharField(max_length=30, choices=METRIC_CHOICES)
+    status = models.CharField(max_length=30, blank=True, default='')
+    city = models.CharField(max_length=30, blank=True, default='')
+    # 0 when uncategorized; not a foreign key so that a deleted category's history stays
+    category_id = models.PositiveBigIntegerField(default=0)
+    count = models.PositiveIntegerField(default=0)
+    rent_sum = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    rent_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.day} {self.metric} {self.city}/{self.category_id} = {self.count}"
+
+    class Meta:
+        verbose_name_plural = "Daily Rollups"
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'metric', 'status', 'city', 'category_id'], name='daily_rollup_key_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['metric', 'day'], name='daily_rollup_series_idx'),
+        ]
+
+class RollupCursor(models.Model):
+    """
+    The last day `rollup_analytics` has rolled up for one DailyRollup
+    metric, and when its last run started: rows saved since then that are
+    dated on or before that day (backdated, re-dated or with a new status)
+    have their days rolled up again by the next run.
+    """
+    metric = models.CharField(max_length=30, unique=True)
+    rolled_up_through = models.DateField()
+    modified_after = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.metric} through {self.rolled_up_through}"
+
+class RollupDirtyDay(models.Model):
+    """
+    A rolled-up day of one DailyRollup metric that lost rows: deleted,
+    re-dated, or belonging to a property that moved to another city or
+    category. Recorded from signals, since no saved row is left to show
+    the change; the next `rollup_analytics` run rolls the day up again.
+    """
+    metric = models.CharField(max_length=30)
+    day = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.metric} on {self.day}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['metric', 'day'], name='rollup_dirty_day_unique'),
+        ]
+
+class CacheVersion(models.Model):
+    """
+    The current version of one cache namespace (a listing model, or an
+    in-process index such as the amenity bitmaps). Cache keys embed it, so
+    moving it on drops every entry built from the old one. Kept in the
+    database so that all worker processes read the same value and it is
+    never evicted; see backend/cache.py.
+    """
+    namespace = models.CharField(max_length=50, unique=True)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.namespace} v{self.version}"
+
+    class Meta:
+        verbose_name_plural = "Cache Versions"
@@ -0,0 +1,161 @@
+import io
+import os
+import base64
+import logging
+from PIL import Image, ImageOps
+from django.apps import apps
+from django.conf import settings
+from django.db.models import ImageField
+from django.core.files.base import ContentFile
+
+logger = logging.getLogger(__name__)
+
+# Rendition format name: (Pillow format, file extension, MIME type)
+RENDITION_FORMATS = {
+    'webp': ('WEBP', 'webp', 'image/webp'),
+    'jpeg': ('JPEG', 'jpg', 'image/jpeg'),
+}
+
+def rendition_widths():
+    return tuple(sorted(getattr(settings, 'IMAGE_RENDITION_WIDTHS', (360, 720, 1340))))
+
+def renditions_field_name(field_name):
+    return f'{field_name}_renditions'
+
+def rendition_image_fields(model):
+    """Names of the image fields of `model` that have a `<name>_renditions` column."""
+    names = {field.name for field in model._meta.fields}
+    return [
+        field.name for field in model._meta.fields
+        if isinstance(field, ImageField) and renditions_field_name(field.name) in names
+    ]
+
+def render_placeholder(image):
+    """
+    A blurry IMAGE_PLACEHOLDER_WIDTH pixel wide JPEG of a decoded RGB
+    image, as a data: URI (a few hundred bytes) that pages inline and show
+    until the real image arrives.
+    """
+    width = min(getattr(settings, 'IMAGE_PLACEHOLDER_WIDTH', 16), image.width)
+    height = max(1, round(image.height * width / image.width))
+    thumbnail = image.convert('RGB').resize((width, height), Image.BILINEAR, reducing_gap=2.0)
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, 'JPEG', quality=40, optimize=True)
+    return 'data:image/jpeg;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+def rendition_name(name, width, extension):
+    return f'renditions/{os.path.splitext(name)[0]}_{width}w.{extension}'
+
+def render_renditions(storage, name, content=None):
+    """
+    Resize the stored image `name` (or `content`, its bytes, when already
+    in hand) to each of IMAGE_RENDITION_WIDTHS no wider than the image
+    itself, encode each in every RENDITION_FORMATS format and store them.
+    Returns the value for the `<field>_renditions` column, which also
+    carries the image's inline placeholder.
+    """
+    if content is None:
+        with storage.open(name) as source:
+            content = source.read()
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(content)))
+    image = image.convert('RGB')
+
+    widths = [width for width in rendition_widths() if width <= image.width] or [image.width]
+    quality = getattr(settings, 'IMAGE_RENDITION_QUALITY', 80)
+    files = {}
+    for width in widths:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        files[str(width)] = {}
+        for key, (pil_format, extension, _) in RENDITION_FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, pil_format, quality=quality, optimize=True)
+            files[str(width)][key] = storage.save(rendition_name(name, width, extension), ContentFile(buffer.getvalue()))
+    return {
+        'source': name,
+        'width': image.width,
+        'height': image.height,
+        'files': files,
+        'placeholder': render_placeholder(image),
+    }
+
+def stored_placeholder(model_label, field_name, renditions):
+    """
+    Process pool entry point: the placeholder for an image that already has
+    renditions, decoded from its smallest JPEG rendition.
+    """
+    storage = apps.get_model(model_label)._meta.get_field(field_name).storage
+    smallest = min(renditions['files'], key=int)
+    with storage.open(renditions['files'][smallest]['jpeg']) as source:
+        with Image.open(source) as image:
+            return render_placeholder(image)
+
+def render_stored_renditions(model_label, field_name, name):
+    """Process pool entry point: renditions for an already processed image."""
+    field = apps.get_model(model_label)._meta.get_field(field_name)
+    return render_renditions(field.storage, name)
+
+def delete_renditions(storage, renditions):
+    for formats in (renditions or {}).get('files', {}).values():
+        for name in formats.values():
+            storage.delete(name)
+
+def current_renditions(file):
+    """The renditions recorded for a FieldFile, if they belong to its current image."""
+    if not file:
+        return None
+    renditions = getattr(file.instance, renditions_field_name(file.field.name), None) or {}
+    if renditions.get('source') != file.name or not renditions.get('files'):
+        return None
+    if not getattr(file, 'ready', True):
+        return None
+    return renditions
+
+def rendition_urls(file):
+    """
+    {'360w': {'webp': url, 'jpeg': url}, ...} for a FieldFile, smallest
+    first, or None while it has no renditions.
+    """
+    renditions = current_renditions(file)
+    if renditions is None:
+        return None
+    return {
+        f'{width}w': {key: file.storage.url(name) for key, name in formats.items()}
+        for width, formats in sorted(renditions['files'].items(), key=lambda item: int(item[0]))
+    }
+
+def placeholder(file):
+    """The inline placeholder (a data: URI) of a FieldFile, or None."""
+    renditions = current_renditions(file)
+    return renditions.get('placeholder') if renditions else None
+
+def srcset(file, key):
+    """The `srcset` attribute value for one rendition format of a FieldFile."""
+    urls = rendition_urls(file) or {}
+    return ', '.join(f'{formats[key]} {width}' for width, formats in urls.items() if key in formats)
+
+def refresh_renditions(instance, field_name):
+    """
+    Bring the `<field>_renditions` column in step with the field's current
+    image: drop renditions of a replaced image and render the new one once
+    it is processed. Images still waiting in the image job queue get theirs
+    from the job (backend/image_jobs.py).
+    """
+    file = getattr(instance, field_name)
+    column = renditions_field_name(field_name)
+    renditions = getattr(instance, column) or {}
+    if renditions.get('source') == (file.name or None):
+        return
+
+    delete_renditions(file.storage, renditions)
+    previous, renditions = renditions, {}
+    if file and getattr(file, 'ready', True):
+        try:
+            renditions = render_renditions(file.storage, file.name)
+        except OSError:
+            # Unreadable upload (e.g. one the image job gave up on)
+            logger.warning("Could not render %s renditions for %r", field_name, instance, exc_info=True)
+    setattr(instance, column, renditions)
+    if renditions or previous:
+        type(instance)._default_manager.filter(pk=instance.pk).update(**{column: renditions})
+
@@ -0,0 +1,346 @@
+import os
+import json
+import zipfile
+import hashlib
+import logging
+from datetime import timedelta
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, as_completed, wait
+from django.conf import settings
+from django.utils import timezone
+from backend.models import *
+from backend.image_jobs import claim_jobs
+from backend.utils.pdf_reports import application_report_lines, contract_report_lines, render_report
+
+logger = logging.getLogger(__name__)
+
+# Bump when render_report() draws the same lines differently, so cached
+# PDFs made by the old code stop matching
+REPORT_LAYOUT_VERSION = 2
+
+# ReportJob kind: (model, report lines, related rows the lines read, download file name)
+REPORT_KINDS = {
+    'Application': (
+        RentApplication, application_report_lines, ('user', 'property'),
+        lambda application: f"application_report_{application.id}.pdf",
+    ),
+    'Contract': (
+        Contract, contract_report_lines, ('tenant', 'agent', 'property'),
+        lambda contract: f"contract_report_{contract.contract_number}.pdf",
+    ),
+}
+
+def report_root():
+    return getattr(settings, 'REPORT_CACHE_ROOT', os.path.join(settings.BASE_DIR, 'var', 'reports'))
+
+def report_object(kind, pk):
+    """The application or contract a report is about, with the rows its lines read; None if gone."""
+    model, lines, related, filename = REPORT_KINDS[kind]
+    return model._default_manager.select_related(*related).filter(pk=pk).first()
+
+def report_lines(kind, obj):
+    """(lines, version): what the report shows, and a hash of it that names the cached file."""
+    lines = REPORT_KINDS[kind][1](obj)
+    encoded = json.dumps([REPORT_LAYOUT_VERSION, lines], separators=(',', ':')).encode('utf-8')
+    return lines, hashlib.sha256(encoded).hexdigest()[:32]
+
+def report_filename(kind, obj):
+    return REPORT_KINDS[kind][3](obj)
+
+def report_path(kind, pk, version):
+    return os.path.join(report_root(), kind.lower(), f'{pk}-{version}.pdf')
+
+def write_report(kind, pk, version, lines):
+    """
+    Pool entry point: render `lines` into the cache file for this version
+    and drop the object's older versions. Touches no database.
+    """
+    path = report_path(kind, pk, version)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as output:
+        render_report(lines, output)
+    # Readers only ever see a complete file
+    os.replace(temporary, path)
+
+    prefix = f'{pk}-'
+    for entry in os.scandir(os.path.dirname(path)):
+        if entry.name.startswith(prefix) and entry.name.endswith('.pdf') and entry.path != path:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+    return path
+
+def cached_report_path(kind, pk, version):
+    """The cached PDF for this version, marked as just used; None if not rendered (or evicted)."""
+    path = report_path(kind, pk, version)
+    try:
+        # The modification time is the LRU clock
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+def cached_report(kind, obj, attempts=3):
+    """
+    (file, version): the report for `obj` opened for reading, rendered now
+    unless the cache already holds the version matching its current
+    content. The file is opened here, so an evict_reports() or a newer
+    write_report() unlinking it afterwards cannot break the download; one
+    that goes between the lookup and the open is looked up (or rendered)
+    again.
+    """
+    lines, version = report_lines(kind, obj)
+    for attempt in range(attempts):
+        path = cached_report_path(kind, obj.pk, version)
+        rendered = path is None
+        if rendered:
+            path = write_report(kind, obj.pk, version, lines)
+        try:
+            report = open(path, 'rb')
+        except FileNotFoundError:
+            continue
+        if rendered:
+            evict_reports()
+        return report, version
+    raise FileNotFoundError(f"The {kind.lower()} report for {obj.pk} was evicted {attempts} times while opening it.")
+
+def report_name(path):
+    """A cached report's name relative to report_root(), as the front proxy's internal location sees it."""
+    return os.path.relpath(path, report_root()).replace(os.sep, '/')
+
+def evict_reports(max_bytes=None):
+    """
+    Delete the least recently used cached reports until the cache fits in
+    REPORT_CACHE_MAX_BYTES. Returns (files, bytes) removed.
+    """
+    if max_bytes is None:
+        max_bytes = getattr(settings, 'REPORT_CACHE_MAX_BYTES', 200 * 1024 * 1024)
+    entries, total = [], 0
+    for directory, dirs, files in os.walk(report_root()):
+        for name in files:
+            if not name.endswith('.pdf'):
+                # Still being written
+                continue
+            path = os.path.join(directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+    removed = freed = 0
+    for mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+        freed += size
+    return removed, freed
+
+def enqueue_report(kind, obj):
+    """
+    Queue rendering of `obj`'s report unless its current version is
+    already cached. Returns the ReportJob (an existing one if that version
+    is already queued), or None when the file is ready.
+    """
+    lines, version = report_lines(kind, obj)
+    if cached_report_path(kind, obj.pk, version):
+        return None
+    queued = ReportJob.objects.filter(
+        kind=kind, object_id=obj.pk, version=version, state__in=['Pending', 'Processing'],
+    ).order_by('id').first()
+    return queued or ReportJob.objects.create(kind=kind, object_id=obj.pk, version=version)
+
+def claim_report_jobs(limit):
+    return claim_jobs(limit, model=ReportJob, timeout=getattr(settings, 'REPORT_JOB_TIMEOUT', 300))
+
+def start_report_job(job):
+    """
+    The write_report() arguments for a claimed job, from the object as it
+    reads now; None (closing the job) if the object was deleted or the
+    report is already cached.
+    """
+    obj = report_object(job.kind, job.object_id)
+    if obj is None:
+        ReportJob.objects.filter(pk=job.pk).update(state='Done', error="Deleted.", finished_at=timezone.now())
+        return None
+    lines, version = report_lines(job.kind, obj)
+    if version != job.version:
+        ReportJob.objects.filter(pk=job.pk).update(version=version)
+    if cached_report_path(job.kind, job.object_id, version):
+        ReportJob.objects.filter(pk=job.pk).update(state='Done', finished_at=timezone.now())
+        return None
+    return job.kind, job.object_id, version, lines
+
+def fail_report_job(job, error):
+    if job.attempts < getattr(settings, 'REPORT_JOB_MAX_ATTEMPTS', 3):
+        ReportJob.objects.filter(pk=job.pk).update(
+            state='Pending', error=error,
+            run_after=timezone.now() + timedelta(seconds=10 * 2 ** job.attempts),
+        )
+    else:
+        ReportJob.objects.filter(pk=job.pk).update(state='Failed', error=error, finished_at=timezone.now())
+
+def process_report_jobs(jobs, pool=None):
+    """
+    Render `jobs` in `pool` (or inline without one), recording each outcome
+    as it completes, then trim the cache. Returns (job, ok) pairs.
+    """
+    outcomes, pending = [], {}
+
+    def failed(job, error):
+        logger.error("Report job %s failed: %s", job.pk, error, exc_info=error)
+        fail_report_job(job, f"{type(error).__name__}: {error}")
+        outcomes.append((job, False))
+
+    def finished(job, render):
+        try:
+            render()
+        except Exception as error:
+            return failed(job, error)
+        ReportJob.objects.filter(pk=job.pk).update(state='Done', error=None, finished_at=timezone.now())
+        outcomes.append((job, True))
+
+    for job in jobs:
+        try:
+            arguments = start_report_job(job)
+        except Exception as error:
+            failed(job, error)
+            continue
+        if arguments is None:
+            outcomes.append((job, True))
+        elif pool is None:
+            finished(job, partial(write_report, *arguments))
+        else:
+            pending[pool.submit(write_report, *arguments)] = job
+
+    for future in as_completed(pending):
+        finished(pending[future], future.result)
+    if outcomes:
+        evict_reports()
+    return outcomes
+
+def export_queryset(kind, property_id=None, month=None, status=None):
+    """
+    The applications or contracts of a bulk export, oldest first, narrowed
+    to one property, one `month` ('YYYY-MM', by creation date) and one
+    status when given.
+    """
+    model, lines, related, filename = REPORT_KINDS[kind]
+    objects = model._default_manager.select_related(*related).order_by('created_at', 'pk')
+    if property_id:
+        objects = objects.filter(property_id=property_id)
+    if month:
+        year, number = (int(part) for part in month.split('-'))
+        objects = objects.filter(created_at__year=year, created_at__month=number)
+    if status:
+        objects = objects.filter(status=status)
+    return objects
+
+def export_reports(kind, objects, pool=None, workers=1):
+    """
+    Yield (archive name, path) for the report of each of `objects`: cached
+    versions at once, the rest as `pool` (of `workers` processes) finishes
+    rendering them, or inline as the caller iterates without a pool. At
+    most 4 renders per worker are in flight, so neither the queue nor the
+    finished files waiting to be read grow with the number of objects. A
+    report that fails to render is yielded with path None.
+    """
+    window = 4 * max(workers, 1)
+    names, pending = set(), {}
+
+    def archive_name(obj):
+        name = report_filename(kind, obj)
+        if name in names:
+            # e.g. contracts without a number
+            stem, extension = os.path.splitext(name)
+            name = f'{stem}-{obj.pk}{extension}'
+        names.add(name)
+        return name
+
+    def result(name, render, *args):
+        try:
+            return render(*args)
+        except Exception as error:
+            logger.error("Could not render %s report %s: %s", kind, name, error, exc_info=error)
+            return None
+
+    for obj in objects.iterator(chunk_size=200) if hasattr(objects, 'iterator') else objects:
+        lines, version = report_lines(kind, obj)
+        name = archive_name(obj)
+        path = cached_report_path(kind, obj.pk, version)
+        if path is not None:
+            yield name, path
+        elif pool is None:
+            yield name, result(name, write_report, kind, obj.pk, version, lines)
+        else:
+            pending[pool.submit(write_report, kind, obj.pk, version, lines)] = name
+            if len(pending) >= window:
+                done, running = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending[future], result(pending[future], future.result)
+                    del pending[future]
+
+    for future in as_completed(pending):
+        yield pending[future], result(pending[future], future.result)
+    evict_reports()
+
+
+class ZipStream:
+    """A write-only, unseekable file for ZipFile that hands over what was written so far."""
+
+    def __init__(self):
+        self.chunks = []
+        self.buffered = 0
+        self.position = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.buffered += len(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks, self.buffered = [], 0
+        return data
+
+def zip_reports(files, chunk_size=64 * 1024):
+    """
+    Stream a ZIP of (archive name, path) pairs as bytes chunks, reading
+    each file as it arrives. Reports that failed to render are listed in
+    FAILED.txt instead.
+    """
+    stream, failed = ZipStream(), []
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, path in files:
+            if path is None:
+                failed.append(name)
+                continue
+            try:
+                source = open(path, 'rb')
+            except FileNotFoundError:
+                # Evicted by another process since it was rendered
+                failed.append(name)
+                continue
+            with source, archive.open(name, 'w') as target:
+                while chunk := source.read(chunk_size):
+                    target.write(chunk)
+                    if stream.buffered >= chunk_size:
+                        yield stream.drain()
+        if failed:
+            archive.writestr('FAILED.txt', ''.join(f'{name}\n' for name in failed))
+    yield stream.drain()
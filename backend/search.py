@@ -0,0 +1,160 @@
+import re
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+# Columns covered by the full-text index, with their ranking weights
+SEARCH_FIELDS = (
+    ('name', 10.0),
+    ('address', 5.0),
+    ('description', 1.0),
+    ('nearby_hospital', 2.0),
+    ('nearby_school', 2.0),
+    ('nearby_market', 2.0),
+    ('nearby_transport', 2.0),
+    ('nearby_park', 2.0),
+    ('nearby_gym', 2.0),
+)
+SEARCH_COLUMNS = tuple(field for field, weight in SEARCH_FIELDS)
+
+FTS_TABLE = 'backend_property_fts'
+FULLTEXT_INDEX = 'property_fulltext_idx'
+
+def search_terms(query, limit=16):
+    """
+    Split free text into lowercase word tokens, dropping anything that
+    could be interpreted as FTS query syntax.
+    """
+    return re.findall(r'\w+', (query or '').lower())[:limit]
+
+
+class SQLiteSearchBackend:
+    """
+    FTS5 virtual table keyed by Property.id, maintained from the Property
+    post_save/post_delete signals. Ranked with bm25 (negated so that higher
+    is better).
+    """
+
+    def create_index(self, cursor):
+        columns = ', '.join(SEARCH_COLUMNS)
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            f"{columns}, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        cursor.execute(f"INSERT INTO {FTS_TABLE}(rowid, {columns}) SELECT id, {columns} FROM backend_property")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+
+    def drop_index(self, cursor):
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+    def rebuild(self, cursor):
+        self.drop_index(cursor)
+        self.create_index(cursor)
+
+    def index(self, instance):
+        columns = ', '.join(SEARCH_COLUMNS)
+        placeholders = ', '.join(['%s'] * (len(SEARCH_COLUMNS) + 1))
+        values = [instance.pk] + [getattr(instance, field) for field in SEARCH_COLUMNS]
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [instance.pk])
+            cursor.execute(f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES ({placeholders})", values)
+
+    def remove(self, pk):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [pk])
+
+    def search(self, queryset, terms):
+        # Every term must match, each as a prefix
+        match = ' '.join(f'"{term}"*' for term in terms)
+        weights = ', '.join(str(weight) for field, weight in SEARCH_FIELDS)
+        table = queryset.model._meta.db_table
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        ).annotate(search_rank=RawSQL(
+            f"SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = {table}.id",
+            [match],
+            output_field=FloatField(),
+        ))
+
+
+class MySQLSearchBackend:
+    """
+    InnoDB FULLTEXT index over the searchable columns. MySQL keeps it in
+    sync by itself, so index()/remove() have nothing to do.
+    """
+
+    def create_index(self, cursor):
+        columns = ', '.join(SEARCH_COLUMNS)
+        cursor.execute(f"ALTER TABLE backend_property ADD FULLTEXT INDEX {FULLTEXT_INDEX} ({columns})")
+
+    def drop_index(self, cursor):
+        cursor.execute(f"ALTER TABLE backend_property DROP INDEX {FULLTEXT_INDEX}")
+
+    def rebuild(self, cursor):
+        self.drop_index(cursor)
+        self.create_index(cursor)
+
+    def index(self, instance):
+        pass
+
+    def remove(self, pk):
+        pass
+
+    def search(self, queryset, terms):
+        columns = ', '.join(SEARCH_COLUMNS)
+        match = ' '.join(f'+{term}*' for term in terms)
+        expression = f"MATCH ({columns}) AGAINST (%s IN BOOLEAN MODE)"
+        return queryset.annotate(
+            search_rank=RawSQL(expression, [match], output_field=FloatField())
+        ).filter(search_rank__gt=0)
+
+
+class BasicSearchBackend:
+    """
+    Unindexed fallback for other databases: every term must appear in one
+    of the searchable columns. Results are unranked.
+    """
+
+    def create_index(self, cursor):
+        pass
+
+    def drop_index(self, cursor):
+        pass
+
+    def rebuild(self, cursor):
+        pass
+
+    def index(self, instance):
+        pass
+
+    def remove(self, pk):
+        pass
+
+    def search(self, queryset, terms):
+        for term in terms:
+            condition = Q()
+            for field in SEARCH_COLUMNS:
+                condition |= Q(**{f'{field}__icontains': term})
+            queryset = queryset.filter(condition)
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+SEARCH_BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'mysql': MySQLSearchBackend,
+}
+
+def get_search_backend(vendor=None):
+    return SEARCH_BACKENDS.get(vendor or connection.vendor, BasicSearchBackend)()
+
+def search_properties(queryset, query):
+    """
+    Restrict a Property queryset to full-text matches for `query` and
+    annotate each row with `search_rank` (higher is more relevant).
+    A blank query returns the queryset unchanged.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return queryset
+    return get_search_backend().search(queryset, terms)
@@ -0,0 +1,327 @@
+import collections
+from functools import partial
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils import timezone
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+from backend.models import *
+from backend.search import get_search_backend
+from backend.cache import invalidate
+from backend.amenity_index import amenity_index
+from backend.clusters import refresh_cells
+from backend.similarity import similarity_index
+from backend.storage import ContentAddressedStorage
+from backend.image_jobs import deferred_image_fields, enqueue_images
+from backend.renditions import rendition_image_fields, refresh_renditions, delete_renditions, renditions_field_name
+from backend.analytics import ROLLUP_METRICS, rollup_date_fields, mark_rollup_days, mark_property_rollup_days
+from backend.counters import COUNTED_MODELS, PROVIDER, TENANT, apply_counter_deltas, counted_fields, stored_counts
+from django.apps import apps
+
+def review_ratings(review):
+    """
+    The ratings an active review contributes, or None if it contributes
+    nothing (inactive or not attached to a property).
+    """
+    if not review.status or not review.property_id:
+        return None
+    return {field: getattr(review, field) for field in REVIEW_RATING_FIELDS}
+
+def apply_review_ratings(property_id, ratings, sign, create=True):
+    with transaction.atomic():
+        summaries = PropertyRatingSummary.objects.select_for_update().filter(property_id=property_id)
+        summary = summaries.first()
+        if summary is None:
+            if not create:
+                return
+            summary = PropertyRatingSummary(property_id=property_id)
+        summary.apply(ratings, sign)
+        summary.save()
+
+@receiver(pre_save, sender=PropertyReview)
+def snapshot_review_ratings(sender, instance, raw, **kwargs):
+    # Remember what the stored row contributed so post_save can apply the delta
+    instance._stored_ratings = None
+    if instance.pk and not raw:
+        stored = sender.objects.filter(pk=instance.pk).first()
+        if stored:
+            instance._stored_ratings = (stored.property_id, review_ratings(stored))
+
+@receiver(post_save, sender=PropertyReview)
+def update_rating_summary_on_save(sender, instance, raw, **kwargs):
+    if raw:
+        return
+
+    old_property_id, old_ratings = getattr(instance, '_stored_ratings', None) or (None, None)
+    new_ratings = review_ratings(instance)
+    if old_property_id == instance.property_id and old_ratings == new_ratings:
+        return
+
+    if old_ratings:
+        apply_review_ratings(old_property_id, old_ratings, -1)
+    if new_ratings:
+        apply_review_ratings(instance.property_id, new_ratings, 1)
+
+@receiver(post_delete, sender=PropertyReview)
+def update_rating_summary_on_delete(sender, instance, **kwargs):
+    ratings = review_ratings(instance)
+    if ratings:
+        # The summary may already be gone when the property itself is being deleted
+        apply_review_ratings(instance.property_id, ratings, -1, create=False)
+
+@receiver(post_save, sender=Property)
+def update_search_index_on_save(sender, instance, raw, **kwargs):
+    if raw:
+        # loaddata saves rows as they are; run rebuild_search_index afterwards
+        return
+    get_search_backend().index(instance)
+
+@receiver(post_delete, sender=Property)
+def update_search_index_on_delete(sender, instance, **kwargs):
+    get_search_backend().remove(instance.pk)
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+@receiver(post_save, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyImage)
+@receiver(post_save, sender=PropertyReview)
+@receiver(post_delete, sender=PropertyReview)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Amenity)
+@receiver(post_delete, sender=Amenity)
+def invalidate_listing_model(sender, **kwargs):
+    # Cached pages, API responses and facet counts embed these versions
+    invalidate(sender._meta.model_name)
+
+@receiver(m2m_changed, sender=Property.amenities.through)
+def invalidate_property_amenities(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate('property')
+        invalidate('amenity')
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_agents(sender, instance, **kwargs):
+    # The home page lists house providers
+    if instance.role == 'House Provider':
+        invalidate('user')
+
+@receiver(post_save, sender=RentApplication)
+@receiver(post_delete, sender=RentApplication)
+def invalidate_rent_applications(sender, **kwargs):
+    # Who may fetch application images is cached per version (backend/media.py)
+    invalidate('rentapplication')
+
+@receiver(m2m_changed, sender=Property.amenities.through)
+def update_amenity_index(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if action == 'post_clear':
+        if reverse:
+            update = partial(amenity_index.clear_amenity, instance.pk)
+        else:
+            update = partial(amenity_index.remove, [instance.pk])
+    else:
+        method = amenity_index.add if action == 'post_add' else amenity_index.remove
+        if reverse:
+            # amenity.property_set.add()/remove(): pk_set holds property ids
+            update = partial(method, set(pk_set), [instance.pk])
+        else:
+            update = partial(method, [instance.pk], set(pk_set))
+
+    # Only patch the index once the change is visible to other connections
+    transaction.on_commit(update)
+
+@receiver(post_delete, sender=Property)
+def remove_from_amenity_index(sender, instance, **kwargs):
+    transaction.on_commit(partial(amenity_index.remove, [instance.pk]))
+
+@receiver(post_delete, sender=Amenity)
+def drop_from_amenity_index(sender, instance, **kwargs):
+    transaction.on_commit(partial(amenity_index.drop_amenity, instance.pk))
+
+@receiver(pre_save, sender=Property)
+def snapshot_cluster_cell(sender, instance, raw, **kwargs):
+    # Remember the stored cell and price so post_save can tell what moved
+    instance._stored_cluster = None
+    if instance.pk and not raw:
+        instance._stored_cluster = sender.objects.filter(pk=instance.pk).values_list('geohash', 'price_rwf').first()
+
+@receiver(post_save, sender=Property)
+def update_clusters_on_save(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    old_geohash, old_price = getattr(instance, '_stored_cluster', None) or (None, None)
+    if (old_geohash, old_price) == (instance.geohash, instance.price_rwf):
+        return
+    transaction.on_commit(partial(refresh_cells, {old_geohash, instance.geohash}))
+
+@receiver(post_delete, sender=Property)
+def update_clusters_on_delete(sender, instance, **kwargs):
+    if instance.geohash:
+        transaction.on_commit(partial(refresh_cells, {instance.geohash}))
+
+@receiver(post_save, sender=Property)
+def update_similarity_on_save(sender, instance, raw, **kwargs):
+    if not raw:
+        transaction.on_commit(partial(similarity_index.refresh, instance.pk))
+
+@receiver(post_save, sender=PropertyRatingSummary)
+def update_similarity_on_rating(sender, instance, raw, **kwargs):
+    if not raw:
+        transaction.on_commit(partial(similarity_index.refresh, instance.property_id))
+
+@receiver(m2m_changed, sender=Property.amenities.through)
+def update_similarity_on_amenities(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        transaction.on_commit(partial(similarity_index.refresh, instance.pk))
+    elif pk_set:
+        for property_id in pk_set:
+            transaction.on_commit(partial(similarity_index.refresh, property_id))
+
+@receiver(post_delete, sender=Property)
+def remove_from_similarity_index(sender, instance, **kwargs):
+    transaction.on_commit(partial(similarity_index.remove, instance.pk))
+
+def touch_properties(properties):
+    # Property.updated_at drives the ETag/Last-Modified validators; bump it
+    # when something it displays changes without saving the property.
+    properties.update(updated_at=timezone.now())
+
+@receiver(post_delete, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyReview)
+def touch_property_on_child_delete(sender, instance, **kwargs):
+    if instance.property_id:
+        touch_properties(Property.objects.filter(pk=instance.property_id))
+
+@receiver(m2m_changed, sender=Property.amenities.through)
+def touch_property_on_amenities(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        touch_properties(instance.property_set.all())
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        if not reverse:
+            touch_properties(Property.objects.filter(pk=instance.pk))
+        elif pk_set:
+            touch_properties(Property.objects.filter(pk__in=pk_set))
+
+@receiver(post_save, sender=Amenity)
+@receiver(pre_delete, sender=Amenity)
+def touch_properties_on_amenity(sender, instance, **kwargs):
+    touch_properties(instance.property_set.all())
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def touch_properties_on_category(sender, instance, **kwargs):
+    touch_properties(instance.properties.all())
+
+def counters_untouched(sender, update_fields):
+    # e.g. the last_login save on every sign-in
+    return update_fields is not None and not counted_fields(sender) & set(update_fields)
+
+def snapshot_counters(sender, instance, raw, update_fields=None, **kwargs):
+    # Remember what the stored row counts towards so post_save can apply
+    # the difference. A property changing hands moves its applications
+    # and contracts to the new provider's counters as well.
+    instance._stored_counters = None
+    if instance.pk and not raw and not counters_untouched(sender, update_fields):
+        with_children = sender is Property and sender.objects.filter(pk=instance.pk).exclude(created_by=instance.created_by_id).exists()
+        instance._stored_counters = (with_children, stored_counts(instance, with_children))
+
+def update_counters_on_save(sender, instance, raw, update_fields=None, **kwargs):
+    if raw or counters_untouched(sender, update_fields):
+        return
+    with_children, old = getattr(instance, '_stored_counters', None) or (False, collections.Counter())
+    deltas = stored_counts(instance, with_children)
+    deltas.subtract(old)
+    apply_counter_deltas(deltas)
+
+def snapshot_counters_on_delete(sender, instance, **kwargs):
+    # Read before the cascade removes the property that names the provider
+    instance._deleted_counters = stored_counts(instance)
+
+def update_counters_on_delete(sender, instance, **kwargs):
+    stored = getattr(instance, '_deleted_counters', None) or collections.Counter()
+    apply_counter_deltas({key: -value for key, value in stored.items()})
+    if sender is User:
+        # Emptied by the cascade above
+        DashboardCounter.objects.filter(scope__in=[PROVIDER, TENANT], owner_id=instance.pk).delete()
+
+for model in COUNTED_MODELS:
+    pre_save.connect(snapshot_counters, sender=model, dispatch_uid=f'snapshot_counters:{model._meta.label}')
+    post_save.connect(update_counters_on_save, sender=model, dispatch_uid=f'update_counters:{model._meta.label}')
+    pre_delete.connect(snapshot_counters_on_delete, sender=model, dispatch_uid=f'snapshot_counters_on_delete:{model._meta.label}')
+    post_delete.connect(update_counters_on_delete, sender=model, dispatch_uid=f'update_counters_on_delete:{model._meta.label}')
+
+def snapshot_rollup_rows(sender, instance, raw, **kwargs):
+    # Remember the stored dates (and a property's city and category) so
+    # post_save can tell which rolled-up days the row left
+    instance._stored_rollup = None
+    if instance.pk and not raw:
+        fields = [date_field for metric, date_field in rollup_date_fields(sender)]
+        if sender is Property:
+            fields += ['city', 'category_id']
+        instance._stored_rollup = sender.objects.filter(pk=instance.pk).values(*fields).first()
+
+def mark_rollup_days_on_save(sender, instance, raw, **kwargs):
+    stored = getattr(instance, '_stored_rollup', None)
+    if raw or not stored:
+        return
+    # The new day is found by its updated_at; the old one has nothing left
+    for metric, date_field in rollup_date_fields(sender):
+        if stored[date_field] != getattr(instance, date_field):
+            mark_rollup_days(metric, [stored[date_field]])
+    if sender is Property and (stored['city'], stored['category_id']) != (instance.city, instance.category_id):
+        mark_property_rollup_days(instance.pk)
+
+def mark_rollup_days_on_delete(sender, instance, **kwargs):
+    # Cascades send this per row too
+    for metric, date_field in rollup_date_fields(sender):
+        mark_rollup_days(metric, [getattr(instance, date_field)])
+
+@receiver(pre_delete, sender=Category)
+def mark_rollup_days_on_category(sender, instance, **kwargs):
+    # Its properties are left uncategorized by an update, without signals
+    for property_id in instance.properties.values_list('pk', flat=True):
+        mark_property_rollup_days(property_id)
+
+for model in {spec[0] for spec in ROLLUP_METRICS.values()}:
+    pre_save.connect(snapshot_rollup_rows, sender=model, dispatch_uid=f'snapshot_rollup_rows:{model._meta.label}')
+    post_save.connect(mark_rollup_days_on_save, sender=model, dispatch_uid=f'mark_rollup_days:{model._meta.label}')
+    post_delete.connect(mark_rollup_days_on_delete, sender=model, dispatch_uid=f'mark_rollup_days_on_delete:{model._meta.label}')
+
+def enqueue_deferred_images(sender, instance, raw, **kwargs):
+    # Raw uploads saved by DeferredProcessedImageField; queued in the same
+    # transaction so that a committed upload always has its job
+    pending = instance.__dict__.pop('_pending_images', None)
+    if pending and not raw:
+        enqueue_images(instance, pending)
+
+def update_renditions(sender, instance, raw, **kwargs):
+    if not raw:
+        for name in rendition_image_fields(sender):
+            refresh_renditions(instance, name)
+
+def remove_renditions(sender, instance, **kwargs):
+    for name in rendition_image_fields(sender):
+        delete_renditions(getattr(instance, name).storage, getattr(instance, renditions_field_name(name)))
+
+def release_files(sender, instance, **kwargs):
+    # Drop the row's reference to each content-addressed file once the
+    # delete commits; cascades send this per row too
+    for field in instance._meta.fields:
+        if isinstance(field, models.FileField) and isinstance(field.storage, ContentAddressedStorage):
+            file = getattr(instance, field.name)
+            if file:
+                transaction.on_commit(partial(field.storage.delete, file.name))
+
+for model in apps.get_models():
+    if any(isinstance(field, models.FileField) for field in model._meta.fields):
+        post_delete.connect(release_files, sender=model, dispatch_uid=f'release_files:{model._meta.label}')
+    if deferred_image_fields(model):
+        post_save.connect(enqueue_deferred_images, sender=model, dispatch_uid=f'enqueue_images:{model._meta.label}')
+    if rendition_image_fields(model):
+        post_save.connect(update_renditions, sender=model, dispatch_uid=f'update_renditions:{model._meta.label}')
+        post_delete.connect(remove_renditions, sender=model, dispatch_uid=f'remove_renditions:{model._meta.label}')
@@ -0,0 +1,325 @@
+import os
+import re
+import math
+import threading
+import numpy as np
+from contextlib import contextmanager
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from backend.models import *
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+CATEGORY_BUCKETS = 16
+AMENITY_BUCKETS = 64
+
+# Relative weight of each feature group in the cosine similarity
+FEATURE_WEIGHTS = {
+    'city': 1.0,
+    'type': 0.8,
+    'category': 1.0,
+    'capacity': 0.8,
+    'bathroom': 0.5,
+    'size': 0.5,
+    'price': 1.2,
+    'amenities': 1.0,
+    'rating': 0.4,
+}
+
+# Upper end of each numeric feature's scale; larger values are clipped
+NUMERIC_SCALES = {
+    'capacity': 10,
+    'bathroom': 6,
+    'size': 1000,
+    'price': 10_000_000,
+    'rating': 5,
+}
+
+CITY_INDEX = {code: index for index, (code, label) in enumerate(Property.CITY_CHOICES)}
+TYPE_INDEX = {code: index for index, (code, label) in enumerate(Property.TYPE_CHOICES)}
+
+def build_layout(groups):
+    """Map each feature group to its slice of the vector."""
+    layout, offset = {}, 0
+    for name, width in groups:
+        layout[name] = slice(offset, offset + width)
+        offset += width
+    return layout, offset
+
+LAYOUT, DIMENSIONS = build_layout((
+    ('city', len(CITY_INDEX)),
+    ('type', len(TYPE_INDEX)),
+    ('category', CATEGORY_BUCKETS),
+    ('amenities', AMENITY_BUCKETS),
+    ('capacity', 2), ('bathroom', 2), ('size', 2), ('price', 2), ('rating', 2),
+))
+
+def parse_size(size):
+    match = re.search(r'\d+(?:\.\d+)?', size or '')
+    return float(match.group()) if match else None
+
+def angle_pair(value, scale, logarithmic=False):
+    """
+    Encode a number as a point on a quarter circle, so that the dot
+    product of two encodings is cos() of their (scaled) difference.
+    """
+    if logarithmic:
+        position = math.log1p(max(value, 0)) / math.log1p(scale)
+    else:
+        position = max(value, 0) / scale
+    angle = min(position, 1.0) * math.pi / 2
+    return math.cos(angle), math.sin(angle)
+
+def encode_property(prop, amenity_ids=None, rating=None):
+    """
+    The unit-length feature vector for a property. `amenity_ids` and
+    `rating` may be passed in to avoid querying them again.
+    """
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+
+    def one_hot(group, index):
+        if index is not None:
+            vector[LAYOUT[group].start + index] = FEATURE_WEIGHTS[group]
+
+    one_hot('city', CITY_INDEX.get(prop.city))
+    one_hot('type', TYPE_INDEX.get(prop.type))
+    one_hot('category', prop.category_id % CATEGORY_BUCKETS if prop.category_id else None)
+
+    if amenity_ids is None:
+        amenity_ids = list(prop.amenities.values_list('id', flat=True))
+    if amenity_ids:
+        group = vector[LAYOUT['amenities']]
+        for amenity_id in amenity_ids:
+            group[amenity_id % AMENITY_BUCKETS] = 1.0
+        group *= FEATURE_WEIGHTS['amenities'] / np.linalg.norm(group)
+
+    if rating is None:
+        rating = prop.get_rating_summary().overall_rating
+    price = prop.price_rwf if prop.price_rwf else None
+    numbers = {
+        'capacity': (prop.capacity, False),
+        'bathroom': (prop.bathroom, False),
+        'size': (parse_size(prop.size), True),
+        'price': (price, True),
+        'rating': (rating or None, False),
+    }
+    for group, (value, logarithmic) in numbers.items():
+        if value is not None:
+            pair = angle_pair(value, NUMERIC_SCALES[group], logarithmic)
+            vector[LAYOUT[group]] = [FEATURE_WEIGHTS[group] * component for component in pair]
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SimilarityIndex:
+    """
+    Unit feature vectors for every property in a memory-mapped .npy
+    matrix, row N holding property N, next to a byte array marking which
+    rows are filled. Top-k cosine similarity is one matrix-vector product.
+
+    Rows are written in place by the Property signals, so other processes
+    see them through the shared mapping. Growing the file or rebuilding it
+    replaces both files; every process compares their inodes on each use
+    and reopens when they change. Writes and replacements hold an
+    exclusive lock on a file next to them, so no write lands in a file
+    that is being replaced.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+        self._lock = threading.RLock()
+        self._matrix = None
+        self._present = None
+        self._opened = None
+
+    @property
+    def path(self):
+        return self._path or getattr(
+            settings, 'SIMILARITY_INDEX_PATH', os.path.join(settings.BASE_DIR, 'var', 'similar_properties.npy')
+        )
+
+    @property
+    def present_path(self):
+        return self.path[:-len('.npy')] + '.present.npy'
+
+    @property
+    def lock_path(self):
+        return self.path[:-len('.npy')] + '.lock'
+
+    @contextmanager
+    def _file_lock(self, shared=False):
+        """Hold the index's lock file: exclusive for writers, shared for readers opening it."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _files(self):
+        """The path and inodes of the matrix and present files, or None if either is missing."""
+        try:
+            return self.path, os.stat(self.path).st_ino, os.stat(self.present_path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def _create(self, capacity, matrix=None, present=None):
+        # Callers hold the exclusive file lock
+        for path, shape, dtype, old in (
+            (self.path, (capacity, DIMENSIONS), np.float32, matrix),
+            (self.present_path, (capacity,), np.uint8, present),
+        ):
+            temporary = f'{path}.tmp'
+            new = np.lib.format.open_memmap(temporary, mode='w+', dtype=dtype, shape=shape)
+            if old is not None:
+                new[:len(old)] = old
+            new.flush()
+            del new
+            os.replace(temporary, path)
+        self._matrix = None
+
+    def _open(self, locked=False):
+        """
+        The mapped matrix and present array, reopened if the files were
+        replaced since they were mapped. Pass `locked` when already holding
+        the file lock; otherwise a shared lock is taken to reopen, so the
+        two files are never read halfway through a replacement.
+        """
+        files = self._files()
+        if self._matrix is not None and self._opened == files:
+            return self._matrix, self._present
+        self._matrix = self._present = self._opened = None
+        if files is None:
+            return None, None
+        if not locked:
+            with self._file_lock(shared=True):
+                return self._open(locked=True)
+
+        matrix = np.load(self.path, mmap_mode='r+')
+        if matrix.shape[1:] != (DIMENSIONS,):
+            # Written with another feature layout; needs a rebuild
+            return None, None
+        self._matrix = matrix
+        self._present = np.load(self.present_path, mmap_mode='r+')
+        self._opened = files
+        return self._matrix, self._present
+
+    def _ensure_capacity(self, pk):
+        # Callers hold the exclusive file lock
+        matrix, present = self._open(locked=True)
+        if matrix is not None and pk < len(matrix):
+            return matrix, present
+        capacity = max(1024, 1 << int(pk).bit_length())
+        self._create(capacity, matrix, present)
+        return self._open(locked=True)
+
+    def refresh(self, pk):
+        """Re-encode one property from the database, or drop it if deleted."""
+        prop = Property.objects.with_rating_summary().filter(pk=pk).first()
+        if prop is None:
+            return self.remove(pk)
+        vector = encode_property(prop)
+        with self._lock, self._file_lock():
+            matrix, present = self._ensure_capacity(pk)
+            matrix[pk] = vector
+            present[pk] = 1
+
+    def remove(self, pk):
+        with self._lock, self._file_lock():
+            matrix, present = self._open(locked=True)
+            if matrix is not None and pk < len(matrix):
+                present[pk] = 0
+                matrix[pk] = 0
+
+    def rebuild(self, chunk_size=1000):
+        """
+        Encode every property into fresh files. Properties changed or
+        deleted while encoding are caught up once the files are in place.
+        Returns the number encoded.
+        """
+        started = timezone.now()
+        last = Property.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        capacity = max(1024, 1 << int(last).bit_length())
+        matrix = np.zeros((capacity, DIMENSIONS), dtype=np.float32)
+        present = np.zeros(capacity, dtype=np.uint8)
+
+        count = 0
+        properties = Property.objects.with_rating_summary().prefetch_related('amenities')
+        for prop in properties.iterator(chunk_size=chunk_size):
+            matrix[prop.pk] = encode_property(
+                prop,
+                amenity_ids=[amenity.id for amenity in prop.amenities.all()],
+                rating=prop.get_rating_summary().overall_rating,
+            )
+            present[prop.pk] = 1
+            count += 1
+
+        with self._lock:
+            with self._file_lock():
+                self._create(capacity, matrix, present)
+            changed = Property.objects.filter(
+                Q(updated_at__gte=started) | Q(rating_summary__updated_at__gte=started)
+            ).values_list('id', flat=True)
+            existing = set(Property.objects.values_list('id', flat=True))
+            for pk in set(changed) | (set(np.flatnonzero(present).tolist()) - existing):
+                self.refresh(pk)
+        return count
+
+    def similar(self, prop, k=4):
+        """
+        (property id, cosine similarity) pairs for the `k` properties most
+        similar to `prop`, best first. Empty if the index has not been built.
+        """
+        with self._lock:
+            matrix, present = self._open()
+        if matrix is None:
+            return []
+
+        if prop.pk < len(matrix) and present[prop.pk]:
+            vector = np.array(matrix[prop.pk])
+        else:
+            vector = encode_property(prop)
+
+        scores = matrix @ vector
+        scores[present == 0] = -np.inf
+        if prop.pk < len(scores):
+            scores[prop.pk] = -np.inf
+
+        available = int(np.count_nonzero(np.isfinite(scores)))
+        k = min(k, available)
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(int(pk), float(scores[pk])) for pk in best]
+
+
+similarity_index = SimilarityIndex()
+
+def similar_properties(prop, k=4, queryset=None):
+    """
+    The `k` properties most similar to `prop` as model instances, best
+    first, each with a `similarity` attribute. Falls back to the latest
+    listings while the index has not been built.
+    """
+    queryset = Property.objects.all() if queryset is None else queryset
+    matches = similarity_index.similar(prop, k)
+    if not matches:
+        return list(queryset.exclude(pk=prop.pk).order_by('-created_at')[:k])
+
+    properties = queryset.in_bulk([pk for pk, score in matches])
+    results = []
+    for pk, score in matches:
+        if pk in properties:
+            properties[pk].similarity = round(score, 4)
+            results.append(properties[pk])
+    return results
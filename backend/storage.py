@@ -0,0 +1,131 @@
+import os
+import hashlib
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+CONTENT_PREFIX = 'cas'
+
+def content_name(digest, extension, namespace=''):
+    if namespace:
+        return f'{CONTENT_PREFIX}/{namespace}/{digest[:2]}/{digest}{extension.lower()}'
+    return f'{CONTENT_PREFIX}/{digest[:2]}/{digest}{extension.lower()}'
+
+def content_namespace(name):
+    """
+    The top directory `name` was filed under by its field's upload_to, which
+    a content-addressed name keeps: identical bytes uploaded to different
+    fields (a public photo and a private ID image) stay separate files.
+    """
+    parts = name.replace('\\', '/').split('/')
+    if parts[0] == CONTENT_PREFIX:
+        # Already content-addressed, e.g. a rendered upload; names stored
+        # before namespaces were kept have none
+        return parts[1] if len(parts) == 4 else ''
+    return parts[0] if len(parts) > 1 else ''
+
+def is_content_addressed(name):
+    return bool(name) and name.startswith(f'{CONTENT_PREFIX}/')
+
+def is_bookkeeping(name):
+    """Reference counts and lock files kept beside the blobs, not media."""
+    return is_content_addressed(name) and (name.endswith('.refs') or os.path.basename(name) == '.lock')
+
+def file_digest(content):
+    digest = hashlib.sha256()
+    for chunk in content.chunks():
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    A FileSystemStorage that names every saved file after the SHA-256 of
+    its bytes, `cas/<namespace>/<first two hex digits>/<hash><extension>`,
+    where the namespace is the top directory of the name it was asked for
+    (see content_namespace()). Identical uploads to the same kind of field
+    share one file, and the bytes behind a name never change, so media URLs
+    can be cached forever.
+
+    Each save() of bytes already stored adds a reference instead of a copy
+    and each delete() drops one; the file goes with its last reference.
+    Deleting a row releases the references of its file fields (see
+    backend.signals.release_files).
+    Counts live in a `<name>.refs` file beside the blob, updated under a
+    per-directory lock so the image worker processes can save and delete
+    too. Names outside `cas/` (media stored before this backend) behave as
+    in FileSystemStorage.
+    """
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        name = content_name(file_digest(content), os.path.splitext(name)[1], content_namespace(name))
+        with self.locked(name):
+            if self.exists(name):
+                self.add_reference(name)
+            else:
+                self._save(name, content)
+                self.set_references(name, 1)
+        return name
+
+    def delete(self, name):
+        if not is_content_addressed(name):
+            return super().delete(name)
+        with self.locked(name):
+            if self.add_reference(name, -1) <= 0:
+                super().delete(name)
+                super().delete(self.references_name(name))
+
+    def references_name(self, name):
+        return f'{name}.refs'
+
+    def references(self, name):
+        """How many saves of `name` have not been deleted yet."""
+        try:
+            with open(self.path(self.references_name(name))) as counter:
+                return int(counter.read() or 0)
+        except FileNotFoundError:
+            # A blob written without a counter (e.g. copied in) has one user
+            return 1 if self.exists(name) else 0
+
+    def add_reference(self, name, count=1):
+        """
+        Adjust the reference count of a stored name by `count`; callers
+        hold locked(name). Returns the new count.
+        """
+        return self.set_references(name, max(self.references(name) + count, 0))
+
+    def set_references(self, name, references):
+        path = self.path(self.references_name(name))
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'w') as counter:
+            counter.write(str(references))
+        os.replace(temporary, path)
+        return references
+
+    @contextmanager
+    def locked(self, name):
+        directory = os.path.dirname(self.path(name))
+        os.makedirs(directory, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(directory, '.lock'), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+def immutable_max_age():
+    return getattr(settings, 'MEDIA_IMMUTABLE_MAX_AGE', 365 * 24 * 60 * 60)
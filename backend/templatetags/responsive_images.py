@@ -0,0 +1,40 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+from backend.renditions import RENDITION_FORMATS, current_renditions, srcset
+
+register = template.Library()
+
+@register.simple_tag
+def responsive_image(image, alt='', sizes='100vw', **attributes):
+    """
+    Render an image field as a <picture> offering its WebP and JPEG
+    renditions through `srcset`/`sizes`, so the browser downloads the
+    smallest one that fills the slot, with the stored blurred placeholder
+    as the <img> background until it arrives. Falls back to a plain <img>
+    while the image has no renditions (or is still being processed). Any
+    further keyword arguments become attributes of the <img>:
+
+        {% responsive_image property.image property.name sizes="(max-width: 767px) 100vw, 420px" class="img-fluid" %}
+    """
+    if not image:
+        return ''
+    attributes.setdefault('loading', 'lazy')
+    renditions = current_renditions(image)
+    if renditions and renditions.get('placeholder'):
+        attributes['style'] = f"background: url({renditions['placeholder']}) center / cover no-repeat; {attributes.get('style', '')}".strip()
+    extra = format_html_join('', ' {}="{}"', ((key.replace('_', '-'), value) for key, value in attributes.items()))
+
+    if renditions is None:
+        return format_html('<img src="{}" alt="{}"{}>', image.url, alt, extra)
+
+    # The middle width is the src for browsers without srcset support
+    widths = sorted(renditions['files'], key=int)
+    fallback = image.storage.url(renditions['files'][widths[len(widths) // 2]]['jpeg'])
+    sources = format_html_join('', '<source type="{}" srcset="{}" sizes="{}">', (
+        (mime, srcset(image, key), sizes)
+        for key, (pil_format, extension, mime) in RENDITION_FORMATS.items() if key != 'jpeg'
+    ))
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}" alt="{}"{}></picture>',
+        sources, fallback, srcset(image, 'jpeg'), sizes, alt, extra,
+    )
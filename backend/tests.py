@@ -1,3 +1,997 @@
-from django.test import TestCase
+import io
+import os
+import base64
+import zipfile
+import tempfile
+from datetime import date, datetime, time, timedelta
+from unittest import mock
+from PIL import Image
+from django.test import TestCase, override_settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.cache import cache
+from django.utils import timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from backend.models import *
+from backend.analytics import rollup_analytics, timeseries
+from backend.cache import bump_cache_version, cache_version, cache_versions
+from backend.counters import reconcile_counters
+from backend.facets import compute_facets
+from backend.search import search_properties
+from backend.geo import filter_by_location, geohash_encode, geohash_successor, parse_geo_params
+from django.http import QueryDict
+from backend.amenity_index import AmenityBitmapIndex, amenity_index
+from backend.similarity import SimilarityIndex
+from backend.storage import ContentAddressedStorage
+from backend.gallery import ingest_gallery
+from backend.image_jobs import claim_jobs, fail_job, finish_job, render_job, run_workers, start_job
+from django.templatetags.static import static
+from django.template import Context, Template
+from api.serializers import PropertyImageSerializer, PropertySerializer
+from backend.renditions import render_placeholder
+from backend.reports import cached_report, evict_reports, report_filename, write_report
+from backend.utils.report_layout import word_width, wrap_text
+from django.urls import reverse
+from django.core.management import call_command
+from backend.media_gc import referenced_keys
+from users.models import RentApplication
+from backend.metrics import overview_metrics, tenant_metrics
 
-# Create your tests here.
+def png_upload(name='photo.png', size=(800, 600), color='red'):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'PNG')
+    return ContentFile(buffer.getvalue(), name=name)
+
+class DashboardMetricsQueryTests(TestCase):
+    """
+    Dashboard numbers are read from the scope's DashboardCounter rows in a
+    single query, however many applications and contracts exist, and the
+    signals keep those rows equal to a recount of the tables.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@example.com', name='Admin', phone_number='0780000001',
+            password='secret', role='Admin',
+        )
+        cls.provider = User.objects.create_user(
+            email='provider@example.com', name='Provider', phone_number='0780000002',
+            password='secret', role='House Provider',
+        )
+        cls.tenant = User.objects.create_user(
+            email='tenant@example.com', name='Tenant', phone_number='0780000003',
+            password='secret', role='User',
+        )
+        cls.category = Category.objects.create(name='Apartment')
+
+    def create_rentals(self, count):
+        statuses = [value for value, label in RentApplication.STATUS_CHOICES]
+        contract_statuses = [value for value, label in Contract.STATUS_CHOICES]
+        for i in range(count):
+            prop = Property.objects.create(
+                name=f'Property {Property.objects.count()}', description='Listing',
+                category=self.category, created_by=self.provider, city='Kacyiru', type='Rent',
+            )
+            RentApplication.objects.create(user=self.tenant, property=prop, status=statuses[i % len(statuses)])
+            Contract.objects.create(
+                tenant=self.tenant, agent=self.provider, property=prop,
+                end_date=date(2030, 1, 1), rent_due_date=date(2030, 1, 1), rental_period_months=12,
+                rent_amount=500, security_deposit=1000,
+                status=contract_statuses[i % len(contract_statuses)],
+                payment_status='Overdue' if i % 2 else 'Paid',
+            )
+
+    def count_queries(self, function, user):
+        with CaptureQueriesContext(connection) as ctx:
+            metrics = function(user)
+        return metrics, len(ctx.captured_queries)
+
+    def test_query_budget(self):
+        self.create_rentals(2)
+        budgets = [(tenant_metrics, self.tenant, 1), (overview_metrics, self.provider, 1), (overview_metrics, self.admin, 1)]
+        for function, user, budget in budgets:
+            self.assertEqual(self.count_queries(function, user)[1], budget)
+        self.create_rentals(10)
+        for function, user, budget in budgets:
+            self.assertEqual(self.count_queries(function, user)[1], budget)
+
+    def test_tenant_metrics_match_plain_counts(self):
+        self.create_rentals(9)
+        metrics = tenant_metrics(self.tenant)
+        applications = RentApplication.objects.filter(user=self.tenant)
+        contracts = Contract.objects.filter(tenant=self.tenant)
+        self.assertEqual(metrics.total_applications, applications.count())
+        self.assertEqual(metrics.status_data, [
+            applications.filter(status=value).count() for value, label in RentApplication.STATUS_CHOICES
+        ])
+        self.assertEqual(metrics.total_contracts, contracts.count())
+        self.assertEqual(metrics.active_contracts, contracts.filter(status='Active').count())
+        self.assertEqual(metrics.overdue_contracts, contracts.filter(payment_status='Overdue').count())
+
+    def test_overview_metrics_scope(self):
+        self.create_rentals(5)
+        other = User.objects.create_user(
+            email='other@example.com', name='Other', phone_number='0780000004',
+            password='secret', role='House Provider',
+        )
+        provider = overview_metrics(other)
+        self.assertEqual(provider.dashboard_type, 'provider')
+        self.assertEqual((provider.total_properties, provider.total_applications, provider.total_contracts), (0, 0, 0))
+        self.assertIsNone(provider.total_users)
+
+        admin = overview_metrics(self.admin)
+        self.assertEqual(admin.dashboard_type, 'admin')
+        self.assertEqual((admin.total_users, admin.total_providers), (1, 2))
+        self.assertEqual(admin.total_properties, 5)
+        self.assertEqual(sum(row['count'] for row in admin.contract_status_counts), 5)
+        self.assertEqual(
+            {row['status']: row['count'] for row in admin.app_status_counts},
+            {'Pending': 2, 'Accepted': 1, 'Rejected': 1, 'Moved Out': 1},
+        )
+
+    def assertCountersInSync(self):
+        self.assertEqual(reconcile_counters(fix=False), [])
+
+    def test_signals_keep_counters_in_sync(self):
+        self.create_rentals(4)
+        self.assertCountersInSync()
+
+        application = RentApplication.objects.filter(status='Pending').first()
+        application.status = 'Accepted'
+        application.save()
+        contract = Contract.objects.first()
+        contract.payment_status = 'Overdue'
+        contract.save()
+        self.assertCountersInSync()
+
+        # Handing a property to another provider moves its applications and contracts
+        other = User.objects.create_user(
+            email='other@example.com', name='Other', phone_number='0780000004',
+            password='secret', role='House Provider',
+        )
+        prop = application.property
+        prop.created_by = other
+        prop.save()
+        self.assertCountersInSync()
+        self.assertEqual(overview_metrics(other).total_applications, 1)
+
+        prop.delete()
+        User.objects.get(pk=self.tenant.pk).delete()
+        self.assertCountersInSync()
+        self.assertEqual(tenant_metrics(self.tenant).total_applications, 0)
+
+    def test_reconcile_reports_and_fixes_drift(self):
+        self.create_rentals(3)
+        # Bulk updates bypass the signals
+        RentApplication.objects.update(status='Rejected')
+        drift = reconcile_counters(fix=False)
+        self.assertIn((('Global', 0, 'applications', 'Rejected'), 1, 3), drift)
+        self.assertEqual(reconcile_counters(), drift)
+        self.assertCountersInSync()
+        self.assertEqual(tenant_metrics(self.tenant).rejected_applications, 3)
+
+@override_settings(ROLLUP_WATERMARK_OVERLAP=0)
+class AnalyticsRollupTests(TestCase):
+    """
+    The nightly rollup only reads the days after its cursor and the older
+    days whose rows were saved since its last run, and time series are
+    merged from the daily rows.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = User.objects.create_user(
+            email='provider@example.com', name='Provider', phone_number='0780000002',
+            password='secret', role='House Provider',
+        )
+        cls.tenant = User.objects.create_user(
+            email='tenant@example.com', name='Tenant', phone_number='0780000003',
+            password='secret', role='User',
+        )
+        cls.category = Category.objects.create(name='Apartment')
+
+    def create_application(self, day, city='Kacyiru', status='Pending', price=100000):
+        created_at = timezone.make_aware(datetime.combine(day, time(12)))
+        prop = Property.objects.create(
+            name=f'Property {Property.objects.count()}', description='Listing', category=self.category,
+            created_by=self.provider, city=city, type='Rent', price_rwf=price, created_at=created_at,
+        )
+        return RentApplication.objects.create(user=self.tenant, property=prop, status=status, created_at=created_at)
+
+    def test_incremental_rollup_and_series(self):
+        monday = date(2026, 3, 2)
+        self.create_application(monday, price=100000)
+        self.create_application(monday, city='Rebero', status='Accepted', price=300000)
+        self.create_application(monday + timedelta(days=1))
+        self.assertEqual(rollup_analytics(through=monday)['applications'], 2)
+
+        # Nothing new up to the cursor; the next night picks up the next day
+        # and the one day a backdated row was added to
+        self.assertEqual(rollup_analytics(through=monday)['applications'], 0)
+        self.create_application(monday - timedelta(days=3))
+        with CaptureQueriesContext(connection) as ctx:
+            written = rollup_analytics(through=monday + timedelta(days=1))
+        self.assertEqual(written['applications'], 2)
+        self.assertEqual(DailyRollup.objects.filter(metric='applications').count(), 4)
+        self.assertFalse([query for query in ctx.captured_queries if '2026-03-01' in query['sql'] or '2026-03-02' in query['sql']])
+
+        series = timeseries('applications', monday, monday + timedelta(days=6), granularity='week')
+        self.assertEqual(series['labels'], ['2026-03-02'])
+        self.assertEqual(series['series'][0]['counts'], [3])
+        self.assertEqual(series['series'][0]['average_rent'], [round(500000 / 3, 2)])
+
+        by_city = timeseries('applications', monday, monday + timedelta(days=1), group_by='city')
+        self.assertEqual(
+            {row['label']: row['counts'] for row in by_city['series']},
+            {'Kacyiru': [1, 1], 'Rebero': [1, 0]},
+        )
+        listings = timeseries('listings', monday, monday, group_by='category')
+        self.assertEqual([row['label'] for row in listings['series']], ['Apartment'])
+
+    def test_retroactive_changes_are_rolled_up_again(self):
+        monday = date(2026, 3, 2)
+        application = self.create_application(monday)
+        contract = Contract.objects.create(
+            tenant=self.tenant, agent=self.provider, property=application.property,
+            end_date=date(2030, 1, 1), rent_due_date=date(2030, 1, 1), rental_period_months=12,
+            rent_amount=500, security_deposit=1000,
+        )
+        rollup_analytics(through=monday)
+
+        # Signed and accepted later, dated back to Monday
+        contract.signed_date = monday
+        contract.save()
+        application.status = 'Accepted'
+        application.save()
+        written = rollup_analytics(through=monday)
+        self.assertEqual((written['signed_contracts'], written['applications']), (1, 1))
+        self.assertEqual(DailyRollup.objects.get(metric='signed_contracts').day, monday)
+        self.assertEqual(DailyRollup.objects.get(metric='applications').status, 'Accepted')
+
+    def test_deleted_rows_and_moved_properties_are_rolled_up_again(self):
+        monday = date(2026, 3, 2)
+        first = self.create_application(monday)
+        second = self.create_application(monday, city='Rebero')
+        rollup_analytics(through=monday)
+
+        # Deleting the property deletes its application by cascade
+        with self.captureOnCommitCallbacks(execute=True):
+            first.property.delete()
+        rollup_analytics(through=monday)
+        self.assertEqual(timeseries('applications', monday, monday)['series'][0]['counts'], [1])
+        self.assertEqual(timeseries('listings', monday, monday)['series'][0]['counts'], [1])
+
+        second.property.city = 'Kacyiru'
+        second.property.save()
+        rollup_analytics(through=monday)
+        self.assertEqual(DailyRollup.objects.get(metric='applications').city, 'Kacyiru')
+        self.assertFalse(RollupDirtyDay.objects.exists())
+
+class CacheVersionTests(TestCase):
+    """
+    Cache versions live in the database: clearing or culling the cache
+    does not reset them, and a bumped version is never one seen before.
+    """
+
+    def test_versions_survive_the_cache_and_never_repeat(self):
+        first = cache_version('property')
+        cache.clear()
+        self.assertEqual(cache_version('property'), first)
+
+        seen = {first}
+        for i in range(3):
+            version = bump_cache_version('property')
+            self.assertGreater(version, max(seen))
+            seen.add(version)
+        CacheVersion.objects.all().delete()
+        self.assertGreater(cache_version('property'), max(seen))
+
+    def test_versions_are_read_once_per_request(self):
+        request = type('Request', (), {})()
+        with CaptureQueriesContext(connection) as ctx:
+            fragment = cache_versions('property', 'category', request=request)
+            self.assertEqual(cache_versions('property', 'category', request=request), fragment)
+        self.assertEqual(len([query for query in ctx.captured_queries if query['sql'].startswith('SELECT')]), 1)
+
+class AmenityIndexTests(TestCase):
+    """
+    A change patched into one process's amenity bitmaps is seen by the
+    others, here a second index standing in for another worker with its
+    own local-memory cache.
+    """
+
+    def test_other_processes_reload_after_a_change(self):
+        pool, wifi = Amenity.objects.create(name='Pool'), Amenity.objects.create(name='Wifi')
+        prop = Property.objects.create(name='Listing', description='Listing')
+        other = AmenityBitmapIndex()
+        self.assertEqual(other.match_all([pool.id]), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            prop.amenities.add(pool, wifi)
+        cache.clear()
+        self.assertEqual(other.to_ids(other.match_all([pool.id, wifi.id])), [prop.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            prop.amenities.remove(wifi)
+        self.assertEqual(other.match_any([wifi.id]), 0)
+        self.assertEqual(amenity_index.to_ids(amenity_index.match_all([pool.id])), [prop.id])
+
+class SimilarityIndexTests(TestCase):
+    """
+    Two indexes on one file stand in for two worker processes: after one
+    replaces the files, the other reopens them instead of writing to or
+    reading from the unlinked copy.
+    """
+
+    def test_processes_follow_a_replaced_file(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'similar.npy')
+        first, second = SimilarityIndex(path), SimilarityIndex(path)
+        properties = [
+            Property.objects.create(name=f'Property {i}', description='Listing', city='Kacyiru', type='Rent', capacity=i + 1)
+            for i in range(3)
+        ]
+        first.rebuild()
+        self.assertEqual(len(first.similar(properties[0], k=5)), 2)
+
+        second.rebuild()
+        newer = Property.objects.create(name='Newer', description='Listing', city='Kacyiru', type='Rent', capacity=1)
+        first.refresh(newer.pk)
+        self.assertIn(newer.pk, [pk for pk, score in second.similar(properties[0], k=5)])
+
+        # Growing the file past its capacity replaces it as well
+        distant = Property.objects.create(id=5000, name='Distant', description='Listing', city='Kacyiru', type='Rent')
+        second.refresh(distant.pk)
+        self.assertEqual(len(first.similar(properties[0], k=10)), 4)
+
+class GalleryIngestTests(TestCase):
+    """Processing uploads on threads leaves the process's stderr alone."""
+
+    @override_settings(IMAGE_PROCESSING_ASYNC=False)
+    def test_threads_keep_stderr(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        prop = Property.objects.create(name='Listing', description='Listing')
+        uploads = []
+        for color in ['red', 'green', 'blue', 'white']:
+            buffer = io.BytesIO()
+            Image.new('RGB', (1600, 1200), color).save(buffer, 'PNG')
+            uploads.append(ContentFile(buffer.getvalue(), name=f'{color}.png'))
+
+        before = os.fstat(2)
+        # Nor points it at /dev/null meanwhile, as pilkit's quiet() does
+        with override_settings(MEDIA_ROOT=directory.name), mock.patch('pilkit.utils.quiet', side_effect=AssertionError("stderr redirected")):
+            for attempt in range(3):
+                images, failures = ingest_gallery(prop, uploads, workers=4)
+                self.assertEqual((len(images), failures), (4, []))
+                for upload in uploads:
+                    upload.seek(0)
+        after = os.fstat(2)
+        self.assertEqual((after.st_dev, after.st_ino), (before.st_dev, before.st_ino))
+
+class ImageJobTests(TestCase):
+    """
+    Deferred uploads show a placeholder until the queue renders them,
+    failed jobs retry with a delay before giving up, and a job never
+    overwrites a newer upload.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(MEDIA_ROOT=directory.name, IMAGE_JOB_MAX_ATTEMPTS=2)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        cache.clear()
+
+    def create_property(self):
+        prop = Property(name='Listing', description='Listing')
+        prop.image.save('photo.png', png_upload(), save=False)
+        prop.save()
+        return prop
+
+    def test_placeholder_until_rendered(self):
+        prop = self.create_property()
+        upload = prop.image.name
+        self.assertEqual(prop.image_state, 'Pending')
+        self.assertEqual(prop.image.url, static('frontend/img/processing.svg'))
+        self.assertEqual(ImageJob.objects.get().source_name, upload)
+
+        self.assertEqual(run_workers(workers=0, once=True), (1, 0))
+        prop.refresh_from_db()
+        self.assertEqual(prop.image_state, 'Ready')
+        self.assertTrue(prop.image.name.endswith('.jpg'))
+        self.assertNotEqual(prop.image.url, static('frontend/img/processing.svg'))
+        self.assertFalse(default_storage.exists(upload))
+        self.assertEqual(ImageJob.objects.get().state, 'Done')
+
+    def test_claim_retry_and_failure(self):
+        prop = self.create_property()
+        job, = claim_jobs(5)
+        self.assertEqual((job.state, job.attempts), ('Processing', 1))
+        self.assertEqual(claim_jobs(5), [])
+
+        fail_job(job, 'boom')
+        job.refresh_from_db()
+        prop.refresh_from_db()
+        self.assertEqual((job.state, prop.image_state), ('Pending', 'Pending'))
+        self.assertGreater(job.run_after, timezone.now())
+        # Not due until the delay has passed
+        self.assertEqual(claim_jobs(5), [])
+
+        ImageJob.objects.update(run_after=timezone.now())
+        job, = claim_jobs(5)
+        fail_job(job, 'boom again')
+        job.refresh_from_db()
+        prop.refresh_from_db()
+        self.assertEqual((job.state, job.error, prop.image_state), ('Failed', 'boom again', 'Failed'))
+        # The unprocessed upload is served instead
+        self.assertEqual(prop.image.url, default_storage.url(prop.image.name))
+
+    def test_stale_job_keeps_newer_upload(self):
+        prop = self.create_property()
+        job, = claim_jobs(5)
+        rendered = render_job(*start_job(job))
+
+        prop.image.save('newer.png', png_upload(color='blue'), save=False)
+        prop.save()
+        newer = prop.image.name
+        finish_job(job, rendered)
+
+        prop.refresh_from_db()
+        self.assertEqual((prop.image.name, prop.image_state), (newer, 'Pending'))
+        self.assertFalse(default_storage.exists(rendered[0]))
+        self.assertTrue(default_storage.exists(newer))
+        self.assertEqual(ImageJob.objects.get(pk=job.pk).state, 'Done')
+
+    def test_workers_survive_a_crashed_process(self):
+        batches = [[os._exit], [abs]]
+
+        def process(jobs, pool):
+            # os._exit(1) kills the worker process running it
+            try:
+                pool.submit(jobs[0], 1).result()
+            except Exception:
+                return [(jobs[0], False)]
+            return [(jobs[0], True)]
+
+        claim = lambda limit: batches.pop(0) if batches else []
+        with self.assertLogs('backend.image_jobs', 'WARNING'):
+            self.assertEqual(run_workers(workers=1, once=True, claim=claim, process=process), (1, 1))
+
+class RenditionTests(TestCase):
+    """
+    Processed images get WebP and JPEG renditions at each configured width,
+    offered through `srcset`/`sizes` and the API, and backfilled for
+    images that have none.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(MEDIA_ROOT=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        cache.clear()
+        self.prop = Property(name='Listing', description='Listing')
+        self.prop.image.save('photo.png', png_upload(size=(1600, 1200)), save=False)
+        self.prop.save()
+
+    def render(self, image):
+        template = Template('{% load responsive_images %}{% responsive_image image "Listing" sizes="50vw" class="cover" %}')
+        return template.render(Context({'image': image}))
+
+    def test_job_renders_renditions(self):
+        run_workers(workers=0, once=True)
+        self.prop.refresh_from_db()
+        renditions = self.prop.image_renditions
+        self.assertEqual((renditions['source'], renditions['width']), (self.prop.image.name, 1340))
+        self.assertEqual(sorted(renditions['files'], key=int), ['360', '720', '1340'])
+        for formats in renditions['files'].values():
+            self.assertEqual(set(formats), {'webp', 'jpeg'})
+            for name in formats.values():
+                self.assertTrue(default_storage.exists(name))
+        self.assertTrue(renditions['placeholder'].startswith('data:image/jpeg;base64,'))
+
+    def test_picture_markup(self):
+        # Still queued: a plain <img> of the processing placeholder
+        self.assertEqual(
+            self.render(self.prop.image),
+            f'<img src="{static("frontend/img/processing.svg")}" alt="Listing" class="cover" loading="lazy">',
+        )
+
+        run_workers(workers=0, once=True)
+        self.prop.refresh_from_db()
+        files = self.prop.image_renditions['files']
+        srcset = lambda key: ', '.join(f"{default_storage.url(files[width][key])} {width}w" for width in ['360', '720', '1340'])
+        html = self.render(self.prop.image)
+        self.assertTrue(html.startswith(f'<picture><source type="image/webp" srcset="{srcset("webp")}" sizes="50vw">'))
+        self.assertIn(f'<img src="{default_storage.url(files["720"]["jpeg"])}" srcset="{srcset("jpeg")}" sizes="50vw" alt="Listing"', html)
+        self.assertIn('background: url(data:image/jpeg;base64,', html)
+
+    def test_serializer_renditions(self):
+        image = PropertyImage(property=self.prop)
+        image.image.save('gallery.png', png_upload(size=(500, 400)), save=False)
+        image.save()
+        self.assertIsNone(PropertyImageSerializer(image).data['renditions'])
+
+        run_workers(workers=0, once=True)
+        image.refresh_from_db()
+        renditions = PropertyImageSerializer(image).data['renditions']
+        self.assertEqual(list(renditions), ['360w', '720w', '1340w'])
+        self.assertEqual(renditions['360w']['webp'], default_storage.url(image.image_renditions['files']['360']['webp']))
+
+    def test_backfill(self):
+        run_workers(workers=0, once=True)
+        Property.objects.update(image_renditions={})
+        out = io.StringIO()
+        call_command('backfill_renditions', workers=0, stdout=out)
+        self.assertIn('Rendered 1 images; 0 already up to date, 0 failed.', out.getvalue())
+        self.prop.refresh_from_db()
+        self.assertEqual(self.prop.image_renditions['source'], self.prop.image.name)
+
+        out = io.StringIO()
+        call_command('backfill_renditions', workers=0, stdout=out)
+        self.assertIn('Rendered 0 images; 1 already up to date, 0 failed.', out.getvalue())
+
+    def test_category_images_are_queued(self):
+        category = Category(name='Apartment')
+        category.image.save('category.png', png_upload(), save=False)
+        category.save()
+        category.refresh_from_db()
+        self.assertEqual((category.image_state, category.image_renditions), ('Pending', {}))
+
+        run_workers(workers=0, once=True)
+        category.refresh_from_db()
+        self.assertEqual(category.image_state, 'Ready')
+        self.assertEqual(category.image_renditions['source'], category.image.name)
+
+class PlaceholderTests(TestCase):
+    """
+    Each image carries a tiny blurred JPEG as a data: URI, served by the
+    API and backfilled for renditions rendered without one.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(MEDIA_ROOT=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        cache.clear()
+        self.prop = Property(name='Listing', description='Listing')
+        self.prop.image.save('photo.png', png_upload(size=(1600, 1200)), save=False)
+        self.prop.save()
+        self.image = PropertyImage(property=self.prop)
+        self.image.image.save('gallery.png', png_upload(color='blue'), save=False)
+        self.image.save()
+
+    def test_placeholder_is_a_tiny_jpeg(self):
+        uri = render_placeholder(Image.new('RGB', (1600, 1200), 'red'))
+        self.assertTrue(uri.startswith('data:image/jpeg;base64,'))
+        self.assertLess(len(uri), 1000)
+        with Image.open(io.BytesIO(base64.b64decode(uri.split(',', 1)[1]))) as thumbnail:
+            self.assertEqual((thumbnail.format, thumbnail.size), ('JPEG', (16, 12)))
+
+    def test_serializer_fields(self):
+        self.assertIsNone(PropertySerializer(self.prop).data['image_placeholder'])
+        self.assertIsNone(PropertyImageSerializer(self.image).data['placeholder'])
+
+        run_workers(workers=0, once=True)
+        self.prop.refresh_from_db()
+        self.image.refresh_from_db()
+        self.assertEqual(PropertySerializer(self.prop).data['image_placeholder'], self.prop.image_renditions['placeholder'])
+        self.assertEqual(PropertyImageSerializer(self.image).data['placeholder'], self.image.image_renditions['placeholder'])
+
+    def test_backfill(self):
+        run_workers(workers=0, once=True)
+        self.prop.refresh_from_db()
+        renditions = self.prop.image_renditions
+        Property.objects.update(image_renditions={key: value for key, value in renditions.items() if key != 'placeholder'})
+
+        out = io.StringIO()
+        call_command('backfill_placeholders', workers=0, stdout=out)
+        self.assertIn('Added 1 placeholders; 1 already present, 0 failed.', out.getvalue())
+        self.prop.refresh_from_db()
+        self.assertTrue(self.prop.image_renditions['placeholder'].startswith('data:image/jpeg;base64,'))
+        self.assertEqual(self.prop.image_renditions['files'], renditions['files'])
+
+        out = io.StringIO()
+        call_command('backfill_placeholders', workers=1, force=True, stdout=out)
+        self.assertIn('Added 2 placeholders; 0 already present, 0 failed.', out.getvalue())
+
+class ContentAddressedStorageTests(TestCase):
+    """
+    Identical bytes are shared within a field's namespace only, and
+    deleting a row, by cascade too, gives back its references.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(MEDIA_ROOT=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_fields_keep_separate_namespaces(self):
+        storage = ContentAddressedStorage()
+        photo = storage.save('properties/add_on/photo.jpg', ContentFile(b'same bytes'))
+        copy = storage.save('properties/add_on/copy.jpg', ContentFile(b'same bytes'))
+        id_image = storage.save('id_numbers/id.jpg', ContentFile(b'same bytes'))
+        self.assertEqual(photo, copy)
+        self.assertTrue(photo.startswith('cas/properties/'))
+        self.assertTrue(id_image.startswith('cas/id_numbers/'))
+        self.assertEqual((storage.references(photo), storage.references(id_image)), (2, 1))
+
+    def test_cascade_delete_releases_references(self):
+        name = default_storage.save('id_numbers/id.jpg', ContentFile(b'id card'))
+        default_storage.save('id_numbers/id.jpg', ContentFile(b'id card'))
+        tenant = User.objects.create_user(email='tenant@example.com', name='Tenant', phone_number='0780000003', password='secret')
+        prop = Property.objects.create(name='Listing', description='Listing')
+        RentApplication.objects.create(user=tenant, property=prop, id_number_image=name)
+        RentApplication.objects.create(user=tenant, property=prop, id_number_image=name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            prop.delete()
+        self.assertFalse(default_storage.exists(name))
+
+class MediaGarbageCollectionTests(TestCase):
+    """
+    gc_media removes what no row refers to, and keeps a blob that a save
+    or a row took up after its reference snapshot.
+    """
+
+    def setUp(self):
+        directory, quarantine = tempfile.TemporaryDirectory(), tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(quarantine.cleanup)
+        settings = override_settings(MEDIA_ROOT=directory.name, MEDIA_QUARANTINE_ROOT=quarantine.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.root, self.quarantine = directory.name, quarantine.name
+        self.used = default_storage.save('id_numbers/used.jpg', ContentFile(b'used'))
+        self.orphan = default_storage.save('id_numbers/orphan.jpg', ContentFile(b'orphan'))
+        self.legacy = os.path.join(self.root, 'properties', 'old.jpg')
+        os.makedirs(os.path.dirname(self.legacy))
+        with open(self.legacy, 'wb') as legacy:
+            legacy.write(b'legacy')
+        self.tenant = User.objects.create_user(email='tenant@example.com', name='Tenant', phone_number='0780000003', password='secret')
+        self.prop = Property.objects.create(name='Listing', description='Listing')
+        RentApplication.objects.create(user=self.tenant, property=self.prop, id_number_image=self.used)
+        self.age_files()
+
+    def age_files(self):
+        old = timezone.now().timestamp() - 3 * 24 * 60 * 60
+        for directory, subdirectories, files in os.walk(self.root):
+            for name in files:
+                os.utime(os.path.join(directory, name), (old, old))
+
+    def exists(self, name):
+        return os.path.exists(os.path.join(self.root, name))
+
+    def test_dry_run_only_lists(self):
+        out = io.StringIO()
+        call_command('gc_media', dry_run=True, stdout=out)
+        self.assertIn(self.orphan, out.getvalue())
+        self.assertIn('properties/old.jpg', out.getvalue())
+        self.assertNotIn(self.used, out.getvalue())
+        self.assertTrue(self.exists(self.orphan) and os.path.exists(self.legacy))
+
+    def test_quarantine_moves_unreferenced_files(self):
+        call_command('gc_media', quarantine=True, stdout=io.StringIO())
+        for name in [self.orphan, f'{self.orphan}.refs', 'properties/old.jpg']:
+            self.assertFalse(self.exists(name))
+            self.assertTrue(os.path.exists(os.path.join(self.quarantine, name)))
+        self.assertTrue(self.exists(self.used) and self.exists(f'{self.used}.refs'))
+
+    def test_delete_removes_blob_and_count(self):
+        call_command('gc_media', stdout=io.StringIO())
+        self.assertFalse(self.exists(self.orphan) or self.exists(f'{self.orphan}.refs'))
+        self.assertFalse(os.path.exists(self.legacy))
+        self.assertTrue(self.exists(self.used))
+
+    def test_upload_deduplicated_during_collection_is_kept(self):
+        def snapshot_then_upload():
+            keys = referenced_keys()
+            # The same bytes arrive again; the row is not committed yet
+            default_storage.save('id_numbers/again.jpg', ContentFile(b'orphan'))
+            return keys
+
+        with mock.patch('backend.management.commands.gc_media.referenced_keys', snapshot_then_upload):
+            call_command('gc_media', stdout=io.StringIO())
+        self.assertTrue(self.exists(self.orphan))
+        self.assertEqual(default_storage.references(self.orphan), 2)
+
+    def test_row_saved_during_collection_keeps_its_file(self):
+        def snapshot_then_save():
+            keys = referenced_keys()
+            RentApplication.objects.create(user=self.tenant, property=self.prop, id_number_image=self.orphan)
+            return keys
+
+        with mock.patch('backend.management.commands.gc_media.referenced_keys', snapshot_then_save):
+            call_command('gc_media', stdout=io.StringIO())
+        self.assertTrue(self.exists(self.orphan))
+        self.assertFalse(os.path.exists(self.legacy))
+
+class MediaResponseTests(TestCase):
+    """Byte ranges, If-Range and the access gate of the media view."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(MEDIA_ROOT=directory.name, MEDIA_OFFLOAD=None)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        cache.clear()
+        self.name = default_storage.save('properties/add_on/photo.jpg', ContentFile(b'0123456789'))
+        self.url = f'/media/{self.name}'
+
+    def test_suffix_range(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-4')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 6-9/10')
+        self.assertEqual(b''.join(response.streaming_content), b'6789')
+
+    def test_unsatisfiable_range(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=20-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */10')
+
+    def test_stale_if_range_sends_whole_file(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), b'0123456789')
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-3', HTTP_IF_RANGE=response['ETag'])
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), b'0123')
+
+    def test_rent_application_images_need_a_viewer(self):
+        tenant = User.objects.create_user(email='tenant@example.com', name='Tenant', phone_number='0780000003', password='secret')
+        other = User.objects.create_user(email='other@example.com', name='Other', phone_number='0780000004', password='secret')
+        name = default_storage.save('id_numbers/id.jpg', ContentFile(b'0123456789'))
+        RentApplication.objects.create(user=tenant, property=Property.objects.create(name='Listing', description='Listing'), id_number_image=name)
+
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(f'/media/{name}').status_code, 403)
+        # The listing photo with the same bytes stays public
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.client.force_login(tenant)
+        self.assertEqual(self.client.get(f'/media/{name}').status_code, 200)
+
+class ReportDownloadTests(TestCase):
+    """Cached report PDFs outlive their eviction once opened, and can be handed to the front proxy."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(REPORT_CACHE_ROOT=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.admin = User.objects.create_user(email='admin@example.com', name='Admin', phone_number='0780000001', password='secret', role='Admin')
+        prop = Property.objects.create(name='Listing', description='Listing', created_by=self.admin)
+        self.application = RentApplication.objects.create(user=self.admin, property=prop)
+
+    def test_open_report_survives_eviction(self):
+        report, version = cached_report('Application', self.application)
+        with report:
+            self.assertEqual(evict_reports(max_bytes=0)[0], 1)
+            self.assertTrue(report.read().startswith(b'%PDF'))
+        # Evicted: rendered again
+        report, again = cached_report('Application', self.application)
+        report.close()
+        self.assertEqual(again, version)
+
+    @override_settings(MEDIA_OFFLOAD='x-accel-redirect', REPORT_ACCEL_REDIRECT_PREFIX='/_reports/')
+    def test_offloaded_download(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('backend:download_application_report', kwargs={'id': self.application.id}))
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response['X-Accel-Redirect'], rf'^/_reports/application/{self.application.id}-[0-9a-f]+\.pdf$')
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response.content, b'')
+
+class ReportExportTests(TestCase):
+    """
+    The bulk export streams a ZIP of every report, reusing cached PDFs and
+    listing the ones that failed to render, to admins and superusers only.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(REPORT_CACHE_ROOT=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.superuser = User.objects.create_user(
+            email='root@example.com', name='Root', phone_number='0780000001', password='secret', role='User', is_superuser=True,
+        )
+        self.tenant = User.objects.create_user(email='tenant@example.com', name='Tenant', phone_number='0780000003', password='secret')
+        prop = Property.objects.create(name='Listing', description='Listing')
+        self.applications = [RentApplication.objects.create(user=self.tenant, property=prop) for i in range(3)]
+        self.client.force_login(self.superuser)
+
+    def export(self):
+        response = self.client.get(reverse('backend:exportReports'))
+        self.assertEqual(response.status_code, 200)
+        return zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+    def test_archive_holds_every_report(self):
+        with self.export() as archive:
+            self.assertEqual(archive.namelist(), [report_filename('Application', application) for application in self.applications])
+            for name in archive.namelist():
+                self.assertTrue(archive.read(name).startswith(b'%PDF'))
+
+    def test_cached_reports_are_reused(self):
+        cached_report('Application', self.applications[0])[0].close()
+        with mock.patch('backend.reports.write_report', side_effect=write_report) as render:
+            with self.export() as archive:
+                self.assertEqual(len(archive.namelist()), 3)
+        self.assertEqual([call.args[1] for call in render.call_args_list], [application.pk for application in self.applications[1:]])
+
+    def test_failures_are_listed(self):
+        failing = self.applications[1]
+
+        def render(kind, pk, version, lines):
+            if pk == failing.pk:
+                raise OSError("disk full")
+            return write_report(kind, pk, version, lines)
+
+        with mock.patch('backend.reports.write_report', side_effect=render), self.assertLogs('backend.reports', 'ERROR'):
+            with self.export() as archive:
+                self.assertEqual(len(archive.namelist()), 3)
+                self.assertEqual(archive.read('FAILED.txt').decode(), f"{report_filename('Application', failing)}\n")
+
+    def test_admins_only(self):
+        self.client.force_login(self.tenant)
+        self.assertEqual(self.client.get(reverse('backend:exportReports')).status_code, 403)
+
+class ReportLayoutTests(TestCase):
+    """Wrapped report rows stay inside the frame, however long a word is."""
+
+    def test_long_words_are_broken(self):
+        rows = wrap_text('  Email: ' + 'x' * 300 + ' end', 'Helvetica', 12, 200)
+        self.assertGreater(len(rows), 3)
+        self.assertTrue(all(word_width(row, 'Helvetica') * 12 <= 200 for row in rows))
+        self.assertTrue(all(row.startswith('  ') for row in rows))
+        self.assertEqual(''.join(row.replace(' ', '') for row in rows), 'Email:' + 'x' * 300 + 'end')
+
+class RatingSummaryTests(TestCase):
+    """The rating summary follows reviews whatever integer they hold, negative ones included."""
+
+    def test_negative_and_corrected_ratings(self):
+        prop = Property.objects.create(name='Listing', description='Listing')
+        review = PropertyReview.objects.create(property=prop, name='A', location=-2)
+        PropertyReview.objects.create(property=prop, name='B', location=1)
+        self.assertEqual(PropertyRatingSummary.objects.get(property=prop).location_sum, -1)
+
+        review.location = 4
+        review.save()
+        review.delete()
+        summary = PropertyRatingSummary.objects.get(property=prop)
+        self.assertEqual((summary.review_count, summary.location_sum, summary.location_count), (1, 1, 1))
+
+class FacetTests(TestCase):
+    """Each facet is counted with every filter but its own."""
+
+    def test_facets_are_disjunctive(self):
+        pool = Amenity.objects.create(name='Pool')
+        wifi = Amenity.objects.create(name='Wifi')
+        for city, type, price, amenities in (
+            ('Kacyiru', 'Rent', 300, [pool]),
+            ('Kacyiru', 'Sale', 800, [pool, wifi]),
+            ('Rebero', 'Rent', 300, [wifi]),
+            ('Rebero', 'Rent', 1500, []),
+        ):
+            prop = Property.objects.create(name=city, description='Listing', city=city, type=type, price_usd=price)
+            prop.amenities.set(amenities)
+
+        def counts(query, facet):
+            return {row['value']: row['count'] for row in compute_facets(QueryDict(query))[facet] if row['count']}
+
+        self.assertEqual(compute_facets(QueryDict('city=Kacyiru&type=Rent'))['total'], 1)
+        self.assertEqual(counts('city=Kacyiru&type=Rent', 'city'), {'Kacyiru': 1, 'Rebero': 2})
+        self.assertEqual(counts('city=Kacyiru&type=Rent', 'type'), {'Rent': 1, 'Sale': 1})
+        self.assertEqual(counts('city=Rebero&price_min=1000', 'price'), {'0-499': 1, '1000-1999': 1})
+        self.assertEqual(counts(f'amenities={pool.id}', 'amenity'), {pool.id: 2, wifi.id: 1})
+        self.assertEqual(counts(f'amenities={pool.id}&amenity_match=any', 'amenity'), {pool.id: 2, wifi.id: 2})
+
+class GeoSearchTests(TestCase):
+    """Viewport and radius search over the geohash prefix ranges."""
+
+    @classmethod
+    def setUpTestData(cls):
+        def located(name, lat, lng):
+            return Property.objects.create(name=name, description='Listing', latitude=lat, longitude=lng)
+        cls.inside = located('Kacyiru', -1.9441, 30.0619)
+        cls.edge = located('Just north of the box', -1.9390, 30.0619)
+        cls.far = located('Nairobi', -1.2864, 36.8172)
+        Property.objects.create(name='Unlocated', description='Listing')
+
+    def test_geohash_successor(self):
+        self.assertEqual(geohash_successor('u4pr'), 'u4ps')
+        self.assertEqual(geohash_successor('kz9z'), 'kzb')
+        self.assertIsNone(geohash_successor('zz'))
+        cell = geohash_encode(-1.9441, 30.0619, 5)
+        self.assertTrue(cell < geohash_encode(-1.9441, 30.0619) < geohash_successor(cell))
+
+    def test_bbox_bounds(self):
+        found = filter_by_location(Property.objects.all(), {'bbox': (-1.95, 30.05, -1.94, 30.07)})
+        self.assertEqual([prop.pk for prop in found], [self.inside.pk])
+        self.assertNotIn('~', str(found.query))
+
+        found = filter_by_location(Property.objects.all(), {'bbox': (-2.0, 29.9, -1.0, 37.0)})
+        self.assertEqual({prop.pk for prop in found}, {self.inside.pk, self.edge.pk, self.far.pk})
+
+    def test_radius(self):
+        found = filter_by_location(Property.objects.all(), {'point': (-1.9441, 30.0619), 'radius': 1.0}).order_by('distance_km')
+        self.assertEqual([prop.pk for prop in found], [self.inside.pk, self.edge.pk])
+        self.assertAlmostEqual(found[1].distance_km, 0.567, places=2)
+        self.assertEqual(found.count(), 2)
+
+    def test_clusters_aggregate_every_level(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Property.objects.create(name='Nearby', description='Listing', latitude=-1.9442, longitude=30.0620, price_rwf=500)
+        clusters = PropertyCluster.objects.filter(geohash=self.inside.geohash[:6])
+        self.assertEqual(clusters.get().count, 2)
+        self.assertEqual(
+            list(PropertyCluster.objects.filter(geohash__in=[self.inside.geohash[:p] for p in range(1, 9)]).values_list('precision', flat=True).order_by('precision')),
+            list(range(1, 9)),
+        )
+
+    def test_a_point_needs_bounds(self):
+        self.assertIsNone(parse_geo_params(QueryDict('lat=-1.94&lng=30.06')))
+        response = self.client.get('/api/properties/?lat=-1.94&lng=30.06')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get('/api/properties/?lat=-1.9441&lng=30.0619&radius=1')
+        self.assertEqual([row['id'] for row in response.json()['results']], [self.inside.pk, self.edge.pk])
+
+    def test_invalid_bbox_is_rejected(self):
+        for bbox, message in [
+            ('-1.9,30.1,-2.0,30.0', 'south must not be above north'),
+            ('-1.9,179.0,-1.8,-179.0', 'antimeridian'),
+            ('-1.9,30.0,-1.8', 'four numbers'),
+            ('-95,30.0,-1.8,30.1', 'within -90..90'),
+        ]:
+            response = self.client.get('/api/properties/', {'bbox': bbox})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn(message, response.json()['detail'])
+
+class PropertySearchTests(TestCase):
+    """
+    The FTS5 index follows saves and deletes, ranks name matches above
+    description matches, and drives `q=` on the API (the HTML list is
+    covered in frontend/tests.py).
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.named = Property.objects.create(name='Sunny Villa', description='Quiet street', city='Kacyiru', type='Rent')
+        self.described = Property.objects.create(name='Garden House', description='Next to a villa', city='Kacyiru', type='Rent')
+        self.other = Property.objects.create(name='City Flat', description='Downtown', city='Kacyiru', type='Rent')
+
+    def search(self, query):
+        return list(search_properties(Property.objects.all(), query).order_by('-search_rank', '-id'))
+
+    def test_match_and_rank(self):
+        self.assertEqual(self.search('villa'), [self.named, self.described])
+        # Every term must match, each as a prefix
+        self.assertEqual(self.search('sun vil'), [self.named])
+        self.assertEqual(self.search('castle'), [])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.other.name = 'Villa Flat'
+        self.other.save()
+        self.assertIn(self.other, self.search('villa'))
+        self.assertEqual(self.search('city'), [])
+
+        self.named.delete()
+        self.assertEqual(self.search('sunny'), [])
+        self.assertNotIn(self.named.name, [prop.name for prop in self.search('villa')])
+
+    def test_api_orders_by_rank(self):
+        response = self.client.get('/api/properties/', {'q': 'villa'})
+        self.assertEqual([row['name'] for row in response.data['results']], ['Sunny Villa', 'Garden House'])
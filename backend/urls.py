@@ -45,6 +45,8 @@ urlpatterns = [
     path('contract/send/<int:application_id>/', createContract, name="createContract"),
     path('contract/<int:id>/', showContract, name='showContract'),
     path('contract/<int:id>/download-report/', download_contract_report, name='download_contract_report'),
+    path('report-job/<int:id>/', reportJobStatus, name='reportJobStatus'),
+    path('reports/export/', exportReports, name='exportReports'),
 
     path('notifications/', getNotifications, name="getNotifications"),
-]  + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)+ static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+]  + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
@@ -1,109 +1,74 @@
-from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+from backend.utils.report_layout import build_report
 
-def generate_application_pdf(application):
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
-
-    margin = 50
-    y = height - margin
+def line(text, font_size=12, offset=15, bold=False):
+    """One report line: (text, font size, space below it, bold)."""
+    return (str(text), font_size, offset, bold)
 
-    def draw_text(text, font_size=12, offset=15, bold=False):
-        nonlocal y
-        if bold:
-            c.setFont("Helvetica-Bold", font_size)
-        else:
-            c.setFont("Helvetica", font_size)
-        c.drawString(margin, y, text)
-        y -= offset
-
-    # Title
-    draw_text(f"Application Report - {application.property.name}", font_size=16, offset=30, bold=True)
+def application_report_lines(application):
+    lines = [line(f"Application Report - {application.property.name}", font_size=16, offset=30, bold=True)]
 
     # Applicant Info
-    draw_text("Applicant Information:", font_size=14, offset=20, bold=True)
-    draw_text(f"Name: {application.user.name}")
-    draw_text(f"Email: {application.user.email}")
-    draw_text(f"Phone: {application.user.phone_number}")
-    draw_text(f"Marital Status: {application.marital_status}")
-    draw_text(f"Employment Status: {application.employment_status}")
+    lines.append(line("Applicant Information:", font_size=14, offset=20, bold=True))
+    lines.append(line(f"Name: {application.user.name}"))
+    lines.append(line(f"Email: {application.user.email}"))
+    lines.append(line(f"Phone: {application.user.phone_number}"))
+    lines.append(line(f"Marital Status: {application.marital_status}"))
+    lines.append(line(f"Employment Status: {application.employment_status}"))
     if application.monthly_income:
-        draw_text(f"Monthly Income: ${application.monthly_income}")
-    draw_text(f"Has Children?: {'Yes' if application.has_children else 'No'}")
+        lines.append(line(f"Monthly Income: ${application.monthly_income}"))
+    lines.append(line(f"Has Children?: {'Yes' if application.has_children else 'No'}"))
     if application.has_children:
-        draw_text(f"Number of Children: {application.number_of_children}")
-    draw_text(f"Has Pet?: {'Yes' if application.has_pet else 'No'}")
+        lines.append(line(f"Number of Children: {application.number_of_children}"))
+    lines.append(line(f"Has Pet?: {'Yes' if application.has_pet else 'No'}"))
     if application.has_pet:
-        draw_text(f"Pet Details: {application.pet_details}")
-    draw_text(f"Has Disability?: {'Yes' if application.has_disability else 'No'}")
+        lines.append(line(f"Pet Details: {application.pet_details}"))
+    lines.append(line(f"Has Disability?: {'Yes' if application.has_disability else 'No'}"))
     if application.has_disability:
-        draw_text(f"Disability Details: {application.disability_details}")
+        lines.append(line(f"Disability Details: {application.disability_details}"))
     if application.references:
-        draw_text("References:", offset=10, bold=True)
-        for line in application.references.splitlines():
-            draw_text(f"  {line}", offset=12)
+        lines.append(line("References:", offset=10, bold=True))
+        lines.extend(line(f"  {text}", offset=12) for text in application.references.splitlines())
     if application.message:
-        draw_text("Additional Message:", offset=10, bold=True)
-        for line in application.message.splitlines():
-            draw_text(f"  {line}", offset=12)
-
-    y -= 10
-    draw_text("Property Details:", font_size=14, offset=20, bold=True)
-    draw_text(f"Property Name: {application.property.name}")
-    draw_text(f"Address: {application.property.address}")
-    draw_text(f"Status: {application.status}")
-    draw_text(f"Preferred Move-In Date: {application.preferred_move_in_date}")
-    draw_text(f"Rental Period: {application.rental_period_months} month(s)")
-
-    c.showPage()
-    c.save()
-    buffer.seek(0)
-    return buffer
-
-def generate_contract_pdf(contract):
-    from reportlab.lib.pagesizes import letter
-    from io import BytesIO
-    from reportlab.pdfgen import canvas
+        lines.append(line("Additional Message:", offset=10, bold=True))
+        lines.extend(line(f"  {text}", offset=12) for text in application.message.splitlines())
 
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
+    lines.append(line("", offset=10))
+    lines.append(line("Property Details:", font_size=14, offset=20, bold=True))
+    lines.append(line(f"Property Name: {application.property.name}"))
+    lines.append(line(f"Address: {application.property.address}"))
+    lines.append(line(f"Status: {application.status}"))
+    lines.append(line(f"Preferred Move-In Date: {application.preferred_move_in_date}"))
+    lines.append(line(f"Rental Period: {application.rental_period_months} month(s)"))
+    return lines
 
-    margin = 50
-    y = height - margin
-
-    def draw_text(text, font_size=12, offset=15, bold=False):
-        nonlocal y
-        if bold:
-            c.setFont("Helvetica-Bold", font_size)
-        else:
-            c.setFont("Helvetica", font_size)
-        c.drawString(margin, y, text)
-        y -= offset
-
-    # Title
-    draw_text(f"Contract Report - #{contract.contract_number}", font_size=16, offset=30, bold=True)
+def contract_report_lines(contract):
+    lines = [line(f"Contract Report - #{contract.contract_number}", font_size=16, offset=30, bold=True)]
 
     # Contract Details
-    draw_text("Contract Details:", font_size=14, offset=20, bold=True)
-    draw_text(f"Tenant: {contract.tenant.name}")
-    draw_text(f"Agent: {contract.agent.name}")
-    draw_text(f"Property: {contract.property.name}")
-    draw_text(f"Start Date: {contract.start_date}")
-    draw_text(f"End Date: {contract.end_date}")
-    draw_text(f"Rent Amount: ${contract.rent_amount}")
-    draw_text(f"Status: {contract.status}")
+    lines.append(line("Contract Details:", font_size=14, offset=20, bold=True))
+    lines.append(line(f"Tenant: {contract.tenant.name}"))
+    lines.append(line(f"Agent: {contract.agent.name}"))
+    lines.append(line(f"Property: {contract.property.name}"))
+    lines.append(line(f"Start Date: {contract.start_date}"))
+    lines.append(line(f"End Date: {contract.end_date}"))
+    lines.append(line(f"Rent Amount: ${contract.rent_amount}"))
+    lines.append(line(f"Status: {contract.status}"))
 
     if contract.additional_terms:
-        draw_text("Additional Terms:", offset=20, bold=True)
-        for line in contract.additional_terms.splitlines():
-            draw_text(f"  {line}", offset=12)
+        lines.append(line("Additional Terms:", offset=20, bold=True))
+        lines.extend(line(f"  {text}", offset=12) for text in contract.additional_terms.splitlines())
+    return lines
+
+def render_report(lines, buffer=None):
+    """
+    Lay report `lines` out over as many letter pages as they need and
+    return the buffer holding the PDF, rewound. Needs no database access,
+    so it can run in a worker process.
+    """
+    return build_report(lines, buffer)
 
-    c.showPage()
-    c.save()
-    buffer.seek(0)
-    return buffer
+def generate_application_pdf(application):
+    return render_report(application_report_lines(application))
+
+def generate_contract_pdf(contract):
+    return render_report(contract_report_lines(contract))
@@ -0,0 +1,190 @@
+from io import BytesIO
+from functools import lru_cache
+from itertools import groupby
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import BaseDocTemplate, Flowable, Frame, PageTemplate
+
+PAGE_SIZE = letter
+MARGIN = 50
+# Height of the running header on the second and later pages, and of the footer
+HEADER_HEIGHT = 30
+FOOTER_HEIGHT = 24
+# Line spacing of a wrapped line's continuation rows, in font sizes; never
+# more than the line's own offset, so a paragraph does not look looser
+# inside than between its lines
+CONTINUATION_LEADING = 1.25
+# Baseline of a row below its top, in font sizes (about Helvetica's ascent)
+BASELINE_DROP = 0.8
+
+def font_name(bold):
+    return "Helvetica-Bold" if bold else "Helvetica"
+
+@lru_cache(maxsize=8192)
+def word_width(word, font):
+    """Width of `word` at font size 1. Report text repeats its words, so they are measured once."""
+    return stringWidth(word, font, 1)
+
+def break_word(word, font, font_size, width):
+    """Cut a word wider than `width` into pieces that fit, by character width; at least one character each."""
+    pieces, start, used = [], 0, 0
+    for index, char in enumerate(word):
+        size = word_width(char, font) * font_size
+        if index > start and used + size > width:
+            pieces.append(word[start:index])
+            start, used = index, 0
+        used += size
+    pieces.append(word[start:])
+    return pieces
+
+def wrap_text(text, font, font_size, width):
+    """
+    Break `text` into rows no wider than `width`, at spaces, keeping its
+    leading indentation. Linear in the length of the text, unlike
+    reportlab's simpleSplit() which re-measures the growing row per word.
+    A word wider than a row is broken between characters.
+    """
+    stripped = text.lstrip(' ')
+    indent = text[:len(text) - len(stripped)]
+    indent_width = word_width(indent, font) * font_size if indent else 0
+    space = word_width(' ', font) * font_size
+    rows, row, used = [], [], indent_width
+    for word in stripped.split(' '):
+        if not word:
+            continue
+        size = word_width(word, font) * font_size
+        if row and used + space + size > width:
+            rows.append(indent + ' '.join(row))
+            row, used = [], indent_width
+        if not row and indent_width + size > width:
+            *full, word = break_word(word, font, font_size, width - indent_width)
+            rows.extend(indent + piece for piece in full)
+            size = word_width(word, font) * font_size
+        used += (space if row else 0) + size
+        row.append(word)
+    rows.append(indent + ' '.join(row))
+    return rows
+
+class TextBlock(Flowable):
+    """
+    Consecutive report lines in one font. Each line is wrapped to the frame
+    width; its continuation rows are at most CONTINUATION_LEADING apart and the
+    line's own `offset` separates its last row from the next line, which
+    keeps the spacing of the original one-page reports. Drawn as a single
+    text object with one font change, and split between pages at a row
+    boundary.
+    """
+
+    def __init__(self, texts, font_size=12, offset=15, bold=False, rows=None, width=None):
+        super().__init__()
+        self.texts = texts
+        self.font_size = font_size
+        self.offset = offset
+        self.bold = bold
+        # (text, advance to the next row) for the width last wrapped to
+        self.rows = rows
+        self.rows_width = width
+
+    def rows_for(self, width):
+        if self.rows is None or self.rows_width != width:
+            font, leading = font_name(self.bold), min(self.font_size * CONTINUATION_LEADING, self.offset)
+            rows = []
+            for text in self.texts:
+                wrapped = wrap_text(text, font, self.font_size, width)
+                rows.extend((row, leading) for row in wrapped[:-1])
+                rows.append((wrapped[-1], self.offset))
+            self.rows, self.rows_width = rows, width
+        return self.rows
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = sum(advance for row, advance in self.rows_for(availWidth))
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        rows = self.rows_for(availWidth)
+        used = fits = 0
+        for row, advance in rows:
+            if used + advance > availHeight:
+                break
+            used += advance
+            fits += 1
+        if not fits or fits == len(rows):
+            return []
+        return [
+            TextBlock(self.texts, self.font_size, self.offset, self.bold, rows[:fits], availWidth),
+            TextBlock(self.texts, self.font_size, self.offset, self.bold, rows[fits:], availWidth),
+        ]
+
+    def draw(self):
+        text = self.canv.beginText(0, self.height - self.font_size * BASELINE_DROP)
+        text.setFont(font_name(self.bold), self.font_size)
+        for row, advance in self.rows:
+            text.setLeading(advance)
+            text.textLine(row)
+        self.canv.drawText(text)
+
+def text_blocks(lines):
+    """Group (text, font size, offset, bold) report lines into TextBlocks of one style."""
+    return [
+        TextBlock([text for text, *rest in group], *style)
+        for style, group in groupby(lines, key=lambda line: tuple(line[1:]))
+    ]
+
+
+class ReportDocTemplate(BaseDocTemplate):
+    """
+    Letter pages with two templates: the first page's frame starts at the
+    top margin, later pages carry a running header with the report title.
+    The header is drawn once per document into a form (PDF XObject) that
+    every later page reuses; only the page number is drawn per page.
+    """
+
+    def __init__(self, output, title='', **kwargs):
+        kwargs.setdefault('pagesize', PAGE_SIZE)
+        super().__init__(
+            output, title=title, leftMargin=MARGIN, rightMargin=MARGIN,
+            topMargin=MARGIN, bottomMargin=MARGIN, **kwargs
+        )
+        width, height = self.pagesize
+        body = dict(x1=MARGIN, width=width - 2 * MARGIN, leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0)
+        bottom = MARGIN + FOOTER_HEIGHT
+        self.addPageTemplates([
+            PageTemplate('first', [Frame(y1=bottom, height=height - MARGIN - bottom, id='first', **body)],
+                         onPage=self.draw_footer, autoNextPageTemplate='later'),
+            PageTemplate('later', [Frame(y1=bottom, height=height - MARGIN - HEADER_HEIGHT - bottom, id='later', **body)],
+                         onPage=self.draw_header),
+        ])
+        self.header_drawn = False
+
+    def draw_footer(self, canvas, doc):
+        width, height = self.pagesize
+        canvas.setFont("Helvetica", 9)
+        canvas.drawRightString(width - MARGIN, MARGIN, f"Page {canvas.getPageNumber()}")
+
+    def draw_header(self, canvas, doc):
+        if not self.header_drawn:
+            width, height = self.pagesize
+            canvas.beginForm('report-header')
+            canvas.setFont("Helvetica-Bold", 10)
+            canvas.drawString(MARGIN, height - MARGIN - 10, self.title)
+            canvas.setLineWidth(0.5)
+            canvas.line(MARGIN, height - MARGIN - 16, width - MARGIN, height - MARGIN - 16)
+            canvas.endForm()
+            self.header_drawn = True
+        canvas.doForm('report-header')
+        self.draw_footer(canvas, doc)
+
+def build_report(lines, output=None):
+    """
+    Lay out report `lines` ((text, font size, offset, bold) tuples, the
+    first being the title) over as many pages as they need and write the
+    PDF to `output` (a new BytesIO by default), which is returned rewound.
+    Needs no database access, so it can run in a worker process.
+    """
+    output = output if output is not None else BytesIO()
+    title = lines[0][0] if lines else ''
+    document = ReportDocTemplate(output, title=title)
+    document.build(text_blocks(lines))
+    output.seek(0)
+    return output
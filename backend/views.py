@@ -1,22 +1,42 @@
+import os
+import re
 import random
 from users.models import *
 from backend.forms import *
 from backend.models import *
 from django.urls import reverse
 from .utils.pdf_reports import *
-from django.db.models import Count
+from backend.similarity import similar_properties
+from backend.gallery import ingest_gallery
+from backend.metrics import overview_metrics
+from backend.analytics import activity_chart
+from dataclasses import asdict
+from django.conf import settings
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth.decorators import login_required
-from django.http import FileResponse, Http404, JsonResponse
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
+from django.core.files.base import ContentFile
+from backend.media import media_response, offload_response
+from backend.reports import cached_report, enqueue_report, report_filename, report_name, report_object, export_queryset, export_reports, zip_reports
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, quote_etag
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login as auth_login, logout, update_session_auth_hash
 
 def home(request):
     return render(request, 'backend/pages/index.html')
 
+def serveMedia(request, path):
+    """
+    Media files, through backend.media: access checks for rent application
+    images, conditional and Range requests, and X-Accel-Redirect /
+    X-Sendfile offload when MEDIA_OFFLOAD is set.
+    """
+    return media_response(request, path)
+
 def about(request):
     return render(request, 'backend/pages/about.html')
 
@@ -139,52 +159,10 @@ def dashboard(request):
     if request.user.role not in ['Admin', 'House Provider'] and not request.user.is_superuser:
         raise PermissionDenied(_("You are not authorized to view the dashboard."))
 
-    user = request.user
-    context = {}
-
-    if user.role == 'Admin' or user.is_superuser:
-        # Admin overview
-        context.update({
-            'dashboard_type': 'admin',
-            'total_users': User.objects.filter(role='User').count(),
-            'total_providers': User.objects.filter(role='House Provider').count(),
-            'total_properties': Property.objects.count(),
-            'total_applications': RentApplication.objects.count(),
-            'app_status_counts': list(
-                RentApplication.objects
-                    .values('status')
-                    .annotate(count=Count('id'))
-            ),
-            'total_contracts': Contract.objects.count(),
-            'contract_status_counts': list(
-                Contract.objects
-                    .values('status')
-                    .annotate(count=Count('id'))
-            ),
-        })
-    else:
-        # House Provider overview (only their properties)
-        provider_props = Property.objects.filter(created_by=user)
-        provider_apps  = RentApplication.objects.filter(property__created_by=user)
-        provider_contracts = Contract.objects.filter(property__created_by=user)
-
-        context.update({
-            'dashboard_type': 'provider',
-            'total_properties': provider_props.count(),
-            'total_applications': provider_apps.count(),
-            'app_status_counts': list(
-                provider_apps
-                    .values('status')
-                    .annotate(count=Count('id'))
-            ),
-            'total_contracts': provider_contracts.count(),
-            'contract_status_counts': list(
-                provider_contracts
-                    .values('status')
-                    .annotate(count=Count('id'))
-            ),
-        })
-
+    context = asdict(overview_metrics(request.user))
+    if context['dashboard_type'] == 'admin':
+        # Daily counts from the nightly rollups, for Chart.js
+        context['activity_chart'] = activity_chart()
     return render(request, 'backend/pages/dashboard.html', context)
 
 
@@ -441,6 +419,11 @@ def getProperties(request):
 
     return render(request, 'backend/pages/properties/index.html', context)
 
+def report_gallery_failures(request, ingested):
+    images, failures = ingested
+    for name, reason in failures:
+        messages.warning(request, _("The image '%(name)s' was not added: %(reason)s.") % {'name': name, 'reason': reason})
+
 @login_required
 def addProperty(request):
     if request.user.role != 'House Provider':
@@ -455,14 +438,17 @@ def addProperty(request):
             property_instance.save()
             form.save_m2m()
 
-            # Add the main property image to PropertyImage model (if provided)
+            # Add the main property image to PropertyImage model (if provided);
+            # saved again so the row holds its own reference to the shared file
             if property_instance.image:
-                PropertyImage.objects.create(property=property_instance, image=property_instance.image)
+                with property_instance.image.open('rb') as main_image:
+                    PropertyImage.objects.create(
+                        property=property_instance,
+                        image=ContentFile(main_image.read(), name=os.path.basename(property_instance.image.name)),
+                    )
 
             # Process additional images from the "Additional Images" input
-            additional_images = request.FILES.getlist('images')
-            for img in additional_images:
-                PropertyImage.objects.create(property=property_instance, image=img)
+            report_gallery_failures(request, ingest_gallery(property_instance, request.FILES.getlist('images')))
 
             messages.success(
                 request,
@@ -498,6 +484,7 @@ def showProperty(request, id):
     context = {
         'property': property_instance,
         'application_status': application_status,
+        'similar_properties': similar_properties(property_instance, 4, queryset=Property.objects.select_related('category')),
         'title': _('Property: %(property)s') % {'property': property_instance.name}
     }
 
@@ -516,9 +503,7 @@ def editProperty(request, id):
         if form.is_valid():
             property_instance = form.save()
             # Process additional new images (if any)
-            images = request.FILES.getlist('images')
-            for img in images:
-                PropertyImage.objects.create(property=property_instance, image=img)
+            report_gallery_failures(request, ingest_gallery(property_instance, request.FILES.getlist('images')))
             messages.success(request, _("The property '%(property)s' has been updated successfully.") % {'property': property_instance.name})
             return redirect(reverse('backend:getProperties'))
         else:
@@ -623,19 +608,53 @@ def showApplication(request, id):
 
     return render(request, 'backend/pages/applications/show.html', context)
 
+def can_download_report(user, kind, obj):
+    # Must be the same as in showApplication / showContract
+    if kind == 'Application':
+        return user.role == 'Admin' or obj.property.created_by == user or obj.user == user
+    return user.role == 'Admin' or obj.agent == user or obj.tenant == user
+
+def report_response(request, kind, obj):
+    """
+    The PDF report for `obj`, served from the report cache (backend/reports.py)
+    and only rendered when its content changed; handed to the front proxy
+    like media when MEDIA_OFFLOAD is set. With ?async=1 nothing is
+    rendered in the request: the JSON response names the job URL to poll,
+    or the download URL when the PDF is already cached.
+    """
+    if request.GET.get('async'):
+        job = enqueue_report(kind, obj)
+        if job is None:
+            return JsonResponse({'state': 'Done', 'download_url': request.path})
+        status_url = reverse('backend:reportJobStatus', kwargs={'id': job.id})
+        return JsonResponse({'state': job.state, 'status_url': status_url}, status=202)
+
+    report, version = cached_report(kind, obj)
+    etag = quote_etag(version)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = offload_response(report.name, report_name(report.name), prefix=getattr(settings, 'REPORT_ACCEL_REDIRECT_PREFIX', '/_reports/'))
+        if response is not None:
+            response['Content-Type'] = 'application/pdf'
+            response['Content-Disposition'] = content_disposition_header(True, report_filename(kind, obj))
+    if response is None:
+        response = FileResponse(report, as_attachment=True, filename=report_filename(kind, obj))
+    else:
+        report.close()
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
 @login_required
 def download_application_report(request, id):
-    application = get_object_or_404(RentApplication, id=id)
+    application = get_object_or_404(RentApplication.objects.select_related('user', 'property'), id=id)
 
-    # Permission check - must be same as in showApplication
-    if not (request.user.role == 'Admin' or application.property.created_by == request.user or application.user == request.user):
+    if not can_download_report(request.user, 'Application', application):
         raise PermissionDenied("You do not have permission to download this report.")
 
     try:
-        pdf_buffer = generate_application_pdf(application)
-        filename = f"application_report_{application.id}.pdf"
-        return FileResponse(pdf_buffer, as_attachment=True, filename=filename)
-    except Exception as e:
+        return report_response(request, 'Application', application)
+    except OSError as e:
         raise Http404(f"Error generating report: {str(e)}")
 
 @login_required
@@ -772,19 +791,59 @@ def showContract(request, id):
 
 @login_required
 def download_contract_report(request, id):
-    contract = get_object_or_404(Contract, id=id)
+    contract = get_object_or_404(Contract.objects.select_related('tenant', 'agent', 'property'), id=id)
 
-    # Basic permission check — adjust as needed for your logic
-    if not (request.user.role == 'Admin' or contract.agent == request.user or contract.tenant == request.user):
+    if not can_download_report(request.user, 'Contract', contract):
         raise PermissionDenied("You do not have permission to download this contract report.")
 
     try:
-        pdf_buffer = generate_contract_pdf(contract)
-        filename = f"contract_report_{contract.contract_number}.pdf"
-        return FileResponse(pdf_buffer, as_attachment=True, filename=filename)
-    except Exception as e:
+        return report_response(request, 'Contract', contract)
+    except OSError as e:
         raise Http404(f"Error generating contract report: {str(e)}")
 
+@login_required
+def exportReports(request):
+    """
+    Admins: a ZIP of every application (?kind=contract: contract) report,
+    optionally for one ?property=<id>, ?month=YYYY-MM and ?status=. Cached
+    PDFs are reused and the rest rendered one at a time as the response
+    streams, so no process is started in the web worker; the
+    export_reports command renders large exports on a process pool.
+    """
+    if not request.user.is_admin:
+        raise PermissionDenied(_("You are not authorized to export reports."))
+
+    kind = 'Contract' if request.GET.get('kind', '').lower() == 'contract' else 'Application'
+    property_id = request.GET.get('property') or None
+    month = request.GET.get('month') or None
+    if (property_id and not property_id.isdigit()) or (month and not re.fullmatch(r'\d{4}-\d{2}', month)):
+        return JsonResponse({'error': _('Invalid request.')}, status=400)
+
+    objects = export_queryset(kind, property_id=property_id, month=month, status=request.GET.get('status') or None)
+    response = StreamingHttpResponse(zip_reports(export_reports(kind, objects)), content_type='application/zip')
+    filename = '-'.join(part for part in [kind.lower(), 'reports', property_id and f'property{property_id}', month] if part)
+    response['Content-Disposition'] = f'attachment; filename="{filename}.zip"'
+    return response
+
+@login_required
+def reportJobStatus(request, id):
+    """
+    Poll target for ?async=1 report downloads: the job's state, and the URL
+    to download the PDF from once it is Done.
+    """
+    job = get_object_or_404(ReportJob, id=id)
+    obj = report_object(job.kind, job.object_id)
+    if obj is None:
+        raise Http404("The report's application or contract no longer exists.")
+    if not can_download_report(request.user, job.kind, obj):
+        raise PermissionDenied("You do not have permission to download this report.")
+
+    data = {'id': job.id, 'state': job.state, 'error': job.error if job.state == 'Failed' else None}
+    if job.state == 'Done':
+        name = 'backend:download_application_report' if job.kind == 'Application' else 'backend:download_contract_report'
+        data['download_url'] = reverse(name, kwargs={'id': obj.id})
+    return JsonResponse(data)
+
 @login_required
 def getNotifications(request):
     # Notifications page: allowed only for House Providers.
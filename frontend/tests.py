@@ -1,3 +1,70 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.urls import include, path, reverse
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template import RequestContext, Template
+from isc.urls import urlpatterns as site_urlpatterns
+from backend.cache import cache_anonymous_page
+from backend.models import *
 
-# Create your tests here.
+@cache_anonymous_page('property')
+def form_page(request):
+    return HttpResponse(Template('<form>{% csrf_token %}</form>').render(RequestContext(request)))
+
+@cache_anonymous_page('property')
+def session_page(request):
+    request.session['seen'] = True
+    return HttpResponse('Welcome')
+
+# isc/urls.py does not mount the public pages; route them for these tests
+urlpatterns = site_urlpatterns + [
+    path('site/', include('frontend.urls')),
+    path('form/', form_page),
+    path('session/', session_page),
+]
+
+@override_settings(ROOT_URLCONF='frontend.tests')
+class PropertyListTests(TestCase):
+    """The public property list's search and filters."""
+
+    def setUp(self):
+        cache.clear()
+        self.named = Property.objects.create(name='Sunny Villa', description='Quiet street', city='Kacyiru', type='Rent')
+        self.described = Property.objects.create(name='Garden House', description='Next to a villa', city='Kacyiru', type='Rent')
+        Property.objects.create(name='City Flat', description='Downtown', city='Kacyiru', type='Rent')
+
+    def test_search_orders_by_rank(self):
+        response = self.client.get(reverse('frontend:getProperties'), {'q': 'villa'})
+        self.assertEqual(list(response.context['properties']), [self.named, self.described])
+
+    def test_filters_match_the_api(self):
+        category = Category.objects.create(name='Apartment')
+        Property.objects.filter(pk=self.named.pk).update(category=category, capacity=2)
+        Property.objects.filter(pk=self.described.pk).update(category=category, capacity=4)
+        # A category id and a bedroom maximum; a malformed price is ignored
+        params = {'category': category.pk, 'capacity': '3', 'price_min': 'cheap'}
+
+        response = self.client.get(reverse('frontend:getProperties'), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['properties']), [self.named])
+        api = self.client.get('/api/properties/', params)
+        self.assertEqual([row['id'] for row in api.data['results']], [self.named.pk])
+
+@override_settings(ROOT_URLCONF='frontend.tests')
+class AnonymousPageCacheTests(TestCase):
+    """Pages whose response sets a cookie are never served to anyone else."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_listing_is_cached(self):
+        url = reverse('frontend:getProperties')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+
+    def test_pages_setting_cookies_are_not_cached(self):
+        for url, cookie in [('/form/', 'csrftoken'), ('/session/', 'sessionid')]:
+            first = self.client.get(url)
+            self.assertIn(cookie, first.cookies)
+            self.client.cookies.clear()
+            self.assertEqual(self.client.get(url)['X-Cache'], 'MISS')
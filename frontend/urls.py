@@ -25,4 +25,4 @@ urlpatterns = [
     path('contracts/', getContracts, name='getContracts'),
     path('contract/<int:contract_id>/', showContract, name='showContract'),
     path('contract/accept/<int:contract_id>/', acceptContract, name='acceptContract'),
-]  + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)+ static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+]  + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
@@ -1,6 +1,13 @@
 from frontend.forms import *
 from backend.forms import *
 from backend.models import *
+from backend.search import search_terms
+from backend.facets import compute_facets
+from backend.filters import filter_properties
+from backend.geo import parse_geo_params
+from backend.similarity import similar_properties
+from backend.cache import LISTING_MODELS, cache_anonymous_page, cache_versions
+from backend.conditional import conditional_properties
 from django.urls import reverse
 from django.contrib import messages
 from django.utils.translation import gettext_lazy as _
@@ -69,6 +76,7 @@ def userRegister(request):
     }
     return render(request, 'frontend/pages/auth/register.html', context)
 
+@cache_anonymous_page('property', 'user')
 def home(request):
     """
     Home view: Display the homepage with the 4 latest properties.
@@ -95,68 +103,41 @@ def about(request):
 def services(request):
     return render(request, 'frontend/pages/services.html')
 
+@cache_anonymous_page(*LISTING_MODELS)
 def getProperties(request):
-    properties = Property.objects.all()
-
-    # --- Filtering ---
-    city = request.GET.get('city')
-    if city:
-        properties = properties.filter(city__iexact=city)
-
-    prop_type = request.GET.get('type')
-    if prop_type:
-        properties = properties.filter(type__iexact=prop_type)
-
-    category = request.GET.get('category')
-    if category:
-        properties = properties.filter(category__iexact=category)
-
-    capacity = request.GET.get('capacity')
-    if capacity:
-        properties = properties.filter(capacity=capacity)
-
-    bathroom = request.GET.get('bathroom')
-    if bathroom:
-        properties = properties.filter(bathroom=bathroom)
-
-    size = request.GET.get('size')
-    if size:
-        properties = properties.filter(size__icontains=size)
-
-    address = request.GET.get('address')
-    if address:
-        properties = properties.filter(address__icontains=address)
-
-    price_min = request.GET.get('price_min')
-    if price_min:
-        properties = properties.filter(price_usd__gte=price_min)
-
-    price_max = request.GET.get('price_max')
-    if price_max:
-        properties = properties.filter(price_usd__lte=price_max)
-
-    # --- Filtering by Multiple Amenities ---
+    properties = filter_properties(Property.objects.all(), request.GET)
+    searching = bool(search_terms(request.GET.get('q')))
     selected_amenities = request.GET.getlist('amenities')
-    if selected_amenities:
-        properties = properties.filter(amenities__id__in=selected_amenities).distinct()
+    geo = parse_geo_params(request.GET)
 
     # --- Sorting ---
     sort = request.GET.get('sort')
     if sort:
         if sort.lower() == 'oldest':
             properties = properties.order_by('created_at')
+        elif sort.lower() == 'rating':
+            properties = properties.order_by_rating()
         elif sort.lower() == 'newest':
             properties = properties.order_by('-created_at')
+        elif sort.lower() == 'distance' and geo:
+            properties = properties.order_by('distance_km', '-created_at')
         else:
             properties = properties.order_by('-created_at')
+    elif searching:
+        properties = properties.order_by('-search_rank', '-created_at')
+    elif geo:
+        properties = properties.order_by('distance_km', '-created_at')
     else:
         properties = properties.order_by('-created_at')
 
     # --- Dynamic Filter Options ---
+    facets = compute_facets(request.GET)
     city_choices = Property.CITY_CHOICES
     property_types = Property.TYPE_CHOICES
-    property_categories = Property.CATEGORY_CHOICES
-    amenities_list = Amenity.objects.all()
+    amenity_counts = {facet['value']: facet['count'] for facet in facets['amenity']}
+    amenities_list = list(Amenity.objects.all())
+    for amenity in amenities_list:
+        amenity.facet_count = amenity_counts.get(amenity.id, 0)
     latest_properties = Property.objects.order_by('-created_at')[:4]
 
     # --- Pagination ---
@@ -179,9 +160,9 @@ def getProperties(request):
         'latest_properties': latest_properties,
         'filter_params': request.GET,
         'properties_count': paginator.count,
+        'facets': facets,
         'city_choices': city_choices,
         'property_types': property_types,
-        'property_categories': property_categories,
         'amenities_list': amenities_list,
         'selected_amenities': selected_amenities,
         'paginator': paginator,
@@ -190,6 +171,15 @@ def getProperties(request):
 
     return render(request, 'frontend/pages/properties/index.html', context)
 
+def anonymous_listing_state(request):
+    # Signed-in pages carry the application status, so only anonymous
+    # visitors get validators; they also cover the "similar" listings.
+    if request.user.is_authenticated or len(messages.get_messages(request)):
+        return None
+    return cache_versions(*LISTING_MODELS, request=request)
+
+@conditional_properties(lambda request, slug: Property.objects.filter(slug=slug), vary=anonymous_listing_state)
+@cache_anonymous_page(*LISTING_MODELS)
 def showProperty(request, slug):
     """
     Property detail view:
@@ -197,7 +187,7 @@ def showProperty(request, slug):
     - Also includes additional data such as review statistics.
     """
     property_obj = get_object_or_404(Property, slug=slug)
-    properties = Property.objects.order_by('-created_at')[:4]
+    properties = similar_properties(property_obj, 4, queryset=Property.objects.select_related('category'))
 
     # Check if the user is authenticated and if they have already applied for this property
     application_status = None
@@ -165,6 +165,22 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 WHITENOISE_AUTOREFRESH = True
 
+# Uploads are named by content hash and deduplicated with reference counts
+# (backend/storage.py); those URLs never change, so they are served with
+# this Cache-Control max-age
+DEFAULT_FILE_STORAGE = 'backend.storage.ContentAddressedStorage'
+MEDIA_IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+# Where `gc_media --quarantine` moves unreferenced media
+MEDIA_QUARANTINE_ROOT = os.path.join(BASE_DIR, 'var', 'media-quarantine')
+
+# Media responses can be handed to the front proxy once access is checked:
+# 'x-accel-redirect' (nginx, with an internal location at
+# MEDIA_ACCEL_REDIRECT_PREFIX aliased to MEDIA_ROOT) or 'x-sendfile'
+# (Apache mod_xsendfile, lighttpd). None streams them from Django.
+MEDIA_OFFLOAD = None
+MEDIA_ACCEL_REDIRECT_PREFIX = '/_media/'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -181,6 +197,99 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Default and maximum `limit` for cursor-paginated API endpoints
+API_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+
+# Lower bounds (USD) of the price facet buckets; the last bucket is open-ended
+PROPERTY_PRICE_BUCKETS = (0, 500, 1000, 2000, 5000)
+
+# Cache for versioned page/API responses, facet counts and index state.
+# The versions themselves are CacheVersion rows, so every process agrees
+# on them whatever the backend. Set CACHE_DIR to share a file-based cache
+# between worker processes; otherwise each keeps its own local-memory
+# cache. MAX_ENTRIES is raised from Django's 300 so that one page of
+# listing URLs does not cull the rest.
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 20000))
+if os.getenv("CACHE_DIR"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.getenv("CACHE_DIR"),
+            "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "isc",
+            "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
+        }
+    }
+
+# Seconds a cached anonymous page or public API response is kept (entries
+# are also dropped as soon as a model they depend on changes)
+RESPONSE_CACHE_ENABLED = True
+RESPONSE_CACHE_TIMEOUT = 600
+
+# Seconds a facet count result stays cached for a given filter set
+FACETS_CACHE_TIMEOUT = 300
+
+# Above this many matches the amenity bitmap filter falls back to a SQL subquery
+AMENITY_INDEX_MAX_IDS = 5000
+
+# Location search: geohash cells used to cover a search box
+GEO_MAX_CELLS = 32
+
+# Map clusters: precomputed geohash levels, minimum on-screen cell width for
+# picking a level from the zoom, and the most clusters returned per viewport
+GEO_CLUSTER_MAX_PRECISION = 8
+GEO_CLUSTER_CELL_PX = 64
+GEO_CLUSTER_MAX_RESULTS = 500
+
+# Uploads to DeferredProcessedImageField are stored raw and resized by the
+# `process_images` worker pool; set IMAGE_PROCESSING_ASYNC = False to
+# process them inside the request instead
+IMAGE_PROCESSING_ASYNC = True
+IMAGE_PROCESSING_PLACEHOLDER = 'frontend/img/processing.svg'
+IMAGE_JOB_WORKERS = 4
+IMAGE_JOB_MAX_ATTEMPTS = 3
+IMAGE_JOB_TIMEOUT = 600
+
+# Responsive renditions (backend/renditions.py) rendered for each processed
+# category, property and gallery image, in WebP and JPEG
+IMAGE_RENDITION_WIDTHS = (360, 720, 1340)
+IMAGE_RENDITION_QUALITY = 80
+
+# Width in pixels of the blurred inline placeholder stored with the
+# renditions and shown while an image loads
+IMAGE_PLACEHOLDER_WIDTH = 16
+
+# Rendered application/contract PDFs (backend/reports.py), named by object
+# and content hash and evicted least recently used first past the size cap.
+# ?async=1 downloads queue a ReportJob for the process_reports workers
+REPORT_CACHE_ROOT = os.path.join(BASE_DIR, 'var', 'reports')
+# With MEDIA_OFFLOAD = 'x-accel-redirect', the nginx internal location
+# aliased to REPORT_CACHE_ROOT
+REPORT_ACCEL_REDIRECT_PREFIX = '/_reports/'
+REPORT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+REPORT_JOB_WORKERS = 2
+REPORT_JOB_MAX_ATTEMPTS = 3
+REPORT_JOB_TIMEOUT = 300
+
+# Seconds before the previous `rollup_analytics` run started from which
+# saved rows count as changed (backend/analytics.py), so rows committed
+# while that run read are not missed
+ROLLUP_WATERMARK_OVERLAP = 300
+
+# Threads processing multi-file gallery uploads when image processing is
+# not deferred (backend/gallery.py); None means the CPU count, up to 4
+IMAGE_INGEST_WORKERS = None
+
+# Memory-mapped feature matrix behind the "similar properties" lists
+SIMILARITY_INDEX_PATH = os.path.join(BASE_DIR, 'var', 'similar_properties.npy')
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
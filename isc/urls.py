@@ -1,11 +1,14 @@
+import re
 from django.contrib import admin
 from django.conf import settings
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf.urls.static import static
+from backend.views import serveMedia
 
 urlpatterns = [
     path('superadmin/', admin.site.urls),
     path('', include('backend.urls')),
     path('user/', include('users.urls')),
     path('api/', include('api.urls')),
-] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT) + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    re_path(r'^%s(?P<path>.+)$' % re.escape(settings.MEDIA_URL.lstrip('/')), serveMedia, name='serveMedia'),
+] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -79,11 +79,9 @@
             siblings.each(function() {
                 const elm = $(this);
                 elm.attr('href', elm.attr('data-href-template').replace('__fk__', value));
-                elm.removeAttr('aria-disabled');
             });
         } else {
             siblings.removeAttr('href');
-            siblings.attr('aria-disabled', true);
         }
     }
 
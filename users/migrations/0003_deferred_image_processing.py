@@ -0,0 +1,34 @@
+# Generated by Django 4.2.21 on 2026-10-18 01:30
+
+import backend.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_rentapplication_applicant_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rentapplication',
+            name='applicant_image_state',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Ready', 'Ready'), ('Failed', 'Failed')], default='Ready', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='rentapplication',
+            name='id_number_image_state',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Ready', 'Ready'), ('Failed', 'Failed')], default='Ready', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='rentapplication',
+            name='applicant_image',
+            field=backend.fields.DeferredProcessedImageField(blank=True, help_text='Upload a recent portrait photo.', null=True, state_field=None, upload_to='applicant_images/'),
+        ),
+        migrations.AlterField(
+            model_name='rentapplication',
+            name='id_number_image',
+            field=backend.fields.DeferredProcessedImageField(blank=True, help_text='Upload a clear photo of your ID.', null=True, state_field=None, upload_to='id_numbers/'),
+        ),
+    ]
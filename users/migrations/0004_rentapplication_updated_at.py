@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-18 03:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_deferred_image_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rentapplication',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
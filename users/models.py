@@ -3,6 +3,7 @@ from django.db import models
 from django.utils import timezone
 from imagekit.models import ProcessedImageField
 from imagekit.processors import ResizeToFill
+from backend.fields import DeferredProcessedImageField, IMAGE_STATE_CHOICES
 
 class RentApplication(models.Model):
     STATUS_CHOICES = (
@@ -32,7 +33,7 @@ class RentApplication(models.Model):
     rental_period_months = models.PositiveIntegerField(null=True, blank=True)
 
     # New fields
-    id_number_image = ProcessedImageField(
+    id_number_image = DeferredProcessedImageField(
         upload_to='id_numbers/',
         processors=[ResizeToFill(800, 600)],
         format='JPEG',
@@ -41,7 +42,8 @@ class RentApplication(models.Model):
         blank=True,
         help_text="Upload a clear photo of your ID."
     )
-    applicant_image = ProcessedImageField(
+    id_number_image_state = models.CharField(max_length=20, choices=IMAGE_STATE_CHOICES, default='Ready')
+    applicant_image = DeferredProcessedImageField(
         upload_to='applicant_images/',
         processors=[ResizeToFill(720, 720)],
         format='JPEG',
@@ -50,6 +52,7 @@ class RentApplication(models.Model):
         blank=True,
         help_text="Upload a recent portrait photo."
     )
+    applicant_image_state = models.CharField(max_length=20, choices=IMAGE_STATE_CHOICES, default='Ready')
     has_children = models.BooleanField(default=False)
     number_of_children = models.PositiveIntegerField(null=True, blank=True)
 
@@ -81,6 +84,7 @@ class RentApplication(models.Model):
     message = models.TextField(null=True, blank=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Pending')
     created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Application by {self.user.name} for {self.property.name}"
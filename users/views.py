@@ -1,8 +1,13 @@
 from users.forms import *
 from backend.models import *
-from django.db.models import Q, IntegerField
-from django.db.models.functions import Cast
+from backend.search import search_terms
+from backend.filters import filter_properties
+from backend.geo import parse_geo_params
+from backend.facets import compute_facets
+from backend.metrics import tenant_metrics
+from django.db.models import Q
 from django.urls import reverse
+from django.utils.http import urlencode
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
 from django.utils.translation import gettext_lazy as _
@@ -15,32 +20,19 @@ def dashboard(request):
     if request.user.role not in ['User'] and not request.user.is_superuser:
         raise PermissionDenied(_("You are not authorized to view the dashboard."))
 
-    user = request.user
-
-    # Application metrics
-    total_apps       = RentApplication.objects.filter(user=user).count()
-    pending_apps     = RentApplication.objects.filter(user=user, status='Pending').count()
-    accepted_apps    = RentApplication.objects.filter(user=user, status='Accepted').count()
-    rejected_apps    = RentApplication.objects.filter(user=user, status='Rejected').count()
-    moved_out_apps   = RentApplication.objects.filter(user=user, status='Moved Out').count()
-
-    # Contract metrics
-    total_contracts  = Contract.objects.filter(tenant=user).count()
-    active_contracts = Contract.objects.filter(tenant=user, status='Active').count()
-    overdue_contracts= Contract.objects.filter(tenant=user, payment_status='Overdue').count()
-
+    metrics = tenant_metrics(request.user)
     context = {
-        'total_apps': total_apps,
-        'pending_apps': pending_apps,
-        'accepted_apps': accepted_apps,
-        'rejected_apps': rejected_apps,
-        'moved_out_apps': moved_out_apps,
-        'total_contracts': total_contracts,
-        'active_contracts': active_contracts,
-        'overdue_contracts': overdue_contracts,
+        'total_apps': metrics.total_applications,
+        'pending_apps': metrics.pending_applications,
+        'accepted_apps': metrics.accepted_applications,
+        'rejected_apps': metrics.rejected_applications,
+        'moved_out_apps': metrics.moved_out_applications,
+        'total_contracts': metrics.total_contracts,
+        'active_contracts': metrics.active_contracts,
+        'overdue_contracts': metrics.overdue_contracts,
         # for Chart.js
-        'status_labels': ['Pending','Accepted','Rejected','Moved Out'],
-        'status_data': [pending_apps, accepted_apps, rejected_apps, moved_out_apps],
+        'status_labels': metrics.status_labels,
+        'status_data': metrics.status_data,
     }
     return render(request, 'backend/pages/users/dashboard.html', context)
 
@@ -62,6 +54,7 @@ def search(request):
     # Handle form submission
     if request.method == 'POST':
         filter_params = {
+            'q': request.POST.get('q', ''),
             'city': request.POST.get('city', ''),
             'type': request.POST.get('type', ''),
             'category': request.POST.get('category', ''),  # now an ID
@@ -78,7 +71,7 @@ def search(request):
             filter_params['amenities'] = amenities
 
         # build querystring
-        qs = '&'.join(f"{k}={v}" for k,v in filter_params.items() if v)
+        qs = urlencode({k: v for k, v in filter_params.items() if v}, doseq=True)
         return redirect(f"{reverse('users:properties')}?{qs}")
 
 @login_required
@@ -89,84 +82,20 @@ def properties(request):
     params = request.GET
     qs = Property.objects.all()
 
-    # City
-    city = params.get('city')
-    if city:
-        qs = qs.filter(city__iexact=city)
-
-    # Property Type
-    prop_type = params.get('type')
-    if prop_type:
-        qs = qs.filter(type__iexact=prop_type)
-
-    # Category by ID
-    cat = params.get('category')
-    if cat:
-        try:
-            qs = qs.filter(category_id=int(cat))
-        except ValueError:
-            pass
-
-    # Bedrooms <=
-    capacity = params.get('capacity')
-    if capacity:
-        try:
-            qs = qs.filter(capacity__lte=int(capacity))
-        except ValueError:
-            pass
-
-    # Bathrooms <=
-    bathroom = params.get('bathroom')
-    if bathroom:
-        try:
-            qs = qs.filter(bathroom__lte=int(bathroom))
-        except ValueError:
-            pass
-
-    # Size (assumes `size` stores a plain number as string)
-    size_val = params.get('size')
-    if size_val:
-        try:
-            max_size = int(size_val)
-            qs = qs.annotate(
-                size_int=Cast('size', IntegerField())
-            ).filter(size_int__lte=max_size)
-        except ValueError:
-            pass
-
-    # Address contains
-    address = params.get('address')
-    if address:
-        qs = qs.filter(address__icontains=address)
-
-    # Price range
-    price_min = params.get('price_min')
-    if price_min:
-        try:
-            qs = qs.filter(price_usd__gte=int(price_min))
-        except ValueError:
-            pass
-
-    price_max = params.get('price_max')
-    if price_max:
-        try:
-            qs = qs.filter(price_usd__lte=int(price_max))
-        except ValueError:
-            pass
-
-    # Amenities ⩽
-    amenities = params.getlist('amenities')
-    if amenities:
-        try:
-            amenity_ids = [int(a) for a in amenities]
-            qs = qs.filter(amenities__id__in=amenity_ids).distinct()
-        except ValueError:
-            pass
+    qs = filter_properties(qs, params)
+    searching = bool(search_terms(params.get('q')))
+    locating = parse_geo_params(params) is not None
 
     # Sorting
     sort = params.get('sort', '').lower()
     if sort == 'oldest':
         qs = qs.order_by('created_at')
+    elif sort == 'rating':
+        qs = qs.order_by_rating()
+    elif searching and not sort:
+        qs = qs.order_by('-search_rank', '-created_at')
+    elif locating and sort in ('', 'distance'):
+        qs = qs.order_by('distance_km', '-created_at')
     else:
         qs = qs.order_by('-created_at')
 
@@ -186,6 +115,7 @@ def properties(request):
     context = {
         'properties': page_obj,
         'filter_params': params,
+        'facets': compute_facets(params),
         'properties_count': paginator.count,
         'paginator': paginator,
         'page_obj': page_obj,